@@ -1,10 +1,15 @@
 """
 Abstract base class for the GraphValidation TestRunners
 """
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Type
 
 from argparse import ArgumentParser
+import asyncio
+from concurrent.futures import Executor
+from copy import deepcopy
+import time
 
+from jsonschema import ValidationError
 from reasoner_validator.versioning import get_latest_version
 from reasoner_validator.biolink import BiolinkValidator
 from reasoner_validator.validator import TRAPIResponseValidator
@@ -13,11 +18,42 @@ from translator_testing_model.datamodel.pydanticmodel import TestAsset, TestCase
 
 from graph_validation_tests.translator.registry import (
     get_the_registry_data,
-    extract_component_test_metadata_from_registry
+    extract_component_test_metadata_from_registry,
+    set_registry_refresh_interval,
+    set_registry_snapshot
 )
 
-from graph_validation_tests.translator.trapi import get_available_components, run_trapi_query
-from graph_validation_tests.utils.asyncio import gather
+from graph_validation_tests.translator.trapi import (
+    get_available_components,
+    get_component_from_infores,
+    get_http_client,
+    resolve_component_endpoint,
+    resolve_component_endpoints,
+    resolve_component_type,
+    run_trapi_query
+)
+from graph_validation_tests.translator.trapi.ars import ARSChildResult, poll_ars_children, submit_ars_query
+from graph_validation_tests.translator.trapi.asyncquery import set_max_callback_size, stop_callback_receiver
+from graph_validation_tests.translator.trapi.preflight import ComponentResolution, preflight_components
+from graph_validation_tests.utils.budget import RunBudget
+from graph_validation_tests.utils.endpoint_stats import ENDPOINT_SELECTION_STRATEGIES, get_endpoint_distribution
+from graph_validation_tests.utils.pipeline import DEFAULT_QUEUE_SIZE, Pipeline, PipelineStage
+from graph_validation_tests.utils.response_store import ResponseStore, new_run_id
+from graph_validation_tests.utils.retry import QueryAttempt, RetryPolicy
+from graph_validation_tests.utils.query_shape import validate_trapi_request
+from graph_validation_tests.utils.validation_cache import (
+    ResponseValidations,
+    ValidationCache,
+    response_fingerprint,
+    validation_key
+)
+from graph_validation_tests.utils.validation_memo import MemoizingValidator
+from graph_validation_tests.utils.validation_pool import (
+    VALIDATOR_SETTINGS,
+    get_validation_executor,
+    shutdown_validation_executor,
+    validate_in_worker
+)
 
 from bmt import Toolkit
 from bmt.toolkit import RELATED_TO
@@ -33,7 +69,77 @@ default_biolink_model_version: str = Toolkit().get_model_version()
 DEFAULT_BIOLINK_PREDICATE = "biolink:related_to"
 
 
-class TestCaseRun(TRAPIResponseValidator):
+class TestCaseContext:
+    """
+    Immutable state shared - as a flyweight - by all the TestCaseRuns of a
+    GraphValidationTest: the translated TestAsset, with the validation messages
+    reported while translating the TestAsset, for the TRAPI and Biolink Model
+    versions requested by the GraphValidationTest.
+    """
+    __slots__ = (
+        "requested_versions",
+        "test_asset",
+        "translation_messages"
+    )
+
+    def __init__(
+            self,
+            requested_versions: Tuple[Optional[str], Optional[str]],
+            test_asset: Dict[str, Any],
+            translation_messages: Optional[MESSAGE_CATALOG] = None
+    ):
+        """
+        :param requested_versions: Tuple[Optional[str], Optional[str]], TRAPI and Biolink Model
+                                   versions requested by the GraphValidationTest
+        :param test_asset: Dict[str, Any], translated TestAsset (not to be modified)
+        :param translation_messages: Optional[MESSAGE_CATALOG], validation messages reported while translating
+                                     the TestAsset, replayed into each TestCaseRun (not to be modified)
+        """
+        self.requested_versions: Tuple[Optional[str], Optional[str]] = requested_versions
+        self.test_asset: Dict[str, Any] = test_asset
+        self.translation_messages: MESSAGE_CATALOG = translation_messages if translation_messages else dict()
+
+
+class TestCasePlan:
+    """
+    Plan of the TestCases derived from a TestAsset: the TestCaseContext and the TRAPI request (or
+    reason for skipping) generated by each TestCase template, which are generated once, then
+    shared by the test runs of all the components tested against the same TestAsset.
+    """
+    __slots__ = ("test_case_context", "trapi_requests")
+
+    def __init__(self):
+        self.test_case_context: Optional[TestCaseContext] = None
+        self.trapi_requests: Dict[Any, Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]]] = dict()
+
+    def set_test_case_context(self, context: TestCaseContext):
+        """
+        :param context: TestCaseContext, (new) validator state shared by the TestCaseRuns, from which
+                        TRAPI requests are generated (hence, previously generated requests are discarded)
+        """
+        self.test_case_context = context
+        self.trapi_requests.clear()
+
+    def generate_trapi_request(
+            self,
+            test,
+            test_asset: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]]:
+        """
+        :param test: TestCase template (see graph_validation_tests.unit_test_templates)
+        :param test_asset: Dict[str, Any], translated TestAsset of the TestCaseContext
+        :return: Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]], (copy of the) outcome of
+                 the TestCase template applied to the TestAsset: TRAPI request, output element and output
+                 node binding (or, if no TRAPI request could be generated, the reason for skipping the TestCase)
+        """
+        if test not in self.trapi_requests:
+            self.trapi_requests[test] = test(test_asset)
+        trapi_request, output_element, output_node_binding = self.trapi_requests[test]
+        # each TestCaseRun gets its own TRAPI request, which may be amended while querying
+        return deepcopy(trapi_request), output_element, output_node_binding
+
+
+class TestCaseRun(MemoizingValidator):
     """
     TestCaseRun is a wrapper for BiolinkValidator, used to aggregate
     validation messages from the GraphValidationTest processing of a specific
@@ -41,11 +147,21 @@ class TestCaseRun(TRAPIResponseValidator):
     based on a TRAPI query against the test_run bound 'target' endpoint. Results
     of a TestCaseRun are stored within the parent BiolinkValidator class.
     """
+    # Class of validator instantiated - for each TRAPI Response validated -
+    # within validation worker processes, to which the
+    # 'validate_trapi_response' method of the TestCaseRun is applied.
+    validator_class: Type[TRAPIResponseValidator] = MemoizingValidator
+
+    # Whether the validation of a TRAPI Response depends on the TestAsset, hence
+    # whether validation messages may only be reused for the same TestAsset
+    validation_uses_test_asset: bool = True
+
     def __init__(
             self,
             test_run,
             test: Optional = None,
             trapi_response: Optional[Dict[str, Any]] = None,
+            component: Optional[str] = None,
             **kwargs):
         """
         Constructor for a TestCaseRun. Either 'test' or 'trapi_response' must generally be provided (i.e. not 'None').
@@ -56,6 +172,8 @@ class TestCaseRun(TRAPIResponseValidator):
                             doesn't itself run the TRAPI query to get a TRAPI Response for validation.
         :param trapi_response: Optional[Dict[str, Any]], pre-run TRAPI Response for validation.
                                May be 'None' if this is a 'test' driven TestCaseRunn(default: None)
+        :param component: Optional[str], component targeted by the TestCase, if not the 'test_run' target
+                          (e.g. an ARA responding to an ARS query; default: None, the 'test_run' target)
         :param kwargs: Dict, optional dictionary of extra named BiolinkValidator
                              parameters which may be applied to the test run.
         """
@@ -65,18 +183,40 @@ class TestCaseRun(TRAPIResponseValidator):
         assert (test is None) ^ (trapi_response is None), \
             "At least one of 'test' or 'trapi_response' must not be None!"
 
-        TRAPIResponseValidator.__init__(
+        default_test: str = test.__name__ if test is not None else test_run.__class__.__name__
+        default_target: str = component if component else test_run.default_target
+
+        # Each TestCaseRun is a validator of its own; the resolution of the requested TRAPI and
+        # Biolink Model versions, and the Biolink Model Toolkit, are cached by the reasoner-validator
+        MemoizingValidator.__init__(
             self,
-            default_test=test.__name__ if test is not None else test_run.__class__.__name__,
-            default_target=test_run.default_target,
+            default_test=default_test,
+            default_target=default_target,
             trapi_version=test_run.trapi_version,
             biolink_version=test_run.biolink_version,
             **kwargs
         )
 
-        # Convert previously GraphValidationTest provided
-        # TestAsset into the internally expected format
-        self.test_asset: Optional[Dict[str, Any]] = self.translate_test_asset()
+        # The TestAsset is translated once, by the first TestCaseRun of the test
+        # run, then shared - with its translation messages - by the others
+        requested_versions: Tuple[Optional[str], Optional[str]] = (test_run.trapi_version, test_run.biolink_version)
+        context: Optional[TestCaseContext] = test_run.test_case_context
+        if context is None or context.requested_versions != requested_versions:
+            # Convert previously GraphValidationTest provided
+            # TestAsset into the internally expected format
+            test_asset: Dict[str, Any] = self.translate_test_asset()
+            translation_messages: MESSAGE_CATALOG = {
+                message_type: coded_messages
+                for message_type, coded_messages in self.messages.get(
+                    self.default_target, dict()
+                ).get(self.default_test, dict()).items() if coded_messages
+            }
+            context = TestCaseContext(requested_versions, test_asset, deepcopy(translation_messages))
+            test_run.test_case_context = context
+        elif context.translation_messages:
+            # the messages of the translation of the TestAsset are reported by every TestCaseRun
+            self.add_messages({self.default_target: {self.default_test: deepcopy(context.translation_messages)}})
+        self.context: TestCaseContext = context
 
         # the 'test' itself should be an executable piece of code
         # that defines how a TestCase is derived from the TestAsset
@@ -85,29 +225,94 @@ class TestCaseRun(TRAPIResponseValidator):
         self.test: Optional = test
 
         self.trapi_request: Optional[Dict[str, Any]] = None
-        self.trapi_response: Optional[Dict[str, Any]] = trapi_response
+
+        # Hash of the TRAPI Response, once moved into the response store of the test run (if any)
+        self.response_hash: Optional[str] = None
+        self._trapi_response: Optional[Dict[str, Any]] = trapi_response
+
+        # Key of the validation of the TRAPI Response in the validation cache of the test run (if any)
+        self._validation_key: Optional[str] = None
+
+        # Record of each attempt at the TRAPI query, including any retries
+        self.query_attempts: List[QueryAttempt] = list()
+
+        # Set when the test case was cut short by its deadline or the run time budget
+        self.timed_out: bool = False
+
+        # TestCaseRuns of the ARAs responding to the TRAPI query, if the TestCase targets the ARS
+        self.child_runs: List[TestCaseRun] = list()
+
+        # ARS trace entries of the ARAs yet to respond to the TRAPI query, indexed by ARS message identifier
+        self.ars_children: Dict[str, Dict] = dict()
+
+    @property
+    def test_asset(self) -> Dict[str, Any]:
+        """
+        :return: Dict[str, Any], TestAsset of the test run, translated into the format expected
+                                 by the reasoner-validator (shared by all TestCaseRuns: not to be modified)
+        """
+        return self.context.test_asset
+
+    @property
+    def trapi_response(self) -> Optional[Dict[str, Any]]:
+        """
+        :return: Optional[Dict[str, Any]], TRAPI Response of the TestCase, loaded back
+                                           from the response store of the test run, if moved there
+        """
+        if self._trapi_response is None and self.response_hash is not None:
+            return self.test_run.response_store.get_blob(self.response_hash)
+        return self._trapi_response
+
+    @trapi_response.setter
+    def trapi_response(self, trapi_response: Optional[Dict[str, Any]]):
+        self._trapi_response = trapi_response
+        self.response_hash = None
+        self._validation_key = None
+
+    def store_trapi_response(self):
+        """
+        Moves the TRAPI Response of the TestCase into the response store of the test
+        run (if any), such that the TestCaseRun no longer holds the raw TRAPI Response.
+        """
+        store: Optional[ResponseStore] = self.test_run.response_store
+        if store is not None and self._trapi_response is not None:
+            self.response_hash = store.put(
+                run_id=self.test_run.run_id,
+                test_case_id=self.get_test_case_id(),
+                component=self.default_target,
+                trapi_response=self._trapi_response
+            )
+            self._trapi_response = None
+
+    def get_test_case_id(self) -> str:
+        # TODO: not sure how robust this is: will the 'id' always be defined?
+        return f"{self.test_run.test_asset.id}-{self.default_test}"
 
     def get_test_asset(self) -> TestAsset:
         return self.test_run.test_asset
 
     def get_component(self) -> str:
-        return self.test_run.default_target
+        return self.default_target
 
     def get_environment(self) -> str:
         return self.test_run.environment
 
-    async def run_test_case_query(self):
+    def prepare_test_case_query(self) -> bool:
         """
-        Method to execute a TRAPI lookup query of a single TestCase
-        using the GraphValidationTest associated TestAsset.
+        Method to generate - then sanity check - the TRAPI lookup
+        query of a single TestCase, using the GraphValidationTest
+        associated TestAsset (the 'request generation' stage of a test run).
 
-        :return: None, results are captured as validation
+        :return: bool, True if the TRAPI query (recorded as 'trapi_request') is ready to be run;
+                       False otherwise, with reasons captured as validation
                        messages within the TestCaseRun parent.
         """
         output_element: Optional[str]
         output_node_binding: Optional[str]
 
-        trapi_request, output_element, output_node_binding = self.test(self.test_asset)
+        # TRAPI requests are generated once per TestCase template, for all the components tested
+        trapi_request, output_element, output_node_binding = \
+            self.test_run.test_case_plan.generate_trapi_request(self.test, self.test_asset)
 
         if not trapi_request:
             # output_element and output_node_binding were
@@ -119,57 +324,339 @@ class TestCaseRun(TRAPIResponseValidator):
                 context=context[1],
                 reason=output_node_binding
             )
+            return False
+
+        # sanity check: verify first that the TRAPI request
+        # is well-formed by the self.test(test_asset)
+        # (validated once per query shape, for all TestAssets)
+        try:
+            validate_trapi_request(trapi_request, self.trapi_version)
+        except ValidationError as ve:
+            if len(ve.message) <= 160:
+                reason = ve.message
+            else:
+                reason = ve.message[0:49] + " "*5 + "... " + " "*5 + ve.message[-100:-1]
+            self.report(
+                code="critical.trapi.validation",
+                identifier=self.trapi_version,
+                component="Query",
+                json_path=ve.json_path,
+                reason=reason
+            )
+
+        # We'll ignore warnings and info messages
+        if self.has_critical() or self.has_errors() or self.has_skipped():
+            return False
+
+        # if no error or skipped test messages are reported, then continue
+        # with the validation, first recording the raw TRAPI query
+        # request (also for later reporting) for the TestCase query run.
+        self.trapi_request = trapi_request
+        return True
+
+    async def fetch_test_case_response(self):
+        """
+        Method to run the previously prepared TRAPI lookup query of a
+        single TestCase (the 'HTTP fetch' stage of a test run).
+
+        :return: None, results are captured as validation
+                       messages within the TestCaseRun parent.
+        """
+        if self.get_component() == 'ars':
+            await self.fetch_ars_test_case_responses()
+            return
+
+        # Make the TRAPI call to the TestCase targeted KP or
+        # ARA resource, using the case-documented input test edge
+        # Capture the raw TRAPI query response for later reporting
+        http_response: Optional[Dict] = await run_trapi_query(
+            trapi_request=self.trapi_request,
+            component=self.get_component(),
+            environment=self.get_environment(),
+            target_trapi_version=self.trapi_version,
+            target_biolink_version=self.biolink_version,
+            retry_policy=self.test_run.retry_policy,
+            attempts=self.query_attempts,
+            hedge_percentile=self.test_run.hedge_percentile,
+            endpoint_selection=self.test_run.endpoint_selection,
+            async_query=self.test_run.async_query,
+            callback_url=self.test_run.callback_url
+        )
+        self.capture_test_case_response(http_response)
+
+    def capture_test_case_response(self, http_response: Optional[Dict]):
+        """
+        Captures the TRAPI Response of a TRAPI query of the TestCase, after sanity checking the HTTP call.
+
+        :param http_response: Optional[Dict], with the HTTP 'status_code' and TRAPI 'response_json' of the query
+        :return: None, results are captured as validation
+                       messages within the TestCaseRun parent.
+        """
+        if not http_response:
+            self.report(code="error.trapi.response.empty")
 
         else:
-            # sanity check: verify first that the TRAPI request
-            # is well-formed by the self.test(test_asset)
-            self.validate(trapi_request, component="Query")
-
-            # We'll ignore warnings and info messages
-            if not (self.has_critical() or self.has_errors() or self.has_skipped()):
-                # if no error or skipped test messages are reported,
-                # then continue with the validation.
-
-                # First, record the raw TRAPI query request for later reporting.
-                self.trapi_request = trapi_request
-
-                # Make the TRAPI call to the TestCase targeted ARS, KP or
-                # ARA resource, using the case-documented input test edge
-                # Capture the raw TRAPI query response for later reporting
-                http_response: Optional[Dict] = await run_trapi_query(
-                    trapi_request=trapi_request,
-                    component=self.get_component(),
-                    environment=self.get_environment(),
-                    target_trapi_version=self.trapi_version,
-                    target_biolink_version=self.biolink_version
+            # Second sanity check: check whether the web service (HTTP) call itself was successful?
+            status_code: int = http_response['status_code']
+            if status_code != 200:
+                self.report("critical.trapi.response.unexpected_http_code", identifier=status_code)
+            else:
+                #############################################################
+                # Looks good so far, so now capture the TRAPI Response JSON #
+                #############################################################
+                self.trapi_response: Optional[Dict] = http_response['response_json']
+
+    async def fetch_ars_test_case_responses(self):
+        """
+        Method to run the previously prepared TRAPI lookup query of a single TestCase
+        against the ARS: the query is submitted once, then the TRAPI Responses of all
+        the ARAs are polled concurrently. Each ARA's TRAPI Response is captured by a
+        child TestCaseRun targeting the ARA, to be validated in the validation stage.
+
+        :return: None, results are captured as validation messages within the TestCaseRun
+                       parent (for the ARS submission) and its child TestCaseRuns (for the ARAs).
+        """
+        ars_url: Optional[str] = await resolve_component_endpoint(
+            component='ars',
+            environment=self.get_environment(),
+            target_trapi_version=self.trapi_version,
+            target_biolink_version=self.biolink_version
+        )
+        if not ars_url:
+            self.report(code="error.trapi.response.empty")
+            return
+
+        submission: Dict = await submit_ars_query(get_http_client(), ars_url, self.trapi_request)
+        if submission['status_code'] != 200:
+            self.report("critical.trapi.response.unexpected_http_code", identifier=submission['status_code'])
+            return
+
+        logger.info(f"Test case '{self.default_test}' submitted to the ARS as PK '{submission['pk']}'")
+
+        children: AsyncIterator[ARSChildResult] = \
+            poll_ars_children(ars_url, submission['pk'], pending_children=self.ars_children)
+        try:
+            child: ARSChildResult
+            async for child in children:
+                child_run: TestCaseRun = self.create_child_run(child.infores, child.agent)
+                child_run.capture_test_case_response(
+                    {'status_code': child.status_code, 'response_json': child.trapi_response}
                 )
+                self.child_runs.append(child_run)
+        finally:
+            await children.aclose()
+
+    def create_child_run(self, infores: Optional[str], agent: str) -> "TestCaseRun":
+        """
+        :param infores: Optional[str], InfoRes CURIE of an ARA responding to the ARS query of the TestCase
+        :param agent: str, ARS actor name of the ARA
+        :return: TestCaseRun, child TestCaseRun targeting the ARA
+        """
+        child_run: TestCaseRun = self.test_run.test_case_wrapper(
+            test=self.test,
+            component=get_component_from_infores(infores) or agent
+        )
+        child_run.trapi_request = self.trapi_request
+        return child_run
 
-                if not http_response:
-                    self.report(code="error.trapi.response.empty")
+    def report_timeout(self, stage: str):
+        """
+        Reports the TestCase as skipped, for having run out of time.
 
-                else:
-                    # Second sanity check: check whether the web service (HTTP) call itself was successful?
-                    status_code: int = http_response['status_code']
-                    if status_code != 200:
-                        self.report("critical.trapi.response.unexpected_http_code", identifier=status_code)
-                    else:
-                        #############################################################
-                        # Looks good so far, so now capture the TRAPI Response JSON #
-                        #############################################################
-                        self.trapi_response: Optional[Dict] = http_response['response_json']
-
-    def validate_test_case(self) -> Dict:
+        :param stage: str, stage of processing of the TestCase which ran out of time
+        """
+        self.timed_out = True
+        self.report(
+            code="skipped.test",
+            identifier=self.default_test,
+            context=self.default_target,
+            reason=f"timed out during {stage}"
+        )
+        # ARAs which had yet to respond to the ARS query are also reported as timed out
+        for child in self.ars_children.values():
+            actor: Dict = child.get("actor") or dict()
+            child_run: TestCaseRun = \
+                self.create_child_run(actor.get("inforesid"), actor.get("agent") or child["message"])
+            child_run.report_timeout(stage)
+            self.child_runs.append(child_run)
+        self.ars_children.clear()
+
+    async def run_test_case_query(self):
+        """
+        Method to execute a TRAPI lookup query of a single TestCase
+        using the GraphValidationTest associated TestAsset.
+
+        :return: None, results are captured as validation
+                       messages within the TestCaseRun parent.
+        """
+        if self.prepare_test_case_query():
+            await self.fetch_test_case_response()
+
+    @staticmethod
+    def validate_trapi_response(
+            validator: TRAPIResponseValidator,
+            test_asset: Optional[Dict[str, Any]],
+            trapi_response: Optional[Dict[str, Any]]
+    ):
+        """
+        Validates a TRAPI response JSON result resulting from a provided
+        TestAsset, against the output validation criteria of a given
+        type of GraphValidationTest. Validation messages are reported
+        into the given validator, which is either the TestCaseRun itself or
+        a validator constructed in a validation worker process (see 'validator_class').
+
+        :param validator: TRAPIResponseValidator, validator into which validation messages are reported.
+        :param test_asset: Optional[Dict[str, Any]], translated TestAsset of the test case
+        :param trapi_response: Optional[Dict[str, Any]], TRAPI Response to be validated
+        """
+        raise NotImplementedError("Implement me within a suitable test-type specific subclass of TestCaseRun!")
+
+    def validate_test_case(self):
         """
         Validates a previously run TRAPI response JSON result
         resulting from a provided TestAsset, against the output
-        validation criteria of the given StandardsValidationTest.
+        validation criteria of the given GraphValidationTest.
 
         The 'test_asset' and 'trapi_response' values are expected
         to be pre-recorded as TestCaseRun instance attributes.
 
-        :return: Dict, a dictionary containing the Translator Test results
+        :return: None, results are captured as validation
+                       messages within the TestCaseRun parent.
         """
-        raise NotImplementedError("Implement me within a suitable test-type specific subclass of TestCaseRun!")
+        if self.load_run_validation() or self.load_cached_validation():
+            return
+
+        # the messages of the validation are
+        # captured apart, to be cached by themselves
+        messages: MESSAGES_BY_TARGET = self.messages
+        self.messages = dict()
+        try:
+            self.validate_trapi_response(self, self.test_asset, self.trapi_response)
+            self.save_cached_validation(self.messages)
+            self.save_run_validation(self.messages)
+        finally:
+            validation_messages: MESSAGES_BY_TARGET = self.messages
+            self.messages = messages
+            self.add_messages(validation_messages)
+
+    def get_validation_key(self) -> str:
+        """
+        :return: str, key of the validation of the TRAPI Response of the TestCase in the ValidationCache
+        """
+        if self._validation_key is None:
+            self._validation_key = validation_key(
+                fingerprint=response_fingerprint(self.trapi_response),
+                validation=f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+                trapi_version=self.trapi_version,
+                biolink_version=self.biolink_version,
+                settings={name: getattr(self, name) for name in VALIDATOR_SETTINGS},
+                test_asset=self.test_asset if self.validation_uses_test_asset else None
+            )
+        return self._validation_key
+
+    def load_cached_validation(self) -> bool:
+        """
+        Reuses the cached validation messages of an identical TRAPI Response, if any.
+
+        :return: bool, True if cached validation messages were reused (i.e. no validation is needed)
+        """
+        cache: Optional[ValidationCache] = self.test_run.validation_cache
+        if cache is None or not self.trapi_response:
+            return False
+        cached_messages: Optional[MESSAGE_CATALOG] = cache.get(self.get_validation_key())
+        if cached_messages is None:
+            return False
+        self.test_run.response_validations.put(self.get_validation_key(), cached_messages)
+        self.add_messages({self.default_target: {self.default_test: cached_messages}})
+        return True
+
+    def save_cached_validation(self, messages: MESSAGES_BY_TARGET):
+        """
+        :param messages: MESSAGES_BY_TARGET, messages of the validation of the TRAPI Response, to be cached
+        """
+        cache: Optional[ValidationCache] = self.test_run.validation_cache
+        if cache is not None and self.trapi_response:
+            cache.put(
+                self.get_validation_key(),
+                messages.get(self.default_target, dict()).get(self.default_test, dict())
+            )
+
+    def load_run_validation(self) -> bool:
+        """
+        Reuses the validation messages of an identical TRAPI Response, validated earlier in the same
+        run of tests (e.g. for another TestCase template or component), cloned under the test name
+        and target of this TestCase.
+
+        :return: bool, True if validation messages were reused (i.e. no validation is needed)
+        """
+        if not self.trapi_response:
+            return False
+        messages: Optional[MESSAGE_CATALOG] = self.test_run.response_validations.get(self.get_validation_key())
+        if messages is None:
+            return False
+        self.add_messages({self.default_target: {self.default_test: messages}})
+        return True
+
+    def save_run_validation(self, messages: MESSAGES_BY_TARGET):
+        """
+        :param messages: MESSAGES_BY_TARGET, messages of the validation of the TRAPI Response,
+                         to be reused for identical TRAPI Responses within the run of tests
+        """
+        if self.trapi_response:
+            self.test_run.response_validations.put(
+                self.get_validation_key(),
+                messages.get(self.default_target, dict()).get(self.default_test, dict())
+            )
+
+    async def validate_test_case_in_executor(self, executor: Executor):
+        """
+        Same as validate_test_case(), but with the validation offloaded to a
+        (process pool) executor, with the resulting messages merged back into
+        the TestCaseRun, such that the event loop remains free for other test cases.
+
+        :param executor: Executor, (process pool) executor running the validation
+        :return: None, results are captured as validation
+                       messages within the TestCaseRun parent.
+        """
+        # fingerprinting a large TRAPI Response would otherwise stall the event loop
+        await asyncio.to_thread(self.get_validation_key)
+
+        if self.load_run_validation():
+            return
+
+        # an identical TRAPI Response may already be under validation, for another test case
+        validations: ResponseValidations = self.test_run.response_validations
+        pending: Optional[asyncio.Future] = validations.claim(self.get_validation_key())
+        if pending is not None:
+            await pending
+            if self.load_run_validation():
+                return
+        try:
+            if self.load_cached_validation():
+                return
+            edge_cache: Optional[ValidationCache] = self.test_run.edge_validation_cache
+            loop = asyncio.get_running_loop()
+            messages, (hits, misses) = await loop.run_in_executor(
+                executor,
+                validate_in_worker,
+                self.__class__,
+                self.default_test,
+                self.default_target,
+                self.trapi_version,
+                self.biolink_version,
+                self.test_asset,
+                self.trapi_response,
+                {name: getattr(self, name) for name in VALIDATOR_SETTINGS},
+                edge_cache.path if edge_cache is not None else None
+            )
+            if edge_cache is not None:
+                edge_cache.count_lookups(hits, misses)
+            self.save_cached_validation(messages)
+            self.save_run_validation(messages)
+            self.add_messages(messages)
+        finally:
+            if pending is None:
+                validations.release(self.get_validation_key())
 
     async def run_test_case(self):
         """
@@ -184,7 +671,35 @@ class TestCaseRun(TRAPIResponseValidator):
         #########################################################
         # Looks good so far, so now validate the TRAPI response #
         #########################################################
-        self.validate_test_case()
+        await self.validate_test_case_response()
+
+    async def validate_test_case_response(self):
+        """
+        Validates the TRAPI response of the TestCase (the 'validation' stage
+        of a test run), within a validation worker process if available.
+
+        :return: None, results are captured as validation
+                       messages within the TestCaseRun parent.
+        """
+        if self.get_component() == 'ars':
+            # the TRAPI Responses of the ARAs are validated by their child TestCaseRuns
+            await asyncio.gather(
+                *[
+                    child_run.validate_test_case_response()
+                    for child_run in self.child_runs
+                    if not child_run.timed_out and child_run.trapi_response is not None
+                ]
+            )
+            return
+        executor: Optional[Executor] = self.test_run.get_validation_executor()
+        if executor is not None and self.trapi_response:
+            await self.validate_test_case_in_executor(executor)
+        else:
+            # nothing much to validate or no executor, so just do it here
+            self.validate_test_case()
+        if self.test_run.response_store is not None:
+            # hashing, compressing and writing large TRAPI Responses would otherwise stall the event loop
+            await asyncio.to_thread(self.store_trapi_response)
 
     def get_predicate_id(self, predicate_name: Optional[str], edge_id: str) -> str:
         """
@@ -300,6 +815,30 @@ class GraphValidationTest(BiolinkValidator):
     # generating unique test identifiers
     _id: int = 0
 
+    # Default number of concurrent workers of each stage of the
+    # test case processing pipeline (see run_test_cases()). The
+    # 'validate' stage defaults to the number of 'validation_workers'.
+    # The number of TRAPI queries in flight to any given endpoint is
+    # further adaptively limited, see graph_validation_tests.translator.trapi
+    DEFAULT_STAGE_WORKERS: Dict[str, int] = {
+        "generate": 1,
+        "fetch": 32,
+        "validate": 1,
+        "sink": 1
+    }
+
+    # Default time (seconds) allowed for querying a test case, by type of
+    # component (as given by its Translator SmartAPI Registry entry)
+    DEFAULT_TEST_CASE_TIMEOUTS: Dict[str, float] = {
+        "KP": 600.0,
+        "ARA": 1800.0,
+        "ARS": 1800.0
+    }
+
+    # Default time (seconds) allowed for querying a test case of a
+    # component whose type could not be resolved from the Registry
+    DEFAULT_TEST_CASE_TIMEOUT: float = 1800.0
+
     def __init__(
             self,
             test_asset: TestAsset,
@@ -309,6 +848,22 @@ class GraphValidationTest(BiolinkValidator):
             trapi_version: Optional[str] = None,
             biolink_version: Optional[str] = None,
             runner_settings: Optional[List[str]] = None,
+            validation_workers: Optional[int] = None,
+            stage_workers: Optional[Dict[str, int]] = None,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+            retry_policy: Optional[RetryPolicy] = None,
+            hedge_percentile: Optional[float] = None,
+            endpoint_selection: Optional[str] = None,
+            test_case_timeouts: Optional[Dict[str, float]] = None,
+            run_budget: Optional[RunBudget] = None,
+            async_query: bool = False,
+            callback_url: Optional[str] = None,
+            response_store: Optional[ResponseStore] = None,
+            run_id: Optional[str] = None,
+            validation_cache: Optional[ValidationCache] = None,
+            edge_validation_cache: Optional[ValidationCache] = None,
+            response_validations: Optional[ResponseValidations] = None,
+            test_case_plan: Optional[TestCasePlan] = None,
             **kwargs
     ):
         """
@@ -325,6 +880,40 @@ class GraphValidationTest(BiolinkValidator):
         :param trapi_version: Optional[str] = None, target TRAPI version (default: current release)
         :param biolink_version: Optional[str], target Biolink Model version (default: current release)
         :param runner_settings: Optional[List[str]], extra string directives to the Test Runner (default: None)
+        :param validation_workers: Optional[int], if set, the number of worker processes to which TRAPI Response
+                                   validation is offloaded (default: None, validate within the event loop process)
+        :param stage_workers: Optional[Dict[str, int]], number of concurrent workers of the 'generate', 'fetch',
+                              'validate' and/or 'sink' stages of test case processing (default: DEFAULT_STAGE_WORKERS)
+        :param queue_size: int, maximum number of test cases waiting at each stage of test case processing
+        :param retry_policy: Optional[RetryPolicy], policy for retrying TRAPI queries
+                             failing transiently (default: RetryPolicy() defaults)
+        :param hedge_percentile: Optional[float], if set, TRAPI queries to components with redundant servers are
+                                 hedged after this percentile (0..100) of recent query latencies (default: None)
+        :param endpoint_selection: Optional[str], strategy for selecting amongst redundant servers of a component,
+                                   one of 'registry', 'fastest' or 'weighted' (default: 'weighted')
+        :param test_case_timeouts: Optional[Dict[str, float]], time (seconds) allowed for querying a test case,
+                                   indexed by test (i.e. TRAPI generator) name and/or by component type, 'ARS',
+                                   'ARA' or 'KP', overriding any DEFAULT_TEST_CASE_TIMEOUTS
+        :param run_budget: Optional[RunBudget], wall-clock time budget of the test run (default: None, unlimited)
+        :param async_query: bool, if True, TRAPI queries are made asynchronously, to the TRAPI /asyncquery
+                            endpoint, with responses returned to an embedded callback receiver (default: False)
+        :param callback_url: Optional[str], externally visible base url of the callback receiver of
+                             asynchronous queries (default: None, listen on an ephemeral port of 127.0.0.1)
+        :param response_store: Optional[ResponseStore], store into which the TRAPI Responses of test cases are
+                               moved, once validated (default: None, TRAPI Responses are held by the TestCaseRuns)
+        :param run_id: Optional[str], identifier of the run of tests, indexing TRAPI Responses in the response
+                       store (default: None, a UTC timestamp of the creation of the GraphValidationTest,
+                       suffixed by a random identifier)
+        :param validation_cache: Optional[ValidationCache], cache of the validation messages of TRAPI Responses,
+                                 reused for identical TRAPI Responses (default: None, always validate)
+        :param edge_validation_cache: Optional[ValidationCache], cache of the validation messages of knowledge graph
+                                      edges, such that only new or changed edges are validated, by test runners
+                                      validating edges incrementally (default: None, validate all edges)
+        :param response_validations: Optional[ResponseValidations], validation messages of the TRAPI Responses
+                                     of the run of tests, reused for identical TRAPI Responses, possibly shared
+                                     with other test runs (default: None, only shared by the test cases of this run)
+        :param test_case_plan: Optional[TestCasePlan], plan of the TestCases derived from the TestAsset, possibly
+                               shared with the test runs of other components (default: None, not shared)
         :param kwargs: named arguments to pass on to BiolinkValidator parent class (if and as applicable)
         """
         if not component:
@@ -342,25 +931,118 @@ class GraphValidationTest(BiolinkValidator):
         self.environment: str = environment
         self.test_asset: TestAsset = test_asset
 
+        # other components resolving to the same endpoints as the target component, hence
+        # not queried themselves, but to which the results of the test run are also attributed
+        self.component_aliases: List[str] = list()
+
+        # endpoints of the target component, if resolved by a pre-flight stage (see run_tests())
+        self.component_resolution: Optional[ComponentResolution] = None
+        # validator state and TRAPI requests shared by the TestCaseRuns of
+        # the test run - and possibly of other test runs of the same TestAsset
+        self.test_case_plan: TestCasePlan = test_case_plan if test_case_plan is not None else TestCasePlan()
+
         # trapi_generators should usually not be empty, but just in case...
         self.trapi_generators: Tuple = trapi_generators or ()
 
         self.runner_settings: Optional[List[str]] = runner_settings
 
+        self.validation_workers: Optional[int] = validation_workers
+
+        self.stage_workers: Dict[str, int] = self.DEFAULT_STAGE_WORKERS.copy()
+        if validation_workers:
+            self.stage_workers["validate"] = validation_workers
+        if stage_workers:
+            self.stage_workers.update(stage_workers)
+        self.queue_size: int = queue_size
+        self.pipeline: Optional[Pipeline] = None
+
+        self.retry_policy: RetryPolicy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.hedge_percentile: Optional[float] = hedge_percentile
+        self.endpoint_selection: Optional[str] = endpoint_selection
+
+        self.test_case_timeouts: Dict[str, float] = self.DEFAULT_TEST_CASE_TIMEOUTS.copy()
+        if test_case_timeouts:
+            self.test_case_timeouts.update(test_case_timeouts)
+        self.run_budget: RunBudget = run_budget if run_budget is not None else RunBudget()
+
+        self.async_query: bool = async_query
+        self.callback_url: Optional[str] = callback_url
+
+        self.response_store: Optional[ResponseStore] = response_store
+        self.run_id: str = run_id if run_id else new_run_id()
+
+        self.validation_cache: Optional[ValidationCache] = validation_cache
+        self.edge_validation_cache: Optional[ValidationCache] = edge_validation_cache
+        self.response_validations: ResponseValidations = \
+            response_validations if response_validations is not None else ResponseValidations()
+
         self.results: Dict = dict()
 
+    @property
+    def test_case_context(self) -> Optional[TestCaseContext]:
+        """
+        :return: Optional[TestCaseContext], validator state shared by the TestCaseRuns
+                                            (set by the first TestCaseRun of the test run)
+        """
+        return self.test_case_plan.test_case_context
+
+    @test_case_context.setter
+    def test_case_context(self, context: TestCaseContext):
+        self.test_case_plan.set_test_case_context(context)
+
     def get_run_id(self):
         # First implementation of 'run identifier' is
         # is to return the default target endpoint?
         # TODO: likely need a more appropriate run identifier here, e.g. ARS PK-like?
         return self.default_target
 
+    async def get_endpoint_key(self) -> Optional[Tuple[Tuple[str, ...], str]]:
+        """
+        :return: Optional[Tuple[Tuple[str, ...], str]], the (sorted) endpoints to which the target component
+                 resolves, with the target TRAPI version; None if the component could not be resolved
+        """
+        endpoints: Tuple[str, ...]
+        if self.component_resolution is not None:
+            endpoints = self.component_resolution.endpoints
+        else:
+            endpoints = await resolve_component_endpoints(
+                component=self.default_target,
+                environment=self.environment,
+                target_trapi_version=self.trapi_version,
+                target_biolink_version=self.biolink_version
+            )
+        return (tuple(sorted(endpoints)), self.trapi_version) if endpoints else None
+
     def get_trapi_generators(self) -> Tuple:
         return self.trapi_generators
 
     def get_runner_settings(self) -> List[str]:
         return self.runner_settings.copy()
 
+    async def get_test_case_timeout(self, test_name: str) -> Optional[float]:
+        """
+        :param test_name: str, name of the test (i.e. TRAPI generator) of a test case
+        :return: Optional[float], time (seconds) allowed for querying the test case, given (in order of
+                                  precedence) by the test name, by the type of component being tested or
+                                  else by DEFAULT_TEST_CASE_TIMEOUT, capped by the time remaining in the
+                                  run budget; None if unlimited
+        """
+        timeout: Optional[float] = self.test_case_timeouts.get(test_name)
+        if timeout is None:
+            component_type: Optional[str] = await resolve_component_type(self.default_target)
+            timeout = self.test_case_timeouts.get(component_type, self.DEFAULT_TEST_CASE_TIMEOUT) \
+                if component_type else self.DEFAULT_TEST_CASE_TIMEOUT
+        return self.run_budget.get_timeout(timeout)
+
+    def get_validation_executor(self) -> Optional[Executor]:
+        """
+        :return: Optional[Executor], process pool to which TRAPI Response validation
+                                     is offloaded; None if validation is done in-process.
+        """
+        if not self.validation_workers:
+            return None
+        return get_validation_executor(max_workers=self.validation_workers)
+
     @classmethod
     def build_test_asset(
             cls,
@@ -435,9 +1117,82 @@ class GraphValidationTest(BiolinkValidator):
         return self.format_results(test_cases=[test_case_run])
 
     @staticmethod
-    async def run_test_cases(test_cases: List[TestCaseRun]):
-        # TODO: unsure if one needs to limit concurrent requests here...
-        await gather([test_case.run_test_case() for test_case in test_cases])  # , limit=num_concurrent_requests)
+    async def generate_stage(test_case: TestCaseRun) -> TestCaseRun:
+        if test_case.test_run.run_budget.is_exhausted():
+            # no new test cases are started once out of time
+            test_case.report_timeout("scheduling")
+        else:
+            test_case.prepare_test_case_query()
+        return test_case
+
+    @staticmethod
+    async def fetch_stage(test_case: TestCaseRun) -> TestCaseRun:
+        if test_case.trapi_request is not None and not test_case.timed_out:
+            timeout: Optional[float] = await test_case.test_run.get_test_case_timeout(test_case.default_test)
+            if timeout is not None and timeout <= 0.0:
+                test_case.report_timeout("scheduling")
+            else:
+                try:
+                    # cancels the query in flight (including any retries) when out of time
+                    await asyncio.wait_for(test_case.fetch_test_case_response(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    test_case.report_timeout("query")
+        return test_case
+
+    @staticmethod
+    async def validate_stage(test_case: TestCaseRun) -> TestCaseRun:
+        if test_case.test_run.run_budget.is_exhausted():
+            if not test_case.timed_out:
+                test_case.report_timeout("validation")
+        elif not test_case.timed_out or test_case.child_runs:
+            # the TRAPI Responses of any ARAs having responded before an ARS query timed out are still validated
+            await test_case.validate_test_case_response()
+        return test_case
+
+    @staticmethod
+    async def sink_stage(test_case: TestCaseRun) -> TestCaseRun:
+        logger.debug(f"Completed test case '{test_case.default_test}' against '{test_case.default_target}'")
+        return test_case
+
+    def build_pipeline(self) -> Pipeline:
+        """
+        :return: Pipeline, of 'request generation' -> 'HTTP fetch' -> 'validation' -> 'result sink'
+                           stages for processing the TestCaseRuns, connected by bounded queues.
+        """
+        return Pipeline(
+            stages=[
+                PipelineStage("generate", self.generate_stage, self.stage_workers["generate"]),
+                PipelineStage("fetch", self.fetch_stage, self.stage_workers["fetch"]),
+                PipelineStage("validate", self.validate_stage, self.stage_workers["validate"]),
+                PipelineStage("sink", self.sink_stage, self.stage_workers["sink"])
+            ],
+            queue_size=self.queue_size
+        )
+
+    def get_queue_depths(self) -> Dict[str, int]:
+        """
+        :return: Dict[str, int], current number of test cases waiting at each
+                                 stage of the test case processing pipeline.
+        """
+        return self.pipeline.get_queue_depths() if self.pipeline is not None else dict()
+
+    def get_max_queue_depths(self) -> Dict[str, int]:
+        """
+        :return: Dict[str, int], largest number of test cases seen waiting at each
+                                 stage of the test case processing pipeline (for tuning).
+        """
+        return self.pipeline.get_max_queue_depths() if self.pipeline is not None else dict()
+
+    async def run_test_cases(self, test_cases: List[TestCaseRun]):
+        """
+        Runs TestCaseRuns through the test case processing pipeline. When the validation of TRAPI
+        Responses falls behind, the fetching of TRAPI Responses is throttled by the bounded queues.
+
+        :param test_cases: List[TestCaseRun], test cases to be run
+        :return: None, results are captured as validation messages within the TestCaseRuns.
+        """
+        self.pipeline = self.build_pipeline()
+        await self.pipeline.run(test_cases)
 
     MESSAGE_PRECEDENCE = ("critical", "error", "warning", "skipped", "info")
     FAILURE_MODES = ("error", "critical")
@@ -468,12 +1223,13 @@ class GraphValidationTest(BiolinkValidator):
                         non_empty_messages[mtype] = message_catalog[mtype]
                 # TODO: this first iteration in which FAILURE_MODES are
                 #       immutable (not sensitive to TestRunner parameters);
-                #       Maybe we need to treat "SKIPPED" tests differently here(?)
-                if not non_empty_messages or \
-                        not any([mtype in non_empty_messages for mtype in self.FAILURE_MODES]):
-                    return target, TestCaseResultEnum.PASSED, non_empty_messages
-                else:
+                if any([mtype in non_empty_messages for mtype in self.FAILURE_MODES]):
                     return target, TestCaseResultEnum.FAILED, non_empty_messages
+                elif tcr.timed_out:
+                    # test case was not (completely) run, for having run out of time
+                    return target, TestCaseResultEnum.SKIPPED, non_empty_messages
+                else:
+                    return target, TestCaseResultEnum.PASSED, non_empty_messages
         # TODO: seems sensible to assumed that if the target or test are
         #       missing in test results, then the test was skipped?
         return target, TestCaseResultEnum.SKIPPED, {}
@@ -571,11 +1327,9 @@ class GraphValidationTest(BiolinkValidator):
         # where the status of the test is determined by the aforementioned stringency rules, however coded.
         #
         results: Dict = dict()
-        for tcr in test_cases:
-            # TODO: not sure how robust this is: will the 'id' always be defined?
-            test_asset_id: str = tcr.test_run.test_asset.id
-            test_name: str = tcr.default_test
-            test_case_id: str = f"{test_asset_id}-{test_name}"
+        # the TestCaseRuns of any ARAs responding to ARS queries are reported alongside the ARS itself
+        for tcr in [run for test_case in test_cases for run in [test_case] + test_case.child_runs]:
+            test_case_id: str = tcr.get_test_case_id()
             if test_case_id not in results:
                 results[test_case_id] = dict()
             component: str
@@ -589,6 +1343,10 @@ class GraphValidationTest(BiolinkValidator):
                 "status": status,
                 "messages": messages
             }
+            if component == self.default_target:
+                # ... and the same results, for the components resolving to the same endpoints
+                for alias in self.component_aliases:
+                    results[test_case_id][alias] = deepcopy(results[test_case_id][component])
 
         return results
 
@@ -612,6 +1370,12 @@ class GraphValidationTest(BiolinkValidator):
             for test in self.get_trapi_generators()
         ]
 
+        if self.component_resolution is not None and not self.component_resolution.endpoints:
+            # fail fast: no TRAPI query can be run against an unresolvable component
+            for test_case in test_cases:
+                test_case.report(code="error.trapi.response.empty")
+            return self.format_results(test_cases)
+
         await self.run_test_cases(test_cases)
 
         # ... then, return the results
@@ -632,6 +1396,23 @@ class GraphValidationTest(BiolinkValidator):
             trapi_version: Optional[str] = None,
             biolink_version: Optional[str] = None,
             runner_settings: Optional[List[str]] = None,
+            validation_workers: Optional[int] = None,
+            stage_workers: Optional[Dict[str, int]] = None,
+            queue_size: int = DEFAULT_QUEUE_SIZE,
+            max_query_attempts: Optional[int] = None,
+            hedge_percentile: Optional[float] = None,
+            endpoint_selection: Optional[str] = None,
+            test_case_timeouts: Optional[Dict[str, float]] = None,
+            time_budget: Optional[float] = None,
+            async_query: bool = False,
+            callback_url: Optional[str] = None,
+            max_callback_size: Optional[int] = None,
+            response_store: Optional[str] = None,
+            run_id: Optional[str] = None,
+            validation_cache: Optional[str] = None,
+            edge_validation_cache: Optional[str] = None,
+            registry_snapshot: Optional[str] = None,
+            registry_refresh_interval: Optional[float] = None,
             **kwargs
     ) -> Dict[str, Dict]:
         """
@@ -666,18 +1447,62 @@ class GraphValidationTest(BiolinkValidator):
         :param trapi_version: Optional[str] = None, target TRAPI version (default: latest public release)
         :param biolink_version: Optional[str] = None, target Biolink Model version (default: Biolink toolkit release)
         :param runner_settings: Optional[List[str]] = None, extra string parameters to the Test Runner
+        :param validation_workers: Optional[int] = None, number of worker processes to which TRAPI Response
+                                   validation is offloaded (default: None, validate within the event loop process)
+        :param stage_workers: Optional[Dict[str, int]] = None, number of concurrent workers of the 'generate',
+                              'fetch', 'validate' and/or 'sink' stages of test case processing
+        :param queue_size: int, maximum number of test cases waiting at each stage of test case processing
+        :param max_query_attempts: Optional[int] = None, maximum number of attempts at each TRAPI query
+                                   failing transiently (default: None, use the RetryPolicy default)
+        :param hedge_percentile: Optional[float] = None, if set, TRAPI queries to components with redundant
+                                 servers are hedged after this percentile (0..100) of recent query latencies
+        :param endpoint_selection: Optional[str] = None, strategy for selecting amongst redundant servers
+                                   of a component, one of 'registry', 'fastest' or 'weighted' (default: 'weighted')
+        :param test_case_timeouts: Optional[Dict[str, float]] = None, time (seconds) allowed for querying a test
+                                   case, indexed by test name and/or by component type, 'ARS', 'ARA' or 'KP'
+        :param time_budget: Optional[float] = None, wall-clock time budget (seconds) of the whole run of tests;
+                            once exhausted, unfinished test cases are reported as skipped (default: unlimited)
+        :param async_query: bool = False, if True, TRAPI queries are made asynchronously, to the TRAPI /asyncquery
+                            endpoint, with responses returned to an embedded callback receiver
+        :param callback_url: Optional[str] = None, externally visible base url of the callback receiver of
+                             asynchronous queries (default: listen on an ephemeral port of 127.0.0.1)
+        :param max_callback_size: Optional[int] = None, maximum size (bytes) of a TRAPI Response POSTed back to the
+                                  callback receiver of asynchronous queries (default: 256 MiB)
+        :param response_store: Optional[str] = None, directory of a (content-addressed) store into which
+                               TRAPI Responses are moved, once validated (default: responses are not kept)
+        :param run_id: Optional[str] = None, identifier of the run of tests, indexing TRAPI Responses
+                       in the response store (default: a UTC timestamp of the start of the run,
+                       suffixed by a random identifier)
+        :param validation_cache: Optional[str] = None, path to a (persistent) cache of the validation messages
+                                 of TRAPI Responses, reused for identical TRAPI Responses (default: always validate)
+        :param edge_validation_cache: Optional[str] = None, path to a (persistent) cache of the validation messages
+                                      of knowledge graph edges, such that test runners validating edges incrementally
+                                      only validate new or changed edges (default: validate all edges)
+        :param registry_snapshot: Optional[str] = None, path to a compact on-disk snapshot of the Translator SmartAPI
+                                  Registry Data, from which component endpoints are resolved on cold starts, rather
+                                  than from the Registry itself (default: always read the Registry)
+        :param registry_refresh_interval: Optional[float] = None, interval (seconds) after which the Translator
+                                          SmartAPI Registry Data is refreshed in the background, if modified,
+                                          for later endpoint resolutions (default: never refreshed)
         :param kwargs: Dict, optional extra named parameters to passed to TestCase TestRunner.
-        :return: Dict { "pks": Dict[<target>, <pk>], "results": Dict[<test_case_id>, <test_case_results>] }
+        :return: Dict {
+                     "pks": Dict[<target>, <pk>],
+                     "results": Dict[<test_case_id>, <test_case_results>],
+                     "endpoints": Dict[<target>, Dict[<server url>, <selection and latency statistics>]],
+                     "preflight": <total 'elapsed' time of the pre-flight stage, with the resolved 'endpoints'
+                                  and 'resolution_time' of each of the 'components'>,
+                     "run_id": <run_id> (only if a 'response_store' is given),
+                     "validation_cache": <hits, misses and hit_rate of the validation cache>
+                                         (only if a 'validation_cache' is given),
+                     "edge_validation_cache": <hits, misses and hit_rate of the edge validation cache>
+                                              (only if an 'edge_validation_cache' is given),
+                     "response_validations": <hits and misses of the reuse of validations of identical
+                                             TRAPI Responses within the run>
+                 }
         """
         if not components:
             components = ['ars']
 
-        # TODO: (April 2024) short term limitation: can't test ARS endpoints, see the missing ARS code in
-        #       the run_trapi_query() method of the graph_validation_tests.translator.trapi package module.
-        if 'ars' in components:
-            logger.error("Default ARS testing is not yet supported by GraphValidationTests")
-            return dict()
-
         # Load the internal TestAsset being uniformly served
         # to all TestCase runs against specified components.
         test_asset: TestAsset = GraphValidationTest.build_test_asset(
@@ -689,39 +1514,153 @@ class GraphValidationTest(BiolinkValidator):
             object_category
         )
 
-        # A test run - running and reporting independently - is configured
-        # to apply a test derived from the specified TestAsset against each
-        # specified component, within the specified environment. Each test run
-        # generates a distinct test report, which is composed of the result(s)
-        # of one or more independent TestCases derived from the TestAsset,
-        # reflecting on the objective and design of the TestRunner.
-        test_runs: List[cls] = [
-            cls(
-                test_asset=test_asset,
-                component=target,
+        run_budget: RunBudget = RunBudget(time_budget)
+
+        if registry_snapshot:
+            set_registry_snapshot(registry_snapshot)
+        if registry_refresh_interval:
+            set_registry_refresh_interval(registry_refresh_interval)
+        if max_callback_size:
+            set_max_callback_size(max_callback_size)
+
+        store: Optional[ResponseStore] = ResponseStore(response_store) if response_store else None
+        cache: Optional[ValidationCache] = ValidationCache(validation_cache) if validation_cache else None
+        edge_cache: Optional[ValidationCache] = \
+            ValidationCache(edge_validation_cache) if edge_validation_cache else None
+        # identical TRAPI Responses are validated once, across all the components tested
+        response_validations: ResponseValidations = ResponseValidations()
+        # likewise, TRAPI requests are generated once, then fanned out to all the components tested
+        test_case_plan: TestCasePlan = TestCasePlan()
+        if not run_id:
+            run_id = new_run_id()
+
+        try:
+            retry_policy: RetryPolicy = \
+                RetryPolicy(max_attempts=max_query_attempts) if max_query_attempts else RetryPolicy()
+
+            # A test run - running and reporting independently - is configured
+            # to apply a test derived from the specified TestAsset against each
+            # specified component, within the specified environment. Each test run
+            # generates a distinct test report, which is composed of the result(s)
+            # of one or more independent TestCases derived from the TestAsset,
+            # reflecting on the objective and design of the TestRunner.
+            candidate_test_runs: List[cls] = [
+                cls(
+                    test_asset=test_asset,
+                    component=target,
+                    environment=environment,
+                    trapi_generators=trapi_generators,
+                    trapi_version=trapi_version,
+                    biolink_version=biolink_version,
+                    runner_settings=runner_settings,
+                    validation_workers=validation_workers,
+                    stage_workers=stage_workers,
+                    queue_size=queue_size,
+                    retry_policy=retry_policy,
+                    hedge_percentile=hedge_percentile,
+                    endpoint_selection=endpoint_selection,
+                    test_case_timeouts=test_case_timeouts,
+                    run_budget=run_budget,
+                    async_query=async_query,
+                    callback_url=callback_url,
+                    response_store=store,
+                    run_id=run_id,
+                    validation_cache=cache,
+                    edge_validation_cache=edge_cache,
+                    response_validations=response_validations,
+                    test_case_plan=test_case_plan
+                ) for target in dict.fromkeys(components)
+            ]
+
+            # Pre-flight: the endpoints of all the components are resolved concurrently,
+            # and pooled connections opened to them, before any test case is run
+            preflight_started: float = time.monotonic()
+            resolutions: Dict[str, ComponentResolution] = await preflight_components(
+                components=[tr.default_target for tr in candidate_test_runs],
                 environment=environment,
-                trapi_generators=trapi_generators,
-                trapi_version=trapi_version,
-                biolink_version=biolink_version,
-                runner_settings=runner_settings
-            ) for target in components
-        ]
-        results = {
-            "pks": dict(),
-            "results": dict()
-        }
-        for tr in test_runs:
-            target: str = tr.default_target
-            test_run_id: str = tr.get_run_id()
-            results["pks"].update({target: test_run_id})
-            result: Dict = await tr.process_test_run(**kwargs)
-            for test_case_id, result in result.items():
-                if test_case_id not in results["results"]:
-                    results["results"][test_case_id] = dict()
-
-                results["results"][test_case_id].update(result)
+                target_trapi_version=candidate_test_runs[0].trapi_version,
+                target_biolink_version=candidate_test_runs[0].biolink_version
+            )
+            preflight_time: float = time.monotonic() - preflight_started
+
+            # Components resolving to the same endpoints - for the same TRAPI version - whether
+            # listed twice or under different names, are only queried once, by a single test
+            # run, to whose results all the components resolving to these endpoints are attributed.
+            test_runs: List[cls] = list()
+            endpoint_test_runs: Dict[Tuple[Tuple[str, ...], str], cls] = dict()
+            for test_run in candidate_test_runs:
+                test_run.component_resolution = resolutions.get(test_run.default_target)
+                endpoint_key: Optional[Tuple[Tuple[str, ...], str]] = await test_run.get_endpoint_key()
+                if endpoint_key in endpoint_test_runs:
+                    endpoint_test_runs[endpoint_key].component_aliases.append(test_run.default_target)
+                    continue
+                if endpoint_key is not None:
+                    endpoint_test_runs[endpoint_key] = test_run
+                test_runs.append(test_run)
+
+            results = {
+                "pks": dict(),
+                "results": dict(),
+                "endpoints": dict(),
+                "preflight": {
+                    "elapsed": preflight_time,
+                    "components": {
+                        component: {
+                            "endpoints": list(resolution.endpoints),
+                            "resolution_time": resolution.elapsed
+                        }
+                        for component, resolution in resolutions.items()
+                    }
+                }
+            }
+            for tr in test_runs:
+                target: str = tr.default_target
+                test_run_id: str = tr.get_run_id()
+                results["pks"].update({target: test_run_id})
+                for alias in tr.component_aliases:
+                    results["pks"].update({alias: test_run_id})
+                result: Dict = await tr.process_test_run(**kwargs)
+                for test_case_id, result in result.items():
+                    if test_case_id not in results["results"]:
+                        results["results"][test_case_id] = dict()
+
+                    results["results"][test_case_id].update(result)
+
+                # Report how queries were distributed across the (redundant) servers of the target
+                results["endpoints"][target] = get_endpoint_distribution(
+                    await resolve_component_endpoints(
+                        component=target,
+                        environment=tr.environment,
+                        target_trapi_version=tr.trapi_version,
+                        target_biolink_version=tr.biolink_version
+                    )
+                )
+                for alias in tr.component_aliases:
+                    results["endpoints"][alias] = results["endpoints"][target]
 
-        return results
+            if store is not None:
+                results["run_id"] = run_id
+
+            if cache is not None:
+                results["validation_cache"] = cache.get_statistics()
+
+            results["response_validations"] = response_validations.get_statistics()
+
+            if edge_cache is not None:
+                results["edge_validation_cache"] = edge_cache.get_statistics()
+                logger.info(f"Edge validation cache hit rate: {str(edge_cache.get_hit_rate())}")
+
+            return results
+        finally:
+            if async_query:
+                await stop_callback_receiver()
+            if validation_workers:
+                # the worker processes do not outlive the run of tests
+                await asyncio.to_thread(shutdown_validation_executor)
+            # the stores and caches are closed, whether or not the run of tests completed
+            for resource in (store, cache, edge_cache):
+                if resource is not None:
+                    resource.close()
 
 
 def get_parameters(tool_name: str):
@@ -738,6 +1677,20 @@ def get_parameters(tool_name: str):
     #     --trapi_version '1.5.0'
     #     --biolink_version '4.1.6'
     #     --runner_settings 'inferred'
+    #     --validation_workers 4
+    #     --max_query_attempts 3
+    #     --hedge_percentile 95
+    #     --endpoint_selection 'weighted'
+    #     --time_budget 3600
+    #     --async_query
+    #     --callback_url 'http://my-test-host.ncats.io:8765'
+    #     --max_callback_size 268435456
+    #     --response_store '/data/trapi_responses'
+    #     --run_id 'nightly-2024-05-01'
+    #     --validation_cache '/data/validation_cache.sqlite'
+    #     --edge_validation_cache '/data/edge_validation_cache.sqlite'
+    #     --registry_snapshot '/data/registry_snapshot.json'
+    #     --registry_refresh_interval 3600
 
     parser = ArgumentParser(description=tool_name)
 
@@ -826,6 +1779,124 @@ def get_parameters(tool_name: str):
         default=None
     )
 
+    parser.add_argument(
+        "--validation_workers",
+        type=int,
+        help="Number of worker processes to which TRAPI Response validation is offloaded " +
+             "(Default: if unspecified, TRAPI Responses are validated within the main process)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--max_query_attempts",
+        type=int,
+        help="Maximum number of attempts at a TRAPI query failing with a transient error, " +
+             "e.g. a timeout or an HTTP 429 or 503 status (Default: if unspecified, up to 3 attempts)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--hedge_percentile",
+        type=float,
+        help="Percentile (0..100) of recent TRAPI query latencies of a component server, after which the query " +
+             "is also sent to a redundant server of the component, taking the first answer " +
+             "(Default: if unspecified, queries are not hedged)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--endpoint_selection",
+        type=str,
+        choices=ENDPOINT_SELECTION_STRATEGIES,
+        help="Strategy for selecting amongst the redundant servers of a component: the first healthy server " +
+             "listed in the Registry ('registry'), the healthy server with the lowest latency ('fastest'), or " +
+             "healthy servers in latency weighted round-robin ('weighted') (Default: if unspecified, 'weighted')",
+        default=None
+    )
+
+    parser.add_argument(
+        "--time_budget",
+        type=float,
+        help="Wall-clock time budget (seconds) of the whole run of tests, after which test cases " +
+             "not yet completed are reported as skipped (Default: if unspecified, unlimited)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--async_query",
+        action="store_true",
+        help="Run TRAPI queries asynchronously, via the TRAPI /asyncquery endpoint of components, " +
+             "with TRAPI Responses returned to an embedded callback receiver (Default: synchronous /query)"
+    )
+
+    parser.add_argument(
+        "--callback_url",
+        type=str,
+        help="Base url, visible to the components being tested, of the embedded receiver of asynchronous " +
+             "TRAPI query callbacks, which listens on the url's port " +
+             "(Default: if unspecified, listen on an ephemeral port of 127.0.0.1)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--max_callback_size",
+        type=int,
+        help="Maximum size (bytes) of a TRAPI Response POSTed back to the embedded receiver of asynchronous " +
+             "TRAPI query callbacks, larger TRAPI Responses being rejected (Default: 256 MiB)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--response_store",
+        type=str,
+        help="Directory of a content-addressed store into which TRAPI Responses are saved once validated " +
+             "(Default: if unspecified, TRAPI Responses are not saved)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--run_id",
+        type=str,
+        help="Identifier of the run of tests, under which TRAPI Responses are indexed in the response store " +
+             "(Default: if unspecified, a UTC timestamp of the start of the run, suffixed by a random identifier)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--validation_cache",
+        type=str,
+        help="Path to a persistent cache of the validation messages of TRAPI Responses, reused for " +
+             "TRAPI Responses identical to those previously validated (Default: if unspecified, always validate)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--edge_validation_cache",
+        type=str,
+        help="Path to a persistent cache of the validation messages of knowledge graph edges, such that " +
+             "the standards validation only validates new or changed edges (Default: if unspecified, " +
+             "validate all edges)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--registry_snapshot",
+        type=str,
+        help="Path to a compact on-disk snapshot of the Translator SmartAPI Registry Data, from which " +
+             "component endpoints are resolved on cold starts, then refreshed from the Registry " +
+             "(Default: if unspecified, always read the Registry)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--registry_refresh_interval",
+        type=float,
+        help="Interval (seconds) after which the Translator SmartAPI Registry Data is refreshed " +
+             "in the background, if modified, for later endpoint resolutions " +
+             "(Default: if unspecified, the Registry Data is never refreshed)",
+        default=None
+    )
+
     args = parser.parse_args()
 
     # convert any comma-delimited string of components
@@ -0,0 +1,288 @@
+"""
+Bulk (offline) validation of stored TRAPI Responses, e.g. to revalidate archived
+TRAPI Responses against a new TRAPI or Biolink Model release. Stored responses are
+streamed from a directory or archive to a pool of worker processes, each holding
+a 'warm' GraphValidationTest, and their results streamed to a (JSON lines) sink.
+"""
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple, Type
+from argparse import ArgumentParser
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from importlib import import_module
+import json
+import os
+import sys
+
+from translator_testing_model.datamodel.pydanticmodel import TestAsset
+
+from graph_validation_tests import (
+    GraphValidationTest,
+    DEFAULT_BIOLINK_PREDICATE,
+    default_trapi_release,
+    default_biolink_model_version
+)
+from graph_validation_tests.utils.archive import iter_archived_files, load_archived_response
+from graph_validation_tests.utils.validation_cache import ResponseValidations, ValidationCache
+
+import logging
+logger = logging.getLogger(__name__)
+
+# GraphValidationTest subclasses available for bulk validation from the command line, by name.
+# (Test runners validating TRAPI Responses against a specific TestAsset, like the OneHopTest,
+#  need the TestAsset to be given to the run_bulk_validation() method)
+TEST_RUNNERS: Dict[str, str] = {
+    "standards_validation": "standards_validation_test_runner:StandardsValidationTest"
+}
+
+# Placeholder TestAsset of stored TRAPI Responses not validated against any specific TestAsset
+ARCHIVED_TEST_ASSET: TestAsset = GraphValidationTest.build_test_asset(
+    test_asset_id="ArchivedResponse",
+    subject_id="",
+    subject_category="",
+    predicate_id=DEFAULT_BIOLINK_PREDICATE,
+    object_id="",
+    object_category=""
+)
+
+# Maximum number of validations of identical TRAPI Responses reused by a bulk validation
+# worker process, whose (long-lived) GraphValidationTest would otherwise keep them all
+WORKER_RESPONSE_VALIDATIONS: int = 64
+
+# GraphValidationTest of a bulk validation worker process,
+# created once, when the worker process is started
+_worker_test_run: Optional[GraphValidationTest] = None
+
+
+def get_test_runner_class(test_runner: str) -> Type[GraphValidationTest]:
+    """
+    :param test_runner: str, name of the test runner, one of the TEST_RUNNERS keys
+    :return: Type[GraphValidationTest], GraphValidationTest subclass of the test runner
+    """
+    module_name, class_name = TEST_RUNNERS[test_runner].split(":")
+    return getattr(import_module(module_name), class_name)
+
+
+def _init_worker(
+        test_run_class: Type[GraphValidationTest],
+        test_run_parameters: Dict[str, Any],
+        validation_cache: Optional[str] = None
+):
+    global _worker_test_run
+    # the (sqlite) validation cache is opened by each worker process, since connections cannot be shared
+    _worker_test_run = test_run_class(
+        validation_cache=ValidationCache(validation_cache) if validation_cache else None,
+        response_validations=ResponseValidations(max_size=WORKER_RESPONSE_VALIDATIONS),
+        **test_run_parameters
+    )
+
+
+def validate_archived_response(name: str, content: bytes) -> Tuple[str, Dict]:
+    """
+    Worker process entry point validating one stored TRAPI Response.
+
+    :param name: str, name of the stored TRAPI Response
+    :param content: bytes, raw content of the stored TRAPI Response
+    :return: Tuple[str, Dict], name and GraphValidationTest.format_results() of the
+                               stored TRAPI Response (or an 'error', if it could not be loaded)
+    """
+    try:
+        trapi_response: Optional[Dict] = load_archived_response(name, content)
+    except (ValueError, OSError) as error:
+        return name, {"error": f"Stored TRAPI Response could not be decoded: {str(error)}"}
+    if not trapi_response:
+        return name, {"error": "Stored file is not a TRAPI Response"}
+    return name, {"results": _worker_test_run.test_case_processor(trapi_response=trapi_response)}
+
+
+def run_bulk_validation(
+        test_run_class: Type[GraphValidationTest],
+        source: str,
+        sink: TextIO,
+        test_asset: Optional[TestAsset] = None,
+        component: Optional[str] = None,
+        environment: Optional[str] = None,
+        trapi_version: Optional[str] = None,
+        biolink_version: Optional[str] = None,
+        runner_settings: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        validation_cache: Optional[str] = None
+) -> int:
+    """
+    Validates all the stored TRAPI Responses of a directory or archive, distributed across a pool
+    of worker processes. Results are written to the sink, as one JSON line per TRAPI Response,
+    with the 'source' name of the TRAPI Response and either its 'results' or an 'error', in
+    order of completion. The number of TRAPI Responses in flight is bounded, such that
+    arbitrarily large archives may be validated within a bounded amount of memory.
+
+    :param test_run_class: Type[GraphValidationTest], GraphValidationTest subclass validating the TRAPI Responses
+    :param source: str, path to a directory, a tar (.tar, .tar.gz, etc.) or a zip archive of TRAPI Responses
+    :param sink: TextIO, text stream to which the results are written
+    :param test_asset: Optional[TestAsset], TestAsset against which the TRAPI Responses are validated
+                       (default: None, a placeholder, for tests not depending on the TestAsset)
+    :param component: Optional[str], component under which results are reported (default: 'ars')
+    :param environment: Optional[str], Translator execution environment of the TRAPI Responses (default: 'ci')
+    :param trapi_version: Optional[str], target TRAPI version (default: latest public release)
+    :param biolink_version: Optional[str], target Biolink Model version (default: Biolink toolkit release)
+    :param runner_settings: Optional[List[str]], extra string directives to the Test Runner (default: None)
+    :param workers: Optional[int], number of worker processes (default: number of processors on the machine)
+    :param max_pending: Optional[int], maximum number of TRAPI Responses in flight (default: 4 per worker)
+    :param validation_cache: Optional[str], path to a validation cache shared by the worker processes, such that
+                             TRAPI Responses identical to those previously validated are not validated again
+                             (default: None, always validate)
+    :return: int, number of TRAPI Responses validated (or failing to load)
+    """
+    if not workers:
+        workers = os.cpu_count() or 1
+    if not max_pending:
+        max_pending = 4 * workers
+
+    test_run_parameters: Dict[str, Any] = {
+        "test_asset": test_asset if test_asset is not None else ARCHIVED_TEST_ASSET,
+        "component": component,
+        "environment": environment,
+        "trapi_version": trapi_version,
+        "biolink_version": biolink_version,
+        "runner_settings": runner_settings
+    }
+
+    def write_results(done: Set[Future]):
+        for future in done:
+            name, outcome = future.result()
+            sink.write(json.dumps(dict(source=name, **outcome)) + "\n")
+
+    count: int = 0
+    pending: Set[Future] = set()
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(test_run_class, test_run_parameters, validation_cache)
+    ) as executor:
+        for name, content in iter_archived_files(source):
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                write_results(done)
+            pending.add(executor.submit(validate_archived_response, name, content))
+            count += 1
+        write_results(wait(pending).done)
+
+    logger.info(f"Validated {count} stored TRAPI Responses from '{source}'")
+    return count
+
+
+def get_bulk_parameters():
+    """Parse CLI args."""
+
+    # Sample command line interface parameters:
+    #     --source 'archived_responses.tar.gz'
+    #     --output 'results.jsonl'
+    #     --test_runner 'standards_validation'
+    #     --biolink_version '4.2.0'
+    #     --workers 8
+    #     --validation_cache 'validation_cache.sqlite'
+
+    parser = ArgumentParser(description="Bulk Validation of Stored TRAPI Responses")
+
+    parser.add_argument(
+        "--source",
+        type=str,
+        required=True,
+        help="Directory, tar or zip archive of stored TRAPI Responses (.json or .json.gz files)"
+    )
+
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="File to which results are written, as one JSON line per TRAPI Response " +
+             "(Default: if unspecified, results are written to standard output)"
+    )
+
+    parser.add_argument(
+        "--test_runner",
+        type=str,
+        choices=list(TEST_RUNNERS.keys()),
+        default="standards_validation",
+        help="Test runner validating the TRAPI Responses (Default: 'standards_validation')"
+    )
+
+    parser.add_argument(
+        "--component",
+        type=str,
+        default=None,
+        help="Translator component under which results are reported (Default: if unspecified, 'ars')"
+    )
+
+    parser.add_argument(
+        "--environment",
+        type=str,
+        choices=['dev', 'ci', 'test', 'prod'],
+        default=None,
+        help="Translator execution environment of the TRAPI Responses " +
+             "(Default: if unspecified, the 'ci' environment)"
+    )
+
+    parser.add_argument(
+        "--trapi_version",
+        type=str,
+        help="TRAPI version against which TRAPI Responses are validated" +
+             f" (Default: use latest TRAPI community release: '{default_trapi_release}')",
+        default=default_trapi_release
+    )
+
+    parser.add_argument(
+        "--biolink_version",
+        type=str,
+        help="Biolink Model version against which TRAPI Responses are validated " +
+             f"(Default: use current default release of the Biolink Model Toolkit: '{default_biolink_model_version}')",
+        default=default_biolink_model_version
+    )
+
+    parser.add_argument(
+        "--runner_settings",
+        nargs='+',
+        help="Scalar settings for the TestRunner, e.g. 'inferred'",
+        default=None
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Number of worker processes validating TRAPI Responses " +
+             "(Default: if unspecified, the number of processors on the machine)",
+        default=None
+    )
+
+    parser.add_argument(
+        "--validation_cache",
+        type=str,
+        help="Path to a persistent cache of validation messages, such that TRAPI Responses identical " +
+             "to those previously validated are not validated again (Default: if unspecified, always validate)",
+        default=None
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = get_bulk_parameters()
+    sink: TextIO = open(args.output, mode="w") if args.output else sys.stdout
+    try:
+        run_bulk_validation(
+            test_run_class=get_test_runner_class(args.test_runner),
+            source=args.source,
+            sink=sink,
+            component=args.component,
+            environment=args.environment,
+            trapi_version=args.trapi_version,
+            biolink_version=args.biolink_version,
+            runner_settings=args.runner_settings,
+            workers=args.workers,
+            validation_cache=args.validation_cache
+        )
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+
+
+if __name__ == '__main__':
+    main()
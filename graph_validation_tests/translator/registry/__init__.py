@@ -1,8 +1,11 @@
 """
 Translator SmartAPI Registry access  module
 """
-from typing import Optional, Union, Dict, List, Set, NamedTuple, Tuple
-from functools import lru_cache
+from typing import Callable, Optional, Union, Dict, List, Set, NamedTuple, Tuple
+import hashlib
+import json
+import threading
+import time
 
 import requests
 from requests.exceptions import RequestException
@@ -10,6 +13,15 @@ from requests.exceptions import RequestException
 from reasoner_validator.versioning import SemVer, get_latest_version
 from reasoner_validator.biolink import Toolkit
 
+from graph_validation_tests.utils.cache import ttl_cache
+from graph_validation_tests.utils.endpoint_stats import record_success, record_failure
+from graph_validation_tests.translator.registry.snapshot import (
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    compact_registry_data,
+    load_registry_snapshot,
+    save_registry_snapshot
+)
+
 import logging
 logger = logging.getLogger(__name__)
 
@@ -24,9 +36,69 @@ SMARTAPI_URL = "https://smart-api.info/api/"
 SMARTAPI_QUERY_PARAMETERS = "q=__all__&tags=%22trapi%22&" + \
                             "fields=servers,info,_meta,_status,paths,tags,openapi,swagger&size=1000&from=0"
 
-# Singleton reading of the Registry Data
-# (do I need to periodically refresh it in long-running applications?)
-_the_registry_data: Optional[Dict] = None
+
+
+class RegistryIndex(NamedTuple):
+    """
+    (Immutable) reading of the Registry Data, with its service entries indexed by InfoRes,
+    built - off the event loop - whenever the Registry Data is read, then swapped in as a whole.
+    """
+    # Translator SmartAPI Registry Data
+    data: Dict
+
+    # Validators (ETag and Last-Modified response headers) of
+    # the Registry Data, for conditional GETs of the Registry
+    validators: Dict[str, str]
+
+    # service entries of the Registry Data, indexed by InfoRes object identifier, in order of Registry listing
+    services: Dict[str, List[Dict]]
+
+    # digest of the (compacted) content of the Registry Data, to tell whether a new reading really differs
+    digest: str
+
+
+def index_registry_data(registry_data: Dict, validators: Dict[str, str]) -> RegistryIndex:
+    """
+    :param registry_data: Dict, Translator SmartAPI Registry Data
+    :param validators: Dict[str, str], 'ETag' and/or 'Last-Modified' headers of the Registry Data
+    :return: RegistryIndex, of the Registry Data
+    """
+    services: Dict[str, List[Dict]] = dict()
+    for service in registry_data.get("hits") or []:
+        infores: Optional[str] = tag_value(service, "info.x-translator.infores") \
+            if isinstance(service, dict) else None
+        if infores:
+            # Internally, we only track the object_id of the infores CURIE
+            services.setdefault(infores.replace("infores:", ""), list()).append(service)
+    digest: str = hashlib.sha256(
+        json.dumps(compact_registry_data(registry_data), separators=(",", ":")).encode("utf-8")
+    ).hexdigest()
+    return RegistryIndex(data=registry_data, validators=validators, services=services, digest=digest)
+
+
+# Singleton (indexed) reading of the Registry Data, which long-running applications may
+# periodically refresh in the background (see set_registry_refresh_interval()), always
+# replaced by a single assignment, such that readers never see a partial update
+_the_registry: Optional[RegistryIndex] = None
+
+# Interval (seconds) between refreshes of the Registry Data (default: None, never refreshed)
+_registry_refresh_interval: Optional[float] = None
+
+# time.monotonic() of the last (attempted) reading of the Registry Data
+_registry_read_time: Optional[float] = None
+
+_registry_refresh_lock = threading.Lock()
+_registry_refresh_thread: Optional[threading.Thread] = None
+
+# Path to an on-disk (compact) snapshot of the Registry Data, read on cold
+# starts and saved on each reading (default: None, no snapshot is used)
+_registry_snapshot_path: Optional[str] = None
+
+# Maximum age (seconds) of a snapshot still read on cold starts
+_registry_snapshot_max_age: Optional[float] = DEFAULT_SNAPSHOT_MAX_AGE
+
+# Functions called whenever the content of the Registry Data changes, e.g. to clear caches of endpoint resolutions
+_registry_data_listeners: List[Callable[[], None]] = list()
 
 
 def query_smart_api(url: str = SMARTAPI_URL, parameters: Optional[str] = None) -> Optional[Dict]:
@@ -38,23 +110,193 @@ def query_smart_api(url: str = SMARTAPI_URL, parameters: Optional[str] = None) -
     :return: dict, catalog of Translator SmartAPI Metadata indexed by "test_data_location" source.
     """
     # ... if not faking it, access the real thing...
+    data: Optional[Dict]
+    data, _ = conditional_query_smart_api(dict(), url=url, parameters=parameters)
+    return data
+
+
+def conditional_query_smart_api(
+        validators: Dict[str, str],
+        url: str = SMARTAPI_URL,
+        parameters: Optional[str] = SMARTAPI_QUERY_PARAMETERS
+) -> Tuple[Optional[Dict], Dict[str, str]]:
+    """
+    Conditional GET of Translator SmartAPI Metadata, i.e. only retrieved if modified since last retrieved.
+
+    :param validators: Dict[str, str], 'ETag' and/or 'Last-Modified' headers of the last retrieval (may be empty)
+    :param url: str, base URL for Translator SmartAPI Registry
+    :param parameters: Optional[str], string of query parameters for Translator SmartAPI Registry
+    :return: Tuple[Optional[Dict], Dict[str, str]], Translator SmartAPI Metadata (None if unmodified or not
+                                                    retrieved; an 'Error' if the Registry could not be accessed)
+                                                    and the validators of the metadata retrieved
+    """
     query_string = f"query?{parameters}" if parameters else "query"
-    data: Optional[Dict] = None
+    headers: Dict[str, str] = dict()
+    if "ETag" in validators:
+        headers["If-None-Match"] = validators["ETag"]
+    if "Last-Modified" in validators:
+        headers["If-Modified-Since"] = validators["Last-Modified"]
     try:
-        request = requests.get(f"{url}{query_string}")
+        request = requests.get(f"{url}{query_string}", headers=headers)
+        if request.status_code == 304:
+            return None, validators
         if request.status_code == 200:
-            data = request.json()
+            return request.json(), {
+                header: request.headers[header] for header in ("ETag", "Last-Modified") if header in request.headers
+            }
+        logger.warning(f"conditional_query_smart_api(): unexpected HTTP status code {request.status_code}")
     except RequestException as re:
-        print(re)
-        data = {"Error": "Translator SmartAPI Registry Access Exception: "+str(re)}
-    return data
+        logger.warning(f"conditional_query_smart_api(): {str(re)}")
+        return {"Error": "Translator SmartAPI Registry Access Exception: "+str(re)}, validators
+    return None, validators
+
+
+def add_registry_data_listener(listener: Callable[[], None]):
+    """
+    :param listener: Callable[[], None], function called (possibly from a background thread) whenever the
+                     content of the Registry Data changes (e.g. the thread-safe 'cache_clear' method of
+                     a cached resolution of Registry endpoints, see graph_validation_tests.utils.cache)
+    """
+    _registry_data_listeners.append(listener)
+
+
+def _replace_the_registry_data(registry_data: Dict, validators: Dict[str, str], save: bool = True):
+    """
+    Indexes then swaps in (in a single assignment) a (valid) reading of the Registry Data, notifying
+    the listeners of the Registry Data if - and only if - its content changed.
+
+    :param registry_data: Dict, Translator SmartAPI Registry Data
+    :param validators: Dict[str, str], 'ETag' and/or 'Last-Modified' headers of the Registry Data
+    :param save: bool, if True, the Registry snapshot (if any) is saved
+    """
+    global _the_registry
+    registry: RegistryIndex = index_registry_data(registry_data, validators)
+    previous: Optional[RegistryIndex] = _the_registry
+    _the_registry = registry
+    if previous is None or previous.digest != registry.digest:
+        # cached endpoint resolutions may no longer match the new Registry Data
+        for listener in _registry_data_listeners:
+            listener()
+    if save and _registry_snapshot_path:
+        save_registry_snapshot(_registry_snapshot_path, registry.data, registry.validators)
+
+
+def refresh_the_registry_data():
+    """
+    Refreshes the Registry Data, by a conditional GET of the Registry: the Registry Data is only
+    replaced - atomically, as a whole - if modified, and is otherwise kept as is (even if stale),
+    e.g. if the Registry is unmodified or cannot be accessed.
+    """
+    global _registry_read_time
+    _registry_read_time = time.monotonic()
+    registry: Optional[RegistryIndex] = _the_registry
+    registry_data, validators = conditional_query_smart_api(registry.validators if registry else dict())
+    if registry_data and "Error" not in registry_data:
+        _replace_the_registry_data(registry_data, validators)
+        logger.info("Translator SmartAPI Registry Data refreshed")
+
+
+def _refresh_the_registry_data_in_background():
+    global _registry_refresh_thread
+    try:
+        refresh_the_registry_data()
+    finally:
+        with _registry_refresh_lock:
+            _registry_refresh_thread = None
+
+
+def _start_registry_refresh():
+    global _registry_refresh_thread
+    with _registry_refresh_lock:
+        if _registry_refresh_thread is None:
+            _registry_refresh_thread = threading.Thread(
+                target=_refresh_the_registry_data_in_background,
+                name="registry-refresh",
+                daemon=True
+            )
+            _registry_refresh_thread.start()
+
+
+def set_registry_refresh_interval(interval: Optional[float]):
+    """
+    :param interval: Optional[float], interval (seconds) between background refreshes of
+                     the Registry Data (None: the Registry Data is never refreshed)
+    """
+    global _registry_refresh_interval
+    _registry_refresh_interval = interval
+
+
+def set_registry_snapshot(path: Optional[str], max_age: Optional[float] = DEFAULT_SNAPSHOT_MAX_AGE):
+    """
+    :param path: Optional[str], path to an on-disk snapshot of the Registry Data, read (if not older than
+                 'max_age') instead of the Registry on cold starts, then saved on each reading of the
+                 Registry (None: no snapshot is used)
+    :param max_age: Optional[float], maximum age (seconds) of a snapshot still read (None: any age)
+    """
+    global _registry_snapshot_path, _registry_snapshot_max_age
+    _registry_snapshot_path = path
+    _registry_snapshot_max_age = max_age
+
+
+def _load_the_registry_snapshot() -> bool:
+    global _registry_read_time
+    snapshot: Optional[Tuple[Dict, Dict[str, str], float]] = \
+        load_registry_snapshot(_registry_snapshot_path, _registry_snapshot_max_age)
+    if not snapshot:
+        return False
+    registry_data, validators, age = snapshot
+    _replace_the_registry_data(registry_data, validators, save=False)
+    # the snapshot is as stale as its age, hence refreshed (if so configured) accordingly
+    _registry_read_time = time.monotonic() - age
+    logger.info(f"Translator SmartAPI Registry Data read from snapshot '{_registry_snapshot_path}'")
+    return True
 
 
 def get_the_registry_data(refresh: bool = False) -> Dict:
-    global _the_registry_data
-    if not _the_registry_data or refresh:
-        _the_registry_data = query_smart_api(parameters=SMARTAPI_QUERY_PARAMETERS)
-    return _the_registry_data
+    """
+    Returns the (singleton) Registry Data. Once read, the Registry Data is served immediately, even if
+    older than the registry refresh interval (if any), in which case it is refreshed in the background
+    ('stale-while-revalidate'), for the benefit of later callers. On a cold start, the Registry Data
+    is read from the Registry snapshot (see set_registry_snapshot()), if any, rather than the Registry,
+    then revalidated once in the background, by a conditional GET of the Registry. A failed reading
+    of the Registry never replaces the last (valid) Registry Data read.
+
+    :param refresh: bool, if True, the Registry Data is (fully) read again, before being returned
+    :return: Dict, Registry Data; an 'Error' if no Registry Data could be read (yet)
+    """
+    global _registry_read_time
+    if _the_registry is None and not refresh and _registry_snapshot_path and _load_the_registry_snapshot():
+        # the snapshot may be outdated, even if not older than its maximum age
+        _start_registry_refresh()
+    elif _the_registry is None or refresh:
+        _registry_read_time = time.monotonic()
+        registry_data, validators = conditional_query_smart_api(dict())
+        if registry_data and "Error" not in registry_data:
+            _replace_the_registry_data(registry_data, validators)
+        elif _the_registry is None:
+            # nothing to serve (yet): the Registry is read again by the next caller
+            return registry_data or {"Error": "Translator SmartAPI Registry Data could not be read"}
+    elif _registry_refresh_interval is not None and \
+            time.monotonic() - (_registry_read_time or 0.0) >= _registry_refresh_interval:
+        _start_registry_refresh()
+    return _the_registry.data
+
+
+def get_registry_services(registry_data: Dict, infores_id: str) -> List[Dict]:
+    """
+    :param registry_data: Dict, Translator SmartAPI Registry Data
+    :param infores_id: str, object (reference) identifier of the InfoRes CURIE of a resource
+    :return: List[Dict], service entries of the resource, in order of Registry listing, looked up in the
+                         index of the (current) Registry Data read by get_the_registry_data(); any other
+                         Registry Data is scanned
+    """
+    registry: Optional[RegistryIndex] = _the_registry
+    if registry is not None and registry.data is registry_data:
+        return registry.services.get(infores_id, [])
+    return [
+        service for service in registry_data.get("hits") or []
+        if service and find_infores(service=service, target_infores_id=infores_id)
+    ]
 
 
 #########################################
@@ -213,7 +455,7 @@ _ignored_resources: Set[str] = {
 }
 
 
-@lru_cache()
+@ttl_cache()
 def live_trapi_endpoint(url: str) -> Optional[Dict]:
     """
     Checks if TRAPI endpoint is accessible.
@@ -252,6 +494,9 @@ def live_trapi_endpoint(url: str) -> Optional[Dict]:
                 #       harvest some of its metadata here, for validation purposes?
                 data: Optional[Dict] = request.json()
                 logger.info(f"live_trapi_endpoint(): TRAPI endpoint '{test_url}' successfully accessed!")
+                # the probe latency seeds the latency statistics used for selecting amongst
+                # functionally identical servers (see graph_validation_tests.utils.endpoint_stats)
+                record_success(url, request.elapsed.total_seconds())
                 return data
             else:
                 logger.warning(
@@ -260,6 +505,7 @@ def live_trapi_endpoint(url: str) -> Optional[Dict]:
                 )
         except RequestException as re:
             logger.warning(f"live_trapi_endpoint(): requests.get({test_url}) exception {str(re)}?")
+    record_failure(url)
     return None
 
 
@@ -374,6 +620,27 @@ def select_accessible_endpoint(urls: Optional[List[str]], check_access: bool) ->
     return url
 
 
+def select_accessible_endpoints(urls: Optional[List[str]], check_access: bool) -> List[str]:
+    """
+    Selects all the accessible endpoints from a list of 'functionally identical' server urls.
+
+    :param urls: Optional[List[str]], server urls of a given x-maturity
+    :param check_access: bool, verify TRAPI access of endpoints before returning them
+    :return: List[str], accessible endpoints, in the order of the given urls
+    """
+    endpoints: List[str] = list()
+    for endpoint in urls or []:
+        if not check_access:
+            # May be set for testing purposes
+            endpoints.append(endpoint)
+        else:
+            data: Optional[Dict] = live_trapi_endpoint(endpoint)
+            if data is not None:
+                endpoints.append(endpoint)
+                capture_kg_metadata(endpoint, data)
+    return endpoints
+
+
 def select_endpoint(
         server_urls: Dict[str, List[str]],
         check_access: bool = True
@@ -708,6 +975,23 @@ def find_infores(service: Dict, target_infores_id: str) -> bool:
         return False
 
 
+def get_component_type_from_registry(registry_data: Dict, infores_id: str) -> Optional[str]:
+    """
+    Get the type of component from registry data, for a given infores object identifier.
+    :param registry_data: Dict, Python dictionary contents retrieved
+                                from the Translator SmartAPI Registry
+    :param infores_id: str, object (reference) identifier of the InfoRes CURIE
+                            identifying a known resource in the Registry
+    :return: Optional[str], the 'info.x-translator.component' type of component
+                            (i.e. 'KP' or 'ARA'), None if not available
+    """
+    for service in get_registry_services(registry_data, infores_id):
+        component_type: Optional[str] = tag_value(service, "info.x-translator.component")
+        if component_type:
+            return component_type
+    return None
+
+
 def resolve_endpoint(
         server_urls: List,
         x_maturity: Optional[str] = None,
@@ -754,6 +1038,28 @@ def resolve_endpoint(
     return None
 
 
+def resolve_endpoints(
+        server_urls: List,
+        x_maturity: str,
+        check_access: bool = True
+) -> List[str]:
+    """
+    Select all active endpoints running in a given 'x_maturity' environment, from available 'server_urls'.
+    Unlike resolve_endpoint(), which only returns the first active endpoint found, this allows
+    for failover (and hedging) of TRAPI queries across 'functionally identical' servers.
+
+    :param server_urls: List, service 'servers' block list of available servers hosting the service
+    :param x_maturity: str, target x_maturity environment within which the component
+                            is running and for which the endpoints are requested
+                            One of ['production', 'staging', 'testing', 'development']
+    :param check_access: bool, verify TRAPI access of endpoints before returning (Default: True)
+
+    :return: List[str], urls of active endpoints (empty if none are available)
+    """
+    urls = [server["url"] for server in server_urls if server.get("x-maturity") == x_maturity]
+    return select_accessible_endpoints(urls, check_access)
+
+
 #########################################
 # Simplified resolution of Translator
 # component endpoints, for the
@@ -780,6 +1086,36 @@ def get_component_endpoint_from_registry(
     :param target_biolink_version: Optional[str] = None, target Biolink Model version (default: Biolink toolkit release)
     :return: Optional[str], the endpoint URL if available, None otherwise
     """
+    endpoints: List[str] = get_component_endpoints_from_registry(
+        registry_data=registry_data,
+        infores_id=infores_id,
+        environment=environment,
+        target_trapi_version=target_trapi_version,
+        target_biolink_version=target_biolink_version
+    )
+    return endpoints[0] if endpoints else None
+
+
+def get_component_endpoints_from_registry(
+        registry_data: Dict,
+        infores_id: str,
+        environment: str,
+        target_trapi_version: Optional[str],
+        target_biolink_version: Optional[str]
+) -> List[str]:
+    """
+    Get all the (functionally identical) live endpoints of a component from registry data,
+    for a given infores object identifier and for a specified environment.
+    :param registry_data: Dict, Python dictionary contents retrieved
+                                from the Translator SmartAPI Registry
+    :param infores_id: str, object (reference) identifier of the InfoRes CURIE
+                            identifying a known resource in the Registry
+    :param environment: x_maturity environment within which the component
+                        is running and for which the endpoints are requested
+    :param target_trapi_version: Optional[str] = None, target TRAPI version (default: latest public release)
+    :param target_biolink_version: Optional[str] = None, target Biolink Model version (default: Biolink toolkit release)
+    :return: List[str], the endpoint URLs, in order of Registry listing; empty if none are available
+    """
     if not target_trapi_version:
         target_trapi_version = LATEST_TRAPI_VERSION
 
@@ -790,10 +1126,7 @@ def get_component_endpoint_from_registry(
     # will track the selected TRAPI version
     # for each distinct information resource
     selected_service_trapi_version: Dict = dict()
-    for index, service in enumerate(registry_data['hits']):
-
-        if not find_infores(service=service, target_infores_id=infores_id):
-            continue
+    for service in get_registry_services(registry_data, infores_id):
 
         # Filter early for TRAPI version
         service_trapi_version = tag_value(service, "info.x-trapi.version")
@@ -817,16 +1150,10 @@ def get_component_endpoint_from_registry(
         # need to map ['dev', 'ci', 'test', 'prod'] onto full name in DEPLOYMENT_TYPES
         x_maturity = DEPLOYMENT_TYPE_MAP[environment]
 
-        endpoint_entry: Optional[Tuple[str, str]] = \
-            resolve_endpoint(server_urls=service["servers"], x_maturity=x_maturity)
-
-        if endpoint_entry is not None:
-            x_maturity_found, endpoint = endpoint_entry
-
-            # Is this a necessary sanity check?
-            if x_maturity == x_maturity_found:
-                logger.info(f"Found live '{infores_id}' service '{endpoint}' running in '{x_maturity}'.")
-                return endpoint
+        endpoints: List[str] = resolve_endpoints(server_urls=service["servers"], x_maturity=x_maturity)
+        if endpoints:
+            logger.info(f"Found live '{infores_id}' service(s) {str(endpoints)} running in '{x_maturity}'.")
+            return endpoints
 
     logger.warning(f"No '{environment}' endpoint found for '{infores_id}'")
-    return None
+    return []
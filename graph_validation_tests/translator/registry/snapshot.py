@@ -0,0 +1,136 @@
+"""
+Compact on-disk snapshot of the Translator SmartAPI Registry Data, keeping only the (few) fields of
+each service entry read by the registry module - its title and version, InfoRes, component type,
+TRAPI and Biolink Model versions and servers - such that endpoint resolution, on a cold start,
+is a fast local read, rather than a retrieval of the (large) Translator SmartAPI Registry Data.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import os
+import time
+
+import logging
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT: int = 1
+
+# Default maximum age (seconds) of a snapshot still used
+DEFAULT_SNAPSHOT_MAX_AGE: float = 86400.0
+
+# (dotted) paths of the fields of the service entries kept in the snapshot
+SNAPSHOT_FIELDS: Tuple[str, ...] = (
+    "info.title",
+    "info.version",
+    "info.x-translator.infores",
+    "info.x-translator.component",
+    "info.x-translator.version",
+    "info.x-translator.biolink-version",
+    "info.x-trapi.version"
+)
+
+# fields of the servers of the service entries kept in the snapshot
+SNAPSHOT_SERVER_FIELDS: Tuple[str, ...] = ("url", "x-maturity")
+
+
+def _get_field(service: Dict, path: str) -> Any:
+    value: Any = service
+    for tag in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(tag)
+    return value
+
+
+def _set_field(service: Dict, path: str, value: Any):
+    tags: List[str] = path.split(".")
+    for tag in tags[:-1]:
+        service = service.setdefault(tag, dict())
+    service[tags[-1]] = value
+
+
+def compact_registry_data(registry_data: Dict) -> List[List]:
+    """
+    :param registry_data: Dict, Translator SmartAPI Registry Data
+    :return: List[List], one row per service entry, of the values of its SNAPSHOT_FIELDS,
+                         then of the SNAPSHOT_SERVER_FIELDS of each of its servers
+    """
+    services: List[List] = list()
+    for service in registry_data.get("hits") or []:
+        if not isinstance(service, dict):
+            continue
+        row: List = [_get_field(service, path) for path in SNAPSHOT_FIELDS]
+        row.append([
+            [server.get(field) for field in SNAPSHOT_SERVER_FIELDS]
+            for server in service.get("servers") or [] if isinstance(server, dict)
+        ])
+        services.append(row)
+    return services
+
+
+def expand_registry_data(services: List[List]) -> Dict:
+    """
+    :param services: List[List], service entries, as compacted by compact_registry_data()
+    :return: Dict, (pruned) Translator SmartAPI Registry Data
+    """
+    hits: List[Dict] = list()
+    for row in services:
+        service: Dict = dict()
+        for path, value in zip(SNAPSHOT_FIELDS, row):
+            if value is not None:
+                _set_field(service, path, value)
+        service["servers"] = [
+            {field: value for field, value in zip(SNAPSHOT_SERVER_FIELDS, server) if value is not None}
+            for server in row[len(SNAPSHOT_FIELDS)]
+        ]
+        hits.append(service)
+    return {"total": len(hits), "hits": hits}
+
+
+def save_registry_snapshot(path: str, registry_data: Dict, validators: Dict[str, str]):
+    """
+    Saves (atomically) a compact snapshot of the Registry Data. Failures are logged, but otherwise ignored.
+
+    :param path: str, path to the snapshot file
+    :param registry_data: Dict, Translator SmartAPI Registry Data
+    :param validators: Dict[str, str], 'ETag' and/or 'Last-Modified' headers of the Registry Data
+    """
+    snapshot: Dict = {
+        "format": SNAPSHOT_FORMAT,
+        "created": time.time(),
+        "validators": validators,
+        "services": compact_registry_data(registry_data)
+    }
+    partial: str = f"{path}.partial"
+    try:
+        with open(partial, "w") as snapshot_file:
+            json.dump(snapshot, snapshot_file, separators=(",", ":"))
+        os.replace(partial, path)
+    except OSError as ose:
+        logger.warning(f"save_registry_snapshot({path}): {str(ose)}")
+
+
+def load_registry_snapshot(
+        path: str,
+        max_age: Optional[float] = DEFAULT_SNAPSHOT_MAX_AGE
+) -> Optional[Tuple[Dict, Dict[str, str], float]]:
+    """
+    :param path: str, path to the snapshot file
+    :param max_age: Optional[float], maximum age (seconds) of a snapshot still used (None: any age)
+    :return: Optional[Tuple[Dict, Dict[str, str], float]], (pruned) Registry Data, with its validators
+                                                            and age (seconds); None if the snapshot is
+                                                            missing, unreadable or too old
+    """
+    try:
+        with open(path) as snapshot_file:
+            snapshot: Dict = json.load(snapshot_file)
+        if snapshot.get("format") != SNAPSHOT_FORMAT:
+            return None
+        age: float = max(time.time() - snapshot["created"], 0.0)
+        if max_age is not None and age > max_age:
+            return None
+        return expand_registry_data(snapshot["services"]), snapshot.get("validators") or dict(), age
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, IndexError) as error:
+        logger.warning(f"load_registry_snapshot({path}): unreadable snapshot, ignored: {str(error)}")
+        return None
@@ -2,16 +2,34 @@
 Code to submit GraphValidation test queries to
 Translator components - ARS, ARA, KP - via TRAPI
 """
-from typing import Optional, Dict, List
-from functools import lru_cache
+from typing import Optional, Dict, List, Tuple
+import asyncio
+import time
 import requests
+import httpx
 
-from reasoner_validator.trapi import call_trapi
+from reasoner_validator.trapi import DEFAULT_TRAPI_POST_TIMEOUT
 
 from graph_validation_tests.translator.registry import (
     DEPLOYMENT_TYPE_MAP,
+    add_registry_data_listener,
     get_the_registry_data,
-    get_component_endpoint_from_registry
+    get_component_endpoints_from_registry,
+    get_component_type_from_registry
+)
+from graph_validation_tests.utils.cache import ttl_cache
+from graph_validation_tests.utils.concurrency import AdaptiveConcurrencyLimiter, LatencyStats, is_overloaded
+from graph_validation_tests.utils.endpoint_stats import (
+    DEFAULT_ENDPOINT_SELECTION,
+    order_endpoints,
+    record_success,
+    record_failure
+)
+from graph_validation_tests.utils.retry import QueryAttempt, RetryPolicy, call_with_retries
+from graph_validation_tests.translator.trapi.asyncquery import (
+    CallbackReceiver,
+    get_callback_receiver,
+    post_trapi_async_query
 )
 
 from logging import getLogger
@@ -103,58 +121,73 @@ def retrieve_trapi_response(host_url: str, response_id: str):
         if response_content:
             status_code = response_content.status_code
             if status_code == 200:
-                print(f"...Result returned from '{host_url}'!")
+                logger.debug(f"...Result returned from '{host_url}'!")
         else:
             status_code = 404
 
     except Exception as e:
-        print(f"Remote host {host_url} unavailable: Connection attempt to {host_url} triggered an exception: {e}")
+        logger.warning(
+            f"Remote host {host_url} unavailable: Connection attempt to {host_url} triggered an exception: {e}"
+        )
         response_content = None
         status_code = 404
 
     return status_code, response_content
 
 
+def extract_ars_trapi_response(response_id: str, response_dict: Dict) -> Optional[Dict]:
+    """
+    Extracts the TRAPI Response from an ARS message.
+    :param response_id: str, ARS message identifier ('PK')
+    :param response_dict: Dict, ARS message JSON
+    :return: Optional[Dict], TRAPI Response of the ARS message; None if not available
+    """
+    trapi_response: Optional[Dict] = None
+    if 'fields' in response_dict:
+        if 'actor' in response_dict['fields'] and str(response_dict['fields']['actor']) == '9':
+            logger.error("The supplied response id is a collection id. Please supply the UUID for a response")
+        elif 'data' in response_dict['fields']:
+            logger.info(f"Validating ARS PK '{response_id}' TRAPI Response result...")
+            trapi_response = response_dict['fields']['data']
+        else:
+            logger.error("ARS response dictionary is missing 'fields.data'?")
+    else:
+        logger.error("ARS response dictionary is missing 'fields'?")
+    return trapi_response
+
+
 def retrieve_ars_result(response_id: str, verbose: bool) -> Optional[Dict]:
+    """
+    Retrieves the TRAPI Response of an ARS message, trying each of the ARS_HOSTS in turn.
+    See also the (concurrent) graph_validation_tests.translator.trapi.ars.async_retrieve_ars_result().
+    """
     trapi_response: Optional[Dict] = None
 
     if verbose:
-        print(f"Trying to retrieve ARS Response UUID '{response_id}'...")
+        logger.info(f"Trying to retrieve ARS Response UUID '{response_id}'...")
 
     response_content: Optional = None
     status_code: int = 404
 
     for ars_host in ARS_HOSTS:
         if verbose:
-            print(f"\n...from {ars_host}", end=None)
+            logger.info(f"...from {ars_host}")
 
         status_code, response_content = retrieve_trapi_response(
             host_url=f"https://{ars_host}/ars/api/messages/",
             response_id=response_id
         )
-        if status_code != 200:
-            continue
+        if status_code == 200:
+            break
 
     if status_code != 200:
-        print(f"Unsuccessful HTTP status code '{status_code}' reported for ARS PK '{response_id}'?")
+        logger.error(f"Unsuccessful HTTP status code '{status_code}' reported for ARS PK '{response_id}'?")
     else:
         # Unpack the response content into a dict
         try:
-            response_dict = response_content.json()
-
-            if 'fields' in response_dict:
-                if 'actor' in response_dict['fields'] and str(response_dict['fields']['actor']) == '9':
-                    print("The supplied response id is a collection id. Please supply the UUID for a response")
-                elif 'data' in response_dict['fields']:
-                    print(f"Validating ARS PK '{response_id}' TRAPI Response result...")
-                    trapi_response = response_dict['fields']['data']
-                else:
-                    print("ARS response dictionary is missing 'fields.data'?")
-            else:
-                print("ARS response dictionary is missing 'fields'?")
-
+            trapi_response = extract_ars_trapi_response(response_id, response_content.json())
         except Exception as e:
-            print(f"Cannot decode ARS PK '{response_id}' to a Translator Response, exception: {e}")
+            logger.error(f"Cannot decode ARS PK '{response_id}' to a Translator Response, exception: {e}")
 
     return trapi_response
 
@@ -205,8 +238,135 @@ def get_component_infores_object_id(component: str) -> Optional[str]:
     return _infores_obj_id_map[component]
 
 
-@lru_cache()
-def resolve_component_endpoint(
+def get_component_from_infores(infores: Optional[str]) -> Optional[str]:
+    """
+    Returns the component acronym of a given InfoRes identifier.
+    :param infores: Optional[str], InfoRes CURIE (e.g. 'infores:aragorn') or object identifier of a component
+    :return: Optional[str], acronym of the component; None if not known
+    """
+    if not infores:
+        return None
+    object_id: str = infores.replace("infores:", "")
+    for component, infores_object_id in _infores_obj_id_map.items():
+        if infores_object_id == object_id:
+            return component
+    return None
+
+
+def _get_component_type_from_registry(infores_id: str) -> Optional[str]:
+    return get_component_type_from_registry(get_the_registry_data(), infores_id)
+
+
+@ttl_cache()
+async def resolve_component_type(component: Optional[str]) -> Optional[str]:
+    """
+    Resolves the type of a given component. The (blocking) reading of the
+    Registry Data is done in a worker thread, to keep the event loop free.
+    :param component: Optional[str], acronym of the component (default: None == 'ars')
+    :return: Optional[str], one of 'ARS', 'ARA' or 'KP'; None if not available
+    """
+    if not component or component == 'ars':
+        return "ARS"
+    infores_id: Optional[str] = get_component_infores_object_id(component)
+    if not infores_id:
+        return None
+    return await asyncio.to_thread(_get_component_type_from_registry, infores_id)
+
+
+# Connection pooled HTTP client shared by all TRAPI queries
+# run within a given event loop, such that many queries
+# may be concurrently in flight, to one or more endpoints
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the connection pooled HTTP client of the currently running event loop
+    (a fresh client is created when first called within a new event loop).
+    :return: httpx.AsyncClient
+    """
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        _http_client = httpx.AsyncClient(
+            timeout=DEFAULT_TRAPI_POST_TIMEOUT,
+            limits=httpx.Limits(max_connections=None, max_keepalive_connections=100)
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+async def post_trapi_query(url: str, trapi_request: Dict) -> Dict:
+    """
+    Non-blocking POST of a TRAPI query to the /query endpoint at a given url.
+    This is a drop-in replacement for reasoner_validator.trapi.call_trapi(),
+    which blocks the event loop during the (potentially long) HTTP call.
+
+    :param url: str, base url of the TRAPI service
+    :param trapi_request: Dict, TRAPI request JSON, as a Python data structure.
+    :return: Dict, with the HTTP 'status_code', TRAPI 'response_json' (None unless status_code == 200)
+                   and the value of any 'retry_after' header returned by the service (otherwise None)
+    """
+    query_url = f"{url.rstrip('/')}/query"
+    try:
+        response = await get_http_client().post(query_url, json=trapi_request)
+        status_code: int = response.status_code
+    except httpx.TimeoutException:
+        logger.error(f"post_trapi_query({query_url}) - Request POST TimeOut?")
+        return {'status_code': 408, 'response_json': None, 'retry_after': None}
+    except httpx.HTTPError as he:
+        # perhaps another unexpected Request failure?
+        logger.error(f"post_trapi_query({query_url}) - Request POST exception: {str(he)}")
+        return {'status_code': 408, 'response_json': None, 'retry_after': None}
+
+    response_json: Optional[Dict] = None
+    if status_code == 200:
+        try:
+            response_json = response.json()
+        except Exception as exc:
+            logger.error(f"post_trapi_query({query_url}) JSON access error: {str(exc)}")
+
+    return {
+        'status_code': status_code,
+        'response_json': response_json,
+        'retry_after': response.headers.get('Retry-After')
+    }
+
+
+# Adaptive limits of TRAPI queries concurrently in flight, indexed by endpoint,
+# within the event loop whose futures their waiting queries are awaiting
+_endpoint_limiters: Dict[str, AdaptiveConcurrencyLimiter] = dict()
+_endpoint_limiters_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_endpoint_limiter(endpoint: str) -> AdaptiveConcurrencyLimiter:
+    """
+    Returns the concurrency limiter of an endpoint, within the currently running event loop
+    (fresh limiters are created when first called within a new event loop, e.g. of another
+    run of tests, since the queries waiting on a limiter await futures of its event loop).
+
+    :param endpoint: str, TRAPI endpoint url
+    :return: AdaptiveConcurrencyLimiter, governing the TRAPI queries concurrently sent to the endpoint
+    """
+    global _endpoint_limiters, _endpoint_limiters_loop
+    loop = asyncio.get_running_loop()
+    if _endpoint_limiters_loop is not loop:
+        _endpoint_limiters = dict()
+        _endpoint_limiters_loop = loop
+    if endpoint not in _endpoint_limiters:
+        _endpoint_limiters[endpoint] = AdaptiveConcurrencyLimiter()
+    return _endpoint_limiters[endpoint]
+
+
+def get_endpoint_concurrency() -> Dict[str, int]:
+    """
+    :return: Dict[str, int], current number of TRAPI queries allowed in flight, indexed by endpoint
+    """
+    return {endpoint: limiter.get_limit() for endpoint, limiter in _endpoint_limiters.items()}
+
+
+async def resolve_component_endpoint(
         component: Optional[str],
         environment: Optional[str],
         target_trapi_version: Optional[str],
@@ -223,7 +383,53 @@ def resolve_component_endpoint(
     :param target_biolink_version: Optional[str], target Biolink Model version (default: Biolink toolkit release)
     :return: Optional[str], environment-specific endpoint for component to be queried. None if not available.
     """
-    endpoint: Optional[str] = None
+    endpoints: Tuple[str, ...] = await resolve_component_endpoints(
+        component=component,
+        environment=environment,
+        target_trapi_version=target_trapi_version,
+        target_biolink_version=target_biolink_version
+    )
+    return endpoints[0] if endpoints else None
+
+
+def _get_component_endpoints_from_registry(
+        component: str,
+        environment: str,
+        target_trapi_version: Optional[str],
+        target_biolink_version: Optional[str]
+) -> List[str]:
+    return get_component_endpoints_from_registry(
+        get_the_registry_data(),
+        infores_id=get_component_infores_object_id(component),
+        environment=environment,
+        target_trapi_version=target_trapi_version,
+        target_biolink_version=target_biolink_version
+    )
+
+
+@ttl_cache()
+async def resolve_component_endpoints(
+        component: Optional[str],
+        environment: Optional[str],
+        target_trapi_version: Optional[str],
+        target_biolink_version: Optional[str]
+) -> Tuple[str, ...]:
+    """
+    Resolve all the (functionally identical) live endpoints of a component, for running the test.
+    The (blocking) reading of the Registry Data and liveness probes of the endpoints are done
+    in a worker thread, to keep the event loop free; concurrent resolutions of a component
+    share a single resolution (see graph_validation_tests.utils.cache.ttl_cache).
+    :param component: Optional[str], component to be queried, ideally, drawn from a value
+                                            in the 'ComponentEnum' of the Translator Testing Model;
+                                            (default: None == 'ars')
+    :param environment: Optional[str]: target Translator execution environment of the component to be accessed;
+                                              One of ['dev', 'ci', 'test', 'prod'] (default: None == 'ci')
+    :param target_trapi_version: Optional[str], target TRAPI version (default: latest public release)
+    :param target_biolink_version: Optional[str], target Biolink Model version (default: Biolink toolkit release)
+    :return: Tuple[str, ...], environment-specific endpoints for component to be queried,
+                              with the primary endpoint first. Empty if none are available.
+    """
+    endpoints: List[str] = list()
     if not component:
         component = 'ars'
 
@@ -232,32 +438,200 @@ def resolve_component_endpoint(
 
     if environment not in DEPLOYMENT_TYPE_MAP.keys():
         logger.error(
-            f"resolve_component_endpoint(): unexpected environment type: '{environment}', Cannot resolve endpoint!"
+            f"resolve_component_endpoints(): unexpected environment type: '{environment}', Cannot resolve endpoint!"
         )
     elif component == 'ars':
         ars_env: str = ars_env_spec[environment]
         # TODO: how do I check if the given ARS service is online here?
-        return f"https://{ars_env}.transltr.io/ars/api/"
+        return (f"https://{ars_env}.transltr.io/ars/api/",)
     else:
         err_msg: str = \
-            f"trapi::resolve_component_endpoint() - Could not resolve endpoint of component '{component}' " + \
+            f"trapi::resolve_component_endpoints() - Could not resolve endpoint of component '{component}' " + \
             f"within specified environment '{environment}'?"
         try:
-            registry_data: Dict = get_the_registry_data()
-            endpoint: Optional[str] = \
-                get_component_endpoint_from_registry(
-                    registry_data,
-                    infores_id=get_component_infores_object_id(component),
-                    environment=environment,
-                    target_trapi_version=target_trapi_version,
-                    target_biolink_version=target_biolink_version
-                )
+            endpoints = await asyncio.to_thread(
+                _get_component_endpoints_from_registry,
+                component,
+                environment,
+                target_trapi_version,
+                target_biolink_version
+            )
         except AssertionError as ae:
             err_msg += f" Exception occurred while resolving: {str(ae)}"
-        if not endpoint:
+        if not endpoints:
             logger.error(err_msg)
 
-    return endpoint
+    return tuple(endpoints)
+
+
+# component resolutions are (re-)read from the Registry Data, whenever it is refreshed
+add_registry_data_listener(resolve_component_type.cache_clear)
+add_registry_data_listener(resolve_component_endpoints.cache_clear)
+
+
+async def limited_post_trapi_query(endpoint: str, trapi_request: Dict) -> Dict:
+    """
+    POST of a TRAPI query to an endpoint, within the number of queries the
+    endpoint is currently deemed to be capable of handling concurrently.
+
+    :param endpoint: str, base url of the TRAPI service
+    :param trapi_request: Dict, TRAPI request JSON, as a Python data structure.
+    :return: Dict, as returned by post_trapi_query(), plus the 'endpoint' queried
+    """
+    limiter: AdaptiveConcurrencyLimiter = get_endpoint_limiter(endpoint)
+    started: float = await limiter.acquire()
+    status_code: Optional[int] = None
+    try:
+        response: Dict = await post_trapi_query(endpoint, trapi_request)
+        response['endpoint'] = endpoint
+        status_code = response['status_code']
+        if status_code == 200:
+            record_success(endpoint, time.monotonic() - started)
+        elif is_overloaded(status_code):
+            record_failure(endpoint)
+        return response
+    finally:
+        # a cancelled (e.g. hedged) query gives the limiter no signal
+        limiter.release(started, status_code)
+
+
+# Minimum number of latencies observed at an endpoint, before
+# its latency percentiles are trusted to decide on hedging
+MINIMUM_HEDGING_SAMPLES: int = 10
+
+
+def get_hedging_delay(endpoint: str, hedge_percentile: Optional[float]) -> Optional[float]:
+    """
+    :param endpoint: str, TRAPI endpoint url
+    :param hedge_percentile: Optional[float], percentile (0..100) of recent query latencies of the endpoint
+    :return: Optional[float], time (seconds) after which a query to the endpoint is hedged;
+                              None if hedging is disabled or latencies are not yet known.
+    """
+    if hedge_percentile is None:
+        return None
+    latency: LatencyStats = get_endpoint_limiter(endpoint).latency
+    if latency.count() < MINIMUM_HEDGING_SAMPLES:
+        return None
+    return latency.percentile(hedge_percentile)
+
+
+async def hedged_post_trapi_query(
+        primary: str,
+        backup: str,
+        trapi_request: Dict,
+        delay: float
+) -> Tuple[Dict, int]:
+    """
+    POST of a TRAPI query to a primary endpoint, hedged by sending the same query to a backup
+    endpoint if the primary hasn't answered within a given delay. The first successful answer
+    is taken, cancelling the other query.
+
+    :param primary: str, url of the primary TRAPI endpoint
+    :param backup: str, url of the backup TRAPI endpoint
+    :param trapi_request: Dict, TRAPI request JSON, as a Python data structure.
+    :param delay: float, time (seconds) after which the query is also sent to the backup
+    :return: Tuple[Dict, int], response (as from limited_post_trapi_query()) and number of endpoints queried
+    """
+    tasks: List[asyncio.Task] = [asyncio.ensure_future(limited_post_trapi_query(primary, trapi_request))]
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=delay)
+        if done:
+            return tasks[0].result(), 1
+
+        logger.debug(f"Query of '{primary}' slower than {delay:.2f} seconds: hedging with '{backup}'")
+        tasks.append(asyncio.ensure_future(limited_post_trapi_query(backup, trapi_request)))
+        pending = set(tasks)
+        response: Optional[Dict] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                response = task.result()
+                if response['status_code'] == 200:
+                    return response, 2
+        return response, 2
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def post_trapi_query_with_failover(
+        endpoints: Tuple[str, ...],
+        trapi_request: Dict,
+        hedge_percentile: Optional[float] = None,
+        endpoint_selection: Optional[str] = None
+) -> Dict:
+    """
+    POST of a TRAPI query to the first of a list of 'functionally identical' endpoints,
+    failing over to the next endpoint whenever the query times out, fails with a
+    connection error, or the endpoint is overloaded (i.e. HTTP 429 or 5xx).
+
+    :param endpoints: Tuple[str, ...], urls of functionally identical TRAPI endpoints, in order of Registry listing
+    :param trapi_request: Dict, TRAPI request JSON, as a Python data structure.
+    :param hedge_percentile: Optional[float], if set, a query not answered within this percentile (0..100)
+                             of recent query latencies of an endpoint, is also sent to the next endpoint
+    :param endpoint_selection: Optional[str], strategy for ordering the endpoints for querying, one of
+                               'registry', 'fastest' or 'weighted' (default: DEFAULT_ENDPOINT_SELECTION)
+    :return: Dict, as returned by limited_post_trapi_query(), for the last endpoint queried
+    """
+    assert endpoints, "No TRAPI endpoints to query?"
+    endpoints = order_endpoints(endpoints, endpoint_selection or DEFAULT_ENDPOINT_SELECTION)
+    response: Optional[Dict] = None
+    index: int = 0
+    while index < len(endpoints):
+        endpoint: str = endpoints[index]
+        delay: Optional[float] = get_hedging_delay(endpoint, hedge_percentile)
+        if delay is not None and index + 1 < len(endpoints):
+            response, tried = await hedged_post_trapi_query(endpoint, endpoints[index + 1], trapi_request, delay)
+        else:
+            response, tried = await limited_post_trapi_query(endpoint, trapi_request), 1
+        index += tried
+        if not is_overloaded(response['status_code']):
+            break
+        if index < len(endpoints):
+            logger.warning(
+                f"TRAPI query of '{endpoint}' failed with HTTP status {response['status_code']}: " +
+                f"failing over to '{endpoints[index]}'"
+            )
+    return response
+
+
+async def post_trapi_async_query_with_failover(
+        endpoints: Tuple[str, ...],
+        trapi_request: Dict,
+        callback_url: Optional[str] = None,
+        endpoint_selection: Optional[str] = None
+) -> Dict:
+    """
+    Asynchronous TRAPI query (see graph_validation_tests.translator.trapi.asyncquery) of the first
+    of a list of 'functionally identical' endpoints, failing over to the next endpoint whenever
+    the query times out, fails with a connection error, or the endpoint is overloaded.
+    Unlike synchronous queries, asynchronous queries are not limited by the endpoint's
+    concurrency limiter, since no connection is held open while awaiting their completion.
+
+    :param endpoints: Tuple[str, ...], urls of functionally identical TRAPI endpoints, in order of Registry listing
+    :param trapi_request: Dict, TRAPI request JSON, as a Python data structure.
+    :param callback_url: Optional[str], externally visible base url of the local callback receiver
+                                        (default: None, listen on an ephemeral port of 127.0.0.1)
+    :param endpoint_selection: Optional[str], strategy for ordering the endpoints for querying, one of
+                               'registry', 'fastest' or 'weighted' (default: DEFAULT_ENDPOINT_SELECTION)
+    :return: Dict, as returned by post_trapi_async_query(), plus the (last) 'endpoint' queried
+    """
+    assert endpoints, "No TRAPI endpoints to query?"
+    endpoints = order_endpoints(endpoints, endpoint_selection or DEFAULT_ENDPOINT_SELECTION)
+    receiver: CallbackReceiver = await get_callback_receiver(callback_url)
+    response: Optional[Dict] = None
+    for index, endpoint in enumerate(endpoints):
+        response = await post_trapi_async_query(get_http_client(), endpoint, trapi_request, receiver)
+        response['endpoint'] = endpoint
+        if not is_overloaded(response['status_code']):
+            break
+        if index + 1 < len(endpoints):
+            logger.warning(
+                f"Asynchronous TRAPI query of '{endpoint}' failed with HTTP status {response['status_code']}: " +
+                f"failing over to '{endpoints[index + 1]}'"
+            )
+    return response
 
 
 async def run_trapi_query(
@@ -265,10 +639,21 @@ async def run_trapi_query(
         component: str,
         environment: str,
         target_trapi_version: Optional[str],
-        target_biolink_version: Optional[str]
+        target_biolink_version: Optional[str],
+        retry_policy: Optional[RetryPolicy] = None,
+        attempts: Optional[List[QueryAttempt]] = None,
+        hedge_percentile: Optional[float] = None,
+        endpoint_selection: Optional[str] = None,
+        async_query: bool = False,
+        callback_url: Optional[str] = None
 ) -> Optional[Dict]:
     """
     Make a call to the TRAPI (or TRAPI-like, e.g. ARS) component, returning the result.
+    Each attempt at the call fails over across the component's functionally identical
+    endpoints. Transient failures of the call (timeouts, connection errors, 408, 429 and
+    5xx HTTP status codes) are retried, with backoff, as specified by the 'retry_policy'.
+    If 'async_query' is set, the call is made to the TRAPI /asyncquery endpoint, with
+    the TRAPI Response returned to an embedded callback receiver (see asyncquery module).
 
     :param trapi_request: Dict, TRAPI request JSON, as a Python data structure.
     :param component: str, simple identifier of a Translator component target:
@@ -277,24 +662,51 @@ async def run_trapi_query(
                                               one of 'dev', 'ci', 'test' or 'prod' (default: 'ci')
     :param target_trapi_version: Optional[str], target TRAPI version (default: latest public release)
     :param target_biolink_version: Optional[str], target Biolink Model version (default: Biolink toolkit release)
+    :param retry_policy: Optional[RetryPolicy], policy for retrying failed calls (default: RetryPolicy())
+    :param attempts: Optional[List[QueryAttempt]], if given, a record of each attempt at the call is appended here;
+                     the 'elapsed' time of an attempt includes any wait for the endpoint's concurrency limiter.
+    :param hedge_percentile: Optional[float], if set, hedge queries to a component with redundant endpoints,
+                             once a query takes longer than this percentile (0..100) of recent query latencies
+    :param endpoint_selection: Optional[str], strategy for selecting amongst redundant endpoints of a component,
+                               one of 'registry', 'fastest' or 'weighted' (default: DEFAULT_ENDPOINT_SELECTION)
+    :param async_query: bool, if True, make an asynchronous (TRAPI /asyncquery) call (default: False)
+    :param callback_url: Optional[str], externally visible base url of the callback receiver of
+                         asynchronous calls (default: None, listen on an ephemeral port of 127.0.0.1)
     :return:  Dict, TRAPI response JSON, as a Python data structure.
     """
     trapi_response: Optional[Dict] = None
-    endpoint: str = resolve_component_endpoint(
+    endpoints: Tuple[str, ...] = await resolve_component_endpoints(
         component=component,
         environment=environment,
         target_trapi_version=target_trapi_version,
         target_biolink_version=target_biolink_version
     )
-    if endpoint:
+    if endpoints:
         if component == 'ars':
+            # ARS queries fan out into the TRAPI Responses of the ARAs,
+            # see graph_validation_tests.translator.trapi.ars module
             logger.error(
-                "trapi::run_trapi_query() - GraphValidationTest does not yet support ARS TRAPI query processing!"
+                "trapi::run_trapi_query() - ARS queries are submitted and polled by the trapi.ars module!"
             )
         else:
             # Make the TRAPI call to the TestCase targeted ARS, KP or
-            # ARA resource, using the case-documented input test edge
-            trapi_response = await call_trapi(endpoint, trapi_request)
+            # ARA resource, using the case-documented input test edge.
+            # Note that endpoint concurrency limiter slots are released
+            # while waiting to retry, for use by other queries
+            async def query_endpoints() -> Dict:
+                if async_query:
+                    return await post_trapi_async_query_with_failover(
+                        endpoints, trapi_request, callback_url, endpoint_selection
+                    )
+                return await post_trapi_query_with_failover(
+                    endpoints, trapi_request, hedge_percentile, endpoint_selection
+                )
+
+            trapi_response = await call_with_retries(
+                query_endpoints,
+                policy=retry_policy if retry_policy is not None else RetryPolicy(),
+                attempts=attempts
+            )
     else:
         logger.error(
             "trapi::run_trapi_query() - GraphValidationTest could not resolve endpoint " +
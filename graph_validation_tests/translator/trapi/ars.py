@@ -0,0 +1,358 @@
+"""
+Translator ARS (Autonomous Relay System) query processing. A TRAPI query is
+submitted once to the ARS, which relays it to each of the ARAs: the TRAPI
+Responses of the ARAs are recorded by the ARS as 'child' messages of the
+submitted ('parent') query message, which are polled here concurrently,
+such that each ARA's TRAPI Response is available as soon as it completes.
+"""
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Set
+import asyncio
+
+import httpx
+
+from graph_validation_tests.translator.trapi import ARS_HOSTS, extract_ars_trapi_response, get_http_client
+
+from logging import getLogger
+logger = getLogger(__name__)
+
+# Statuses of ARS messages which will not change any further
+ARS_FINAL_STATUSES = ("Done", "Error")
+
+DEFAULT_ARS_POLL_INTERVAL: float = 5.0
+MAX_ARS_POLL_INTERVAL: float = 60.0
+DEFAULT_ARS_QUERY_TIMEOUT: float = 1800.0
+
+# Time (seconds) allowed for each ARS host to return a message, when looking up a message across ARS_HOSTS
+DEFAULT_ARS_LOOKUP_TIMEOUT: float = 30.0
+
+
+class ARSChildResult(NamedTuple):
+    """
+    Outcome of the query relayed by the ARS to one of its (ARA) actors.
+    """
+    # ARS actor name, e.g. 'ara-aragorn'
+    agent: str
+
+    # InfoRes CURIE of the actor, e.g. 'infores:aragorn' (if reported by the ARS)
+    infores: Optional[str]
+
+    # ARS message identifier ('PK') of the child message
+    pk: str
+
+    # HTTP-like status code of the query: 200 if completed, 408 if timed out, otherwise as reported by the ARS
+    status_code: int
+
+    # TRAPI Response of the actor (None unless status_code == 200)
+    trapi_response: Optional[Dict]
+
+
+def get_ars_messages_url(ars_url: str, pk: str) -> str:
+    """
+    :param ars_url: str, base url of the ARS API, e.g. 'https://ars.ci.transltr.io/ars/api/'
+    :param pk: str, ARS message identifier
+    :return: str, url of the ARS message
+    """
+    return f"{ars_url.rstrip('/')}/messages/{pk}"
+
+
+async def submit_ars_query(client: httpx.AsyncClient, ars_url: str, trapi_request: Dict) -> Dict:
+    """
+    Submits a TRAPI query to the ARS.
+
+    :param client: httpx.AsyncClient, HTTP client
+    :param ars_url: str, base url of the ARS API
+    :param trapi_request: Dict, TRAPI request JSON, as a Python data structure.
+    :return: Dict, with the HTTP 'status_code' of the submission (200 if accepted)
+                   and the 'pk' of the (parent) ARS message of the query.
+    """
+    submit_url: str = f"{ars_url.rstrip('/')}/submit"
+    try:
+        response = await client.post(submit_url, json=trapi_request)
+    except httpx.HTTPError as he:
+        logger.error(f"submit_ars_query({submit_url}) - Request POST exception: {str(he)}")
+        return {'status_code': 408, 'pk': None}
+
+    if response.status_code not in (200, 201, 202):
+        return {'status_code': response.status_code, 'pk': None}
+
+    pk: Optional[str] = None
+    try:
+        pk = response.json().get("pk")
+    except ValueError:
+        pass
+    if not pk:
+        logger.error(f"submit_ars_query({submit_url}) - ARS did not return the 'pk' of the query?")
+        return {'status_code': 500, 'pk': None}
+
+    return {'status_code': 200, 'pk': pk}
+
+
+async def get_ars_message(
+        client: httpx.AsyncClient,
+        ars_url: str,
+        pk: str,
+        trace: bool = False
+) -> Optional[Dict]:
+    """
+    Retrieves an ARS message once.
+
+    :param client: httpx.AsyncClient, HTTP client
+    :param ars_url: str, base url of the ARS API
+    :param pk: str, ARS message identifier
+    :param trace: bool, if True, retrieve the trace of a parent message, listing its child messages
+    :return: Optional[Dict], ARS message JSON; None if not (currently) available
+    """
+    message_url: str = get_ars_messages_url(ars_url, pk)
+    try:
+        response = await client.get(message_url, params={"trace": "y"} if trace else None)
+        if response.status_code == 200:
+            return response.json()
+        logger.warning(f"Retrieval of ARS message '{message_url}' returned HTTP status {response.status_code}")
+    except (httpx.HTTPError, ValueError) as error:
+        logger.warning(f"Retrieval of ARS message '{message_url}' failed: {str(error)}")
+    return None
+
+
+async def poll_ars_child(
+        client: httpx.AsyncClient,
+        ars_url: str,
+        child: Dict,
+        deadline: float,
+        poll_interval: float = DEFAULT_ARS_POLL_INTERVAL
+) -> ARSChildResult:
+    """
+    Polls a child message of an ARS query (with an increasing polling interval), until it is done.
+
+    :param client: httpx.AsyncClient, HTTP client
+    :param ars_url: str, base url of the ARS API
+    :param child: Dict, entry of the child message, from the trace of the parent ARS message
+    :param deadline: float, event loop time by which the child message is to be done
+    :param poll_interval: float, initial time (seconds) between polls of the child message
+    :return: ARSChildResult
+    """
+    pk: str = child["message"]
+    actor: Dict = child.get("actor") or dict()
+    agent: str = actor.get("agent") or pk
+    infores: Optional[str] = actor.get("inforesid")
+
+    loop = asyncio.get_running_loop()
+    while True:
+        message: Optional[Dict] = await get_ars_message(client, ars_url, pk)
+        fields: Dict = (message.get("fields") or dict()) if message else dict()
+        status: Optional[str] = fields.get("status")
+        if status in ARS_FINAL_STATUSES:
+            status_code: int = fields.get("code") or (200 if status == "Done" else 500)
+            return ARSChildResult(
+                agent=agent,
+                infores=infores,
+                pk=pk,
+                status_code=status_code,
+                trapi_response=fields.get("data") if status_code == 200 else None
+            )
+        remaining: float = deadline - loop.time()
+        if remaining <= 0.0:
+            logger.warning(f"ARS child message '{pk}' of actor '{agent}' is not done in time?")
+            return ARSChildResult(agent=agent, infores=infores, pk=pk, status_code=408, trapi_response=None)
+        await asyncio.sleep(min(poll_interval, remaining))
+        poll_interval = min(MAX_ARS_POLL_INTERVAL, poll_interval * 1.5)
+
+
+async def poll_ars_children(
+        ars_url: str,
+        pk: str,
+        timeout: float = DEFAULT_ARS_QUERY_TIMEOUT,
+        poll_interval: float = DEFAULT_ARS_POLL_INTERVAL,
+        client: Optional[httpx.AsyncClient] = None,
+        pending_children: Optional[Dict[str, Dict]] = None
+) -> AsyncIterator[ARSChildResult]:
+    """
+    Polls the child messages of a submitted ARS query concurrently, yielding the result of
+    each child as soon as it is done (i.e. in order of completion, not of submission). The
+    trace of the parent message is polled (with backoff) for new children, until it is done.
+    Children not done by the timeout are reported with a 408 status code.
+
+    :param ars_url: str, base url of the ARS API
+    :param pk: str, ARS message identifier of the submitted (parent) query
+    :param timeout: float, time (seconds) allowed for the query to complete
+    :param poll_interval: float, initial time (seconds) between polls of each message
+    :param client: Optional[httpx.AsyncClient], HTTP client (default: pooled client of the event loop)
+    :param pending_children: Optional[Dict[str, Dict]], into which the entries (from the trace of the parent
+                             message) of the children not yet yielded are recorded, indexed by child message
+                             identifier, such that the caller knows of the children still pending if it stops
+                             iterating early (e.g. when cancelled)
+    :return: AsyncIterator[ARSChildResult]
+    """
+    if client is None:
+        client = get_http_client()
+    if pending_children is None:
+        pending_children = dict()
+    loop = asyncio.get_running_loop()
+    deadline: float = loop.time() + timeout
+    interval: float = poll_interval
+    children: Dict[str, asyncio.Future] = dict()
+    yielded: Set[str] = set()
+    parent_done: bool = False
+    try:
+        while True:
+            if not parent_done:
+                trace: Optional[Dict] = await get_ars_message(client, ars_url, pk, trace=True)
+                if trace:
+                    for child in trace.get("children") or []:
+                        child_pk: Optional[str] = child.get("message")
+                        if child_pk and child_pk not in children:
+                            pending_children[child_pk] = child
+                            children[child_pk] = asyncio.ensure_future(
+                                poll_ars_child(client, ars_url, child, deadline, poll_interval)
+                            )
+                    parent_done = trace.get("status") in ARS_FINAL_STATUSES
+
+            pending: Set[asyncio.Future] = {
+                task for child_pk, task in children.items() if child_pk not in yielded
+            }
+            if parent_done and not pending:
+                return
+            remaining: float = deadline - loop.time()
+            if remaining <= 0.0:
+                if not pending:
+                    logger.warning(f"ARS query '{pk}' is not done in time?")
+                    return
+                # children time themselves out; just collect them
+                remaining = MAX_ARS_POLL_INTERVAL
+
+            if pending:
+                await asyncio.wait(pending, timeout=min(interval, remaining), return_when=asyncio.FIRST_COMPLETED)
+            else:
+                await asyncio.sleep(min(interval, remaining))
+
+            for child_pk, task in children.items():
+                if child_pk not in yielded and task.done():
+                    yielded.add(child_pk)
+                    pending_children.pop(child_pk, None)
+                    yield task.result()
+
+            interval = min(MAX_ARS_POLL_INTERVAL, interval * 1.5)
+    finally:
+        for task in children.values():
+            task.cancel()
+        await asyncio.gather(*children.values(), return_exceptions=True)
+
+
+async def get_ars_message_from_host(
+        client: httpx.AsyncClient,
+        ars_host: str,
+        pk: str,
+        timeout: float = DEFAULT_ARS_LOOKUP_TIMEOUT
+) -> Optional[Dict]:
+    """
+    Retrieves an ARS message from a given ARS host.
+
+    :param client: httpx.AsyncClient, HTTP client
+    :param ars_host: str, ARS host name, e.g. 'ars.ci.transltr.io'
+    :param pk: str, ARS message identifier
+    :param timeout: float, time (seconds) allowed for the ARS host to return the message
+    :return: Optional[Dict], ARS message JSON; None if not found on (or not returned in time by) the host
+    """
+    message_url: str = get_ars_messages_url(f"https://{ars_host}/ars/api/", pk)
+    try:
+        response = await asyncio.wait_for(
+            client.get(message_url, headers={'accept': 'application/json'}),
+            timeout=timeout
+        )
+        if response.status_code == 200:
+            return response.json()
+    except asyncio.TimeoutError:
+        logger.debug(f"Retrieval of ARS message '{message_url}' timed out after {timeout} seconds")
+    except (httpx.HTTPError, ValueError) as error:
+        logger.debug(f"Retrieval of ARS message '{message_url}' failed: {str(error)}")
+    return None
+
+
+async def lookup_ars_message(
+        pk: str,
+        hosts: Optional[List[str]] = None,
+        timeout: float = DEFAULT_ARS_LOOKUP_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None
+) -> Optional[Dict]:
+    """
+    Looks up an ARS message concurrently across ARS hosts, returning the message from the
+    first host to return it; lookups on the other hosts still in flight are then cancelled.
+
+    :param pk: str, ARS message identifier
+    :param hosts: Optional[List[str]], ARS host names (default: ARS_HOSTS)
+    :param timeout: float, time (seconds) allowed for each ARS host to return the message
+    :param client: Optional[httpx.AsyncClient], HTTP client (default: pooled client of the event loop)
+    :return: Optional[Dict], ARS message JSON; None if not found on any host
+    """
+    if client is None:
+        client = get_http_client()
+    pending: Set[asyncio.Future] = {
+        asyncio.ensure_future(get_ars_message_from_host(client, ars_host, pk, timeout))
+        for ars_host in (hosts if hosts is not None else ARS_HOSTS)
+    }
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                message: Optional[Dict] = task.result()
+                if message is not None:
+                    return message
+        return None
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def async_retrieve_ars_result(
+        response_id: str,
+        verbose: bool = False,
+        timeout: float = DEFAULT_ARS_LOOKUP_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None
+) -> Optional[Dict]:
+    """
+    Non-blocking version of graph_validation_tests.translator.trapi.retrieve_ars_result(),
+    racing the lookup of the ARS message across all ARS_HOSTS (see lookup_ars_message()).
+
+    :param response_id: str, ARS message identifier ('PK')
+    :param verbose: bool, if True, report progress of the lookup (default: False)
+    :param timeout: float, time (seconds) allowed for each ARS host to return the message
+    :param client: Optional[httpx.AsyncClient], HTTP client (default: pooled client of the event loop)
+    :return: Optional[Dict], TRAPI Response of the ARS message; None if not available
+    """
+    if verbose:
+        logger.info(f"Trying to retrieve ARS Response UUID '{response_id}'...")
+
+    response_dict: Optional[Dict] = await lookup_ars_message(response_id, timeout=timeout, client=client)
+    if response_dict is None:
+        logger.error(f"ARS PK '{response_id}' could not be retrieved from any ARS host?")
+        return None
+
+    try:
+        return extract_ars_trapi_response(response_id, response_dict)
+    except Exception as e:
+        logger.error(f"Cannot decode ARS PK '{response_id}' to a Translator Response, exception: {e}")
+        return None
+
+
+async def async_retrieve_ars_results(
+        response_ids: List[str],
+        verbose: bool = False,
+        timeout: float = DEFAULT_ARS_LOOKUP_TIMEOUT,
+        client: Optional[httpx.AsyncClient] = None
+) -> Dict[str, Optional[Dict]]:
+    """
+    Retrieves the TRAPI Responses of a batch of ARS messages, all looked up concurrently.
+
+    :param response_ids: List[str], ARS message identifiers ('PKs')
+    :param verbose: bool, if True, report progress of the lookups (default: False)
+    :param timeout: float, time (seconds) allowed for each ARS host to return a message
+    :param client: Optional[httpx.AsyncClient], HTTP client (default: pooled client of the event loop)
+    :return: Dict[str, Optional[Dict]], TRAPI Responses (None if not available), indexed by ARS message identifier
+    """
+    trapi_responses: List[Optional[Dict]] = await asyncio.gather(
+        *[
+            async_retrieve_ars_result(response_id, verbose=verbose, timeout=timeout, client=client)
+            for response_id in response_ids
+        ]
+    )
+    return dict(zip(response_ids, trapi_responses))
@@ -0,0 +1,355 @@
+"""
+Asynchronous TRAPI query execution, via the TRAPI /asyncquery endpoint,
+with TRAPI Responses returned to a lightweight embedded callback receiver
+(falling back to polling of the TRAPI /asyncquery_status endpoint).
+
+While waiting for a query to complete, no connection is held open to the
+TRAPI service, so that many long-running queries may be outstanding at once.
+"""
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+from uuid import uuid4
+import asyncio
+import json
+
+import httpx
+
+from logging import getLogger
+logger = getLogger(__name__)
+
+# Path under which the callback receiver accepts TRAPI Responses, by job identifier
+CALLBACK_PATH = "/callback/"
+
+# Default maximum size (bytes) of a TRAPI Response accepted by the callback receiver
+# (see set_max_callback_size())
+MAX_CALLBACK_SIZE: int = 256 * 1024 * 1024
+
+# Time (seconds) allowed for reading each part (request line, headers, body) of a callback request
+CALLBACK_READ_TIMEOUT: float = 60.0
+
+DEFAULT_POLL_INTERVAL: float = 10.0
+MAX_POLL_INTERVAL: float = 120.0
+DEFAULT_ASYNC_QUERY_TIMEOUT: float = 3600.0
+
+HTTP_REASONS: Dict[int, str] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    413: "Payload Too Large"
+}
+
+
+class PayloadTooLarge(ValueError):
+    pass
+
+
+async def read_http_request(
+        reader: asyncio.StreamReader,
+        max_size: Optional[int] = None,
+        timeout: Optional[float] = CALLBACK_READ_TIMEOUT
+) -> Tuple[str, str, Dict[str, str], bytes]:
+    """
+    Reads one (minimal, HTTP/1.1) request from a stream.
+
+    :param reader: asyncio.StreamReader, connection stream
+    :param max_size: Optional[int], maximum size (bytes) of the request body (default: MAX_CALLBACK_SIZE)
+    :param timeout: Optional[float], time (seconds) allowed for reading each part of the request (None: unlimited)
+    :return: Tuple[str, str, Dict[str, str], bytes], of the request method, path, headers (lower case names) and body
+    :raises: PayloadTooLarge, if the request body is larger than 'max_size'; asyncio.TimeoutError, if too slow
+    """
+    if max_size is None:
+        max_size = MAX_CALLBACK_SIZE
+    request_line: str = (await asyncio.wait_for(reader.readline(), timeout)).decode("latin-1").strip()
+    method, path, _ = request_line.split(" ", 2)
+    headers: Dict[str, str] = dict()
+    while True:
+        line: str = (await asyncio.wait_for(reader.readline(), timeout)).decode("latin-1").strip()
+        if not line:
+            break
+        name, value = line.split(":", 1)
+        headers[name.strip().lower()] = value.strip()
+    length: int = int(headers.get("content-length", "0"))
+    if length > max_size:
+        raise PayloadTooLarge(f"Request body of {length} bytes is too large!")
+    body: bytes = await asyncio.wait_for(reader.readexactly(length), timeout) if length else b""
+    return method, path, headers, body
+
+
+def set_max_callback_size(max_size: int):
+    """
+    :param max_size: int, maximum size (bytes) of a TRAPI Response accepted by callback receivers
+    """
+    global MAX_CALLBACK_SIZE
+    MAX_CALLBACK_SIZE = max_size
+
+
+async def write_http_response(writer: asyncio.StreamWriter, status_code: int, body: Optional[Dict] = None):
+    """
+    Writes one (minimal, HTTP/1.1) JSON response to a stream, then closes the stream.
+
+    :param writer: asyncio.StreamWriter, connection stream
+    :param status_code: int, HTTP status code
+    :param body: Optional[Dict], JSON content of the response (default: None, empty response)
+    """
+    content: bytes = json.dumps(body).encode("utf-8") if body is not None else b""
+    writer.write(
+        f"HTTP/1.1 {status_code} {HTTP_REASONS.get(status_code, '')}\r\n".encode("latin-1") +
+        b"Content-Type: application/json\r\n" +
+        f"Content-Length: {len(content)}\r\n".encode("latin-1") +
+        b"Connection: close\r\n\r\n" +
+        content
+    )
+    try:
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+class CallbackReceiver:
+    """
+    Lightweight embedded HTTP server receiving TRAPI Responses POSTed
+    back by TRAPI services, to the callback urls of asynchronous queries.
+    """
+    def __init__(
+            self,
+            callback_url: Optional[str] = None,
+            host: Optional[str] = None,
+            max_size: Optional[int] = None,
+            read_timeout: Optional[float] = CALLBACK_READ_TIMEOUT
+    ):
+        """
+        :param callback_url: Optional[str], (externally visible) base url of the receiver, whose port
+                             is also the port on which the receiver listens (default: None, listen on
+                             an ephemeral port, with a base url of 'http://127.0.0.1:<port>')
+        :param host: Optional[str], network interface on which the receiver listens (default: all interfaces
+                     if a 'callback_url' is given, since it is then meant to be reached by remote services;
+                     otherwise, only the loopback interface)
+        :param max_size: Optional[int], maximum size (bytes) of a TRAPI Response accepted (default: MAX_CALLBACK_SIZE)
+        :param read_timeout: Optional[float], time (seconds) allowed for reading each part of a callback request
+        """
+        self.callback_url: Optional[str] = callback_url.rstrip("/") if callback_url else None
+        self.host: str = host if host else ("0.0.0.0" if callback_url else "127.0.0.1")
+        self.max_size: Optional[int] = max_size
+        self.read_timeout: Optional[float] = read_timeout
+        self.port: int = (urlparse(callback_url).port or 0) if callback_url else 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._pending: Dict[str, asyncio.Future] = dict()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, host=self.host, port=self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if not self.callback_url:
+            self.callback_url = f"http://127.0.0.1:{self.port}"
+        logger.info(f"TRAPI callback receiver listening on port {self.port} (callback url: '{self.callback_url}')")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+
+    def is_running(self) -> bool:
+        return self._server is not None
+
+    def get_callback_url(self, job_id: str) -> str:
+        """
+        :param job_id: str, (local) identifier of an asynchronous query
+        :return: str, callback url to which the TRAPI Response of the query is to be POSTed
+        """
+        return f"{self.callback_url}{CALLBACK_PATH}{job_id}"
+
+    def register(self, job_id: str) -> asyncio.Future:
+        """
+        :param job_id: str, (local) identifier of an asynchronous query
+        :return: asyncio.Future, resolved with the TRAPI Response of the query, once received
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending[job_id] = future
+        return future
+
+    def unregister(self, job_id: str):
+        self._pending.pop(job_id, None)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            method, path, headers, body = await read_http_request(reader, self.max_size, self.read_timeout)
+        except PayloadTooLarge as error:
+            logger.warning(f"Rejected TRAPI callback request: {str(error)}")
+            await write_http_response(writer, 413)
+            return
+        except asyncio.TimeoutError:
+            logger.warning("TRAPI callback request not received within the read timeout?")
+            await write_http_response(writer, 408)
+            return
+        except (ValueError, asyncio.IncompleteReadError) as error:
+            logger.warning(f"Invalid TRAPI callback request: {str(error)}")
+            await write_http_response(writer, 400)
+            return
+
+        if method != "POST":
+            await write_http_response(writer, 405)
+            return
+
+        job_id: str = path[len(CALLBACK_PATH):] if path.startswith(CALLBACK_PATH) else ""
+        future: Optional[asyncio.Future] = self._pending.get(job_id)
+        if future is None:
+            logger.warning(f"TRAPI callback received for unknown job '{job_id}'?")
+            await write_http_response(writer, 404)
+            return
+
+        try:
+            trapi_response: Dict = json.loads(body)
+        except ValueError:
+            await write_http_response(writer, 400)
+            return
+
+        if not future.done():
+            future.set_result(trapi_response)
+        await write_http_response(writer, 200)
+
+
+# Callback receiver shared by all asynchronous TRAPI queries
+# run within a given event loop (see get_callback_receiver())
+_callback_receiver: Optional[CallbackReceiver] = None
+_callback_receiver_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_callback_receiver(callback_url: Optional[str] = None) -> CallbackReceiver:
+    """
+    Returns the callback receiver of the currently running event loop, started on first use.
+
+    :param callback_url: Optional[str], (externally visible) base url of the receiver
+                         (only used when the receiver is first started; see CallbackReceiver)
+    :return: CallbackReceiver
+    """
+    global _callback_receiver, _callback_receiver_loop
+    loop = asyncio.get_running_loop()
+    if _callback_receiver is None or not _callback_receiver.is_running() or _callback_receiver_loop is not loop:
+        _callback_receiver = CallbackReceiver(callback_url=callback_url)
+        await _callback_receiver.start()
+        _callback_receiver_loop = loop
+    return _callback_receiver
+
+
+async def stop_callback_receiver():
+    """
+    Stops the callback receiver, if running.
+    """
+    global _callback_receiver, _callback_receiver_loop
+    if _callback_receiver is not None:
+        await _callback_receiver.stop()
+        _callback_receiver = None
+        _callback_receiver_loop = None
+
+
+async def poll_async_query_status(
+        client: httpx.AsyncClient,
+        endpoint: str,
+        remote_job_id: str
+) -> Optional[Dict]:
+    """
+    Polls the TRAPI /asyncquery_status of an asynchronous query once,
+    retrieving the TRAPI Response of the query if it has completed.
+
+    :param client: httpx.AsyncClient, HTTP client
+    :param endpoint: str, base url of the TRAPI service
+    :param remote_job_id: str, 'job_id' returned by the TRAPI service on submission of the query
+    :return: Optional[Dict], with the HTTP 'status_code' and TRAPI 'response_json'
+                             once the query is finished; None if still running
+    """
+    status_url: str = f"{endpoint.rstrip('/')}/asyncquery_status/{remote_job_id}"
+    try:
+        response = await client.get(status_url)
+        if response.status_code != 200:
+            logger.warning(f"Polling of '{status_url}' returned HTTP status {response.status_code}")
+            return None
+        status: Dict = response.json()
+        if status.get("status") == "Failed":
+            logger.error(f"Asynchronous TRAPI query '{status_url}' failed: {status.get('description')}")
+            return {'status_code': 500, 'response_json': None}
+        if status.get("status") == "Completed" and status.get("response_url"):
+            response = await client.get(status["response_url"])
+            return {
+                'status_code': response.status_code,
+                'response_json': response.json() if response.status_code == 200 else None
+            }
+    except (httpx.HTTPError, ValueError) as error:
+        logger.warning(f"Polling of '{status_url}' failed: {str(error)}")
+    return None
+
+
+async def post_trapi_async_query(
+        client: httpx.AsyncClient,
+        endpoint: str,
+        trapi_request: Dict,
+        receiver: CallbackReceiver,
+        timeout: float = DEFAULT_ASYNC_QUERY_TIMEOUT,
+        poll_interval: float = DEFAULT_POLL_INTERVAL
+) -> Dict:
+    """
+    Submits a TRAPI query to the /asyncquery endpoint at a given url, then awaits its TRAPI
+    Response, either POSTed back to the callback receiver or retrieved by polling the
+    /asyncquery_status endpoint (with an increasing polling interval).
+
+    :param client: httpx.AsyncClient, HTTP client
+    :param endpoint: str, base url of the TRAPI service
+    :param trapi_request: Dict, TRAPI request JSON, as a Python data structure.
+    :param receiver: CallbackReceiver, receiver of the TRAPI Response
+    :param timeout: float, time (seconds) allowed for the query to complete
+    :param poll_interval: float, initial time (seconds) between polls of the query status
+    :return: Dict, with the HTTP 'status_code', TRAPI 'response_json' (None unless status_code == 200)
+                   and 'retry_after' header value, as for graph_validation_tests.translator.trapi.post_trapi_query()
+    """
+    job_id: str = uuid4().hex
+    callback: asyncio.Future = receiver.register(job_id)
+    try:
+        query_url: str = f"{endpoint.rstrip('/')}/asyncquery"
+        try:
+            response = await client.post(
+                query_url,
+                json=dict(trapi_request, callback=receiver.get_callback_url(job_id))
+            )
+        except httpx.HTTPError as he:
+            logger.error(f"post_trapi_async_query({query_url}) - Request POST exception: {str(he)}")
+            return {'status_code': 408, 'response_json': None, 'retry_after': None}
+        if response.status_code != 200:
+            return {
+                'status_code': response.status_code,
+                'response_json': None,
+                'retry_after': response.headers.get('Retry-After')
+            }
+
+        remote_job_id: Optional[str] = None
+        try:
+            remote_job_id = response.json().get("job_id")
+        except ValueError:
+            pass
+
+        loop = asyncio.get_running_loop()
+        deadline: float = loop.time() + timeout
+        while loop.time() < deadline:
+            try:
+                trapi_response: Dict = await asyncio.wait_for(
+                    asyncio.shield(callback),
+                    timeout=min(poll_interval, deadline - loop.time())
+                )
+                return {'status_code': 200, 'response_json': trapi_response, 'retry_after': None}
+            except asyncio.TimeoutError:
+                pass
+            if remote_job_id:
+                result: Optional[Dict] = await poll_async_query_status(client, endpoint, remote_job_id)
+                if result is not None:
+                    result['retry_after'] = None
+                    return result
+            poll_interval = min(MAX_POLL_INTERVAL, poll_interval * 1.5)
+
+        logger.error(f"post_trapi_async_query({query_url}) - no TRAPI Response within {timeout} seconds?")
+        return {'status_code': 408, 'response_json': None, 'retry_after': None}
+    finally:
+        receiver.unregister(job_id)
+        callback.cancel()
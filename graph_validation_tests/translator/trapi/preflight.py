@@ -0,0 +1,112 @@
+"""
+Pre-flight stage of a run of tests: the endpoints of all the components to be tested are resolved
+concurrently - and pooled connections opened to them - before any TestCase is run, such that the
+cost of endpoint resolution (Translator SmartAPI Registry access and endpoint liveness probes)
+is neither repeated by concurrently running TestCases, nor counted in their query latencies.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import asyncio
+import time
+
+import httpx
+
+from graph_validation_tests.translator.registry import get_the_registry_data
+from graph_validation_tests.translator.trapi import get_http_client, resolve_component_endpoints
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Time (seconds) allowed for opening a connection to an endpoint, while warming up
+WARM_UP_TIMEOUT: float = 10.0
+
+
+class ComponentResolution(NamedTuple):
+    component: str
+    endpoints: Tuple[str, ...]
+    # time (seconds) taken to resolve the endpoints of the component
+    elapsed: float
+
+
+async def resolve_component(
+        component: str,
+        environment: Optional[str],
+        target_trapi_version: Optional[str],
+        target_biolink_version: Optional[str]
+) -> ComponentResolution:
+    """
+    Resolves the endpoints of a component (without blocking the event loop).
+
+    :param component: str, component to be queried
+    :param environment: Optional[str], target Translator execution environment of the component
+    :param target_trapi_version: Optional[str], target TRAPI version
+    :param target_biolink_version: Optional[str], target Biolink Model version
+    :return: ComponentResolution, the (possibly empty) endpoints of the component, with the time taken to resolve them
+    """
+    started: float = time.monotonic()
+    endpoints: Tuple[str, ...] = await resolve_component_endpoints(
+        component=component,
+        environment=environment,
+        target_trapi_version=target_trapi_version,
+        target_biolink_version=target_biolink_version
+    )
+    return ComponentResolution(component, endpoints, time.monotonic() - started)
+
+
+async def warm_up_endpoint(endpoint: str) -> bool:
+    """
+    Opens a (pooled) connection to an endpoint, by a lightweight HTTP request to its base url.
+
+    :param endpoint: str, TRAPI endpoint url
+    :return: bool, True if the endpoint answered (whatever its HTTP status)
+    """
+    try:
+        await get_http_client().head(endpoint, timeout=WARM_UP_TIMEOUT)
+        return True
+    except httpx.HTTPError as he:
+        logger.warning(f"warm_up_endpoint({endpoint}): {str(he)}")
+        return False
+
+
+async def preflight_components(
+        components: Iterable[str],
+        environment: Optional[str],
+        target_trapi_version: Optional[str],
+        target_biolink_version: Optional[str],
+        warm_up: bool = True
+) -> Dict[str, ComponentResolution]:
+    """
+    Resolves the endpoints of all the components concurrently, then opens
+    pooled connections to all their (distinct) endpoints, concurrently.
+
+    :param components: Iterable[str], components to be tested
+    :param environment: Optional[str], target Translator execution environment of the components
+    :param target_trapi_version: Optional[str], target TRAPI version
+    :param target_biolink_version: Optional[str], target Biolink Model version
+    :param warm_up: bool, if True, open pooled connections to the endpoints resolved (default: True)
+    :return: Dict[str, ComponentResolution], resolutions of the endpoints, indexed by component
+    """
+    components = list(dict.fromkeys(components))
+    if any(component != 'ars' for component in components):
+        # the Registry is read once, before - rather than by each of - the concurrent resolutions
+        await asyncio.to_thread(get_the_registry_data)
+
+    resolutions: List[ComponentResolution] = await asyncio.gather(
+        *[
+            resolve_component(component, environment, target_trapi_version, target_biolink_version)
+            for component in components
+        ]
+    )
+    for resolution in resolutions:
+        if not resolution.endpoints:
+            logger.error(
+                f"Pre-flight: component '{resolution.component}' could not be resolved " +
+                f"in environment '{environment}': its test cases will not be run!"
+            )
+
+    if warm_up:
+        endpoints: List[str] = list(
+            dict.fromkeys(endpoint for resolution in resolutions for endpoint in resolution.endpoints)
+        )
+        await asyncio.gather(*[warm_up_endpoint(endpoint) for endpoint in endpoints])
+
+    return {resolution.component: resolution for resolution in resolutions}
@@ -0,0 +1,81 @@
+"""
+Streaming access to stored TRAPI Responses, held in a directory
+(recursively) or in a tar (optionally compressed) or zip archive.
+"""
+from typing import Dict, Iterator, Optional, Tuple
+from os import walk
+from os.path import isdir, isfile, join, relpath
+import gzip
+import json
+import tarfile
+import zipfile
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Suffixes of the file names of stored TRAPI Responses
+RESPONSE_FILE_SUFFIXES = (".json", ".json.gz")
+
+
+def is_response_file(name: str) -> bool:
+    """
+    :param name: str, file name (or path)
+    :return: bool, True if the file name denotes a stored TRAPI Response
+    """
+    return name.lower().endswith(RESPONSE_FILE_SUFFIXES)
+
+
+def iter_archived_files(source: str) -> Iterator[Tuple[str, bytes]]:
+    """
+    Iterates over the stored TRAPI Response files of a directory or archive, one at a time,
+    such that arbitrarily large archives may be processed within a bounded amount of memory.
+
+    :param source: str, path to a directory, a tar (.tar, .tar.gz, etc.) or a zip archive
+    :return: Iterator[Tuple[str, bytes]], of the name (relative to the source) and raw content of each file
+    """
+    if isdir(source):
+        for root, dirs, files in walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if is_response_file(name):
+                    path: str = join(root, name)
+                    with open(path, "rb") as response_file:
+                        yield relpath(path, source), response_file.read()
+
+    elif isfile(source) and tarfile.is_tarfile(source):
+        # streaming mode, reading the (possibly compressed) tar archive sequentially
+        with tarfile.open(source, mode="r|*") as archive:
+            for member in archive:
+                if member.isfile() and is_response_file(member.name):
+                    yield member.name, archive.extractfile(member).read()
+
+    elif isfile(source) and zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for name in archive.namelist():
+                if not name.endswith("/") and is_response_file(name):
+                    yield name, archive.read(name)
+
+    else:
+        raise ValueError(f"'{source}' is neither a directory nor a tar or zip archive?")
+
+
+def load_archived_response(name: str, content: bytes) -> Optional[Dict]:
+    """
+    Decodes a stored TRAPI Response. Stored ARS messages are unwrapped to their TRAPI Response.
+
+    :param name: str, name of the file
+    :param content: bytes, raw content of the file (gzip compressed if the name ends with '.gz')
+    :return: Optional[Dict], TRAPI Response; None if the content is not a (wrapped) TRAPI Response
+    """
+    if name.lower().endswith(".gz"):
+        content = gzip.decompress(content)
+    response: Dict = json.loads(content)
+    if not isinstance(response, dict):
+        return None
+    if "message" not in response and isinstance(response.get("fields"), dict):
+        # ARS message, as retrieved from the ARS 'messages' API
+        response = response["fields"].get("data")
+    if not isinstance(response, dict) or "message" not in response:
+        logger.warning(f"Stored file '{name}' is not a TRAPI Response?")
+        return None
+    return response
@@ -0,0 +1,54 @@
+"""
+Wall-clock time budget of a run of tests
+"""
+from typing import Optional
+import time
+
+
+class RunBudget:
+    """
+    Wall-clock time budget, started when created, shared by the test cases
+    of one or more test runs. Test cases check the budget cooperatively: no
+    new test cases are started once the budget is exhausted, and test case
+    deadlines are capped by the time remaining in the budget.
+    """
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        :param seconds: Optional[float], time budget (seconds) of the run (default: None, unlimited)
+        """
+        assert seconds is None or seconds > 0, "RunBudget must be positive!"
+        self.seconds: Optional[float] = seconds
+        self.started: float = time.monotonic()
+
+    def elapsed(self) -> float:
+        """
+        :return: float, time (seconds) elapsed since the start of the run
+        """
+        return time.monotonic() - self.started
+
+    def remaining(self) -> Optional[float]:
+        """
+        :return: Optional[float], time (seconds) remaining in the budget; None if unlimited
+        """
+        if self.seconds is None:
+            return None
+        return max(0.0, self.seconds - self.elapsed())
+
+    def is_exhausted(self) -> bool:
+        """
+        :return: bool, True if no time remains in the budget
+        """
+        remaining: Optional[float] = self.remaining()
+        return remaining is not None and remaining <= 0.0
+
+    def get_timeout(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        :param timeout: Optional[float], time (seconds) allowed for a given task (default: None, unlimited)
+        :return: Optional[float], the task timeout capped by the time remaining in the budget; None if unlimited
+        """
+        remaining: Optional[float] = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
@@ -0,0 +1,214 @@
+"""
+Memoization of (synchronous or asynchronous) functions, with bounded size, time-to-live of
+cached results - with a distinct, generally shorter, time-to-live of 'negative' (i.e. None
+or empty) results - and 'single-flight' semantics: concurrent calls of a function with the
+same arguments, on a cold cache, share a single evaluation of the function. This suits
+long-running applications, in which results (e.g. Translator SmartAPI Registry endpoint
+resolutions) may change and failed lookups ought to be retried, rather than cached forever.
+"""
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+from collections import OrderedDict
+from functools import wraps
+import asyncio
+import threading
+import time
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Default time-to-live (seconds) of cached results
+DEFAULT_TTL: Optional[float] = 3600.0
+
+# Default time-to-live (seconds) of cached 'negative' (i.e. None or empty) results
+DEFAULT_NEGATIVE_TTL: Optional[float] = 60.0
+
+DEFAULT_MAXSIZE: int = 1024
+
+
+def is_negative(value: Any) -> bool:
+    """
+    :param value: Any, result of a function
+    :return: bool, True if the result is None or empty (e.g. an empty tuple of endpoints)
+    """
+    if value is None:
+        return True
+    try:
+        return len(value) == 0
+    except TypeError:
+        return False
+
+
+class TTLCache:
+    """
+    Bounded cache of values, evicting its least recently used value when full, and
+    expiring each value after a time-to-live, which is 'negative_ttl' for 'negative'
+    values (see is_negative()) and 'ttl' for other values. A time-to-live of None
+    means that values never expire. Each clear() starts a new 'generation' of the cache:
+    values computed by loads started in an earlier generation are not stored, lest they be stale.
+    """
+    def __init__(
+            self,
+            maxsize: int = DEFAULT_MAXSIZE,
+            ttl: Optional[float] = DEFAULT_TTL,
+            negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param maxsize: int, maximum number of values cached
+        :param ttl: Optional[float], time-to-live (seconds) of values (default: DEFAULT_TTL)
+        :param negative_ttl: Optional[float], time-to-live (seconds) of 'negative' values (default: DEFAULT_NEGATIVE_TTL)
+        :param clock: Callable[[], float], source of the current time (seconds)
+        """
+        self.maxsize: int = maxsize
+        self.ttl: Optional[float] = ttl
+        self.negative_ttl: Optional[float] = negative_ttl
+        self.clock: Callable[[], float] = clock
+        self.hits: int = 0
+        self.misses: int = 0
+        self.generation: int = 0
+        # values, with their expiry time (None if they never expire), in order of use
+        self._values: OrderedDict[Hashable, Tuple[Any, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        :param key: Hashable, key of the value
+        :return: Tuple[bool, Any], True with the cached value, if cached and not expired; False, None otherwise
+        """
+        with self._lock:
+            entry: Optional[Tuple[Any, Optional[float]]] = self._values.get(key)
+            if entry is not None:
+                value, expiry = entry
+                if expiry is None or expiry > self.clock():
+                    self._values.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._values[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None):
+        """
+        :param key: Hashable, key of the value
+        :param value: Any, value to be cached
+        :param generation: Optional[int], generation of the cache when the value started
+                           to be computed; the value is not stored if the cache was since
+                           cleared (default: None, the value is stored unconditionally)
+        """
+        ttl: Optional[float] = self.negative_ttl if is_negative(value) else self.ttl
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._values[key] = (value, self.clock() + ttl if ttl is not None else None)
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+    def clear(self):
+        """
+        Discards all the cached values, starting a new generation of the cache.
+        The 'hits' and 'misses' statistics are cumulative, hence kept.
+        """
+        with self._lock:
+            self._values.clear()
+            self.generation += 1
+
+    def info(self) -> Dict[str, Any]:
+        """
+        :return: Dict[str, Any], number of cache 'hits' and 'misses', with the current and maximum 'size'
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._values), "maxsize": self.maxsize}
+
+
+def _make_key(args: Tuple, kwargs: Dict[str, Any]) -> Hashable:
+    return args + tuple(sorted(kwargs.items())) if kwargs else args
+
+
+def ttl_cache(
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: Optional[float] = DEFAULT_TTL,
+        negative_ttl: Optional[float] = DEFAULT_NEGATIVE_TTL
+) -> Callable[[Callable], Callable]:
+    """
+    Decorator memoizing a synchronous or asynchronous (coroutine) function in a TTLCache,
+    as a TTL-bounded, single-flight, replacement of functools.lru_cache(). As with lru_cache,
+    the arguments of the function must be hashable, and the decorated function has
+    'cache_clear()' and 'cache_info()' methods.
+
+    :param maxsize: int, maximum number of results cached
+    :param ttl: Optional[float], time-to-live (seconds) of results (None: results never expire)
+    :param negative_ttl: Optional[float], time-to-live (seconds) of 'negative' (None or empty) results
+    :return: Callable[[Callable], Callable], decorator
+    """
+    def decorator(function: Callable) -> Callable:
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl, negative_ttl=negative_ttl)
+
+        if asyncio.iscoroutinefunction(function):
+            # evaluations in flight, awaited by the concurrent calls with the same arguments
+            pending: Dict[Hashable, asyncio.Future] = dict()
+
+            @wraps(function)
+            async def async_wrapper(*args, **kwargs):
+                key: Hashable = _make_key(args, kwargs)
+                while True:
+                    found, value = cache.get(key)
+                    if found:
+                        return value
+                    flight: Optional[asyncio.Future] = pending.get(key)
+                    if flight is None or flight.get_loop() is not asyncio.get_running_loop():
+                        break
+                    # on failure of the evaluation in flight, the function is evaluated again
+                    await asyncio.wait([flight])
+
+                flight = asyncio.get_running_loop().create_future()
+                pending[key] = flight
+                generation: int = cache.generation
+                try:
+                    value = await function(*args, **kwargs)
+                    cache.put(key, value, generation=generation)
+                    return value
+                finally:
+                    if pending.get(key) is flight:
+                        del pending[key]
+                    flight.set_result(None)
+
+            wrapper = async_wrapper
+
+        else:
+            # evaluations in flight, awaited by the concurrent calls (threads) with the same arguments
+            in_flight: Dict[Hashable, threading.Event] = dict()
+            in_flight_lock = threading.Lock()
+
+            @wraps(function)
+            def sync_wrapper(*args, **kwargs):
+                key: Hashable = _make_key(args, kwargs)
+                while True:
+                    found, value = cache.get(key)
+                    if found:
+                        return value
+                    with in_flight_lock:
+                        event: Optional[threading.Event] = in_flight.get(key)
+                        if event is None:
+                            event = threading.Event()
+                            in_flight[key] = event
+                            break
+                    # on failure of the evaluation in flight, the function is evaluated again
+                    event.wait()
+
+                generation: int = cache.generation
+                try:
+                    value = function(*args, **kwargs)
+                    cache.put(key, value, generation=generation)
+                    return value
+                finally:
+                    with in_flight_lock:
+                        del in_flight[key]
+                    event.set()
+
+            wrapper = sync_wrapper
+
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_info = cache.info
+        return wrapper
+
+    return decorator
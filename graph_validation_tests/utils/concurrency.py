@@ -0,0 +1,153 @@
+"""
+Adaptive (AIMD) concurrency control of requests to remote endpoints
+"""
+from typing import Deque, Optional
+from collections import deque
+import asyncio
+import time
+
+import logging
+logger = logging.getLogger(__name__)
+
+# HTTP status codes taken as a signal that an endpoint is overloaded;
+# note that TRAPI query timeouts and connection failures are reported
+# as status code 408 by graph_validation_tests.translator.trapi
+OVERLOAD_STATUS_CODES = (408, 429)
+
+
+def is_overloaded(status_code: Optional[int]) -> bool:
+    """
+    :param status_code: Optional[int], HTTP status code of a completed request
+    :return: bool, True if the status code signals an overloaded (or failing) endpoint
+    """
+    return status_code is not None and (status_code in OVERLOAD_STATUS_CODES or status_code >= 500)
+
+
+class LatencyStats:
+    """
+    Rolling window of request latencies (in seconds).
+    """
+    def __init__(self, window: int = 50):
+        """
+        :param window: int, maximum number of (most recent) latency samples kept
+        """
+        self.samples: Deque[float] = deque(maxlen=window)
+
+    def add(self, latency: float):
+        self.samples.append(latency)
+
+    def count(self) -> int:
+        return len(self.samples)
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        :param percent: float, percentile (0..100) of the latency distribution
+        :return: Optional[float], latency (seconds) at the given percentile; None if no samples yet
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index: int = min(len(ordered) - 1, int(round(percent / 100.0 * (len(ordered) - 1))))
+        return ordered[index]
+
+    def median(self) -> Optional[float]:
+        return self.percentile(50)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Limits the number of requests concurrently in flight to an endpoint, using an additive increase,
+    multiplicative decrease (AIMD) window: the window grows by about one request per window's worth of
+    successful requests whose latency remains close to the recent median latency, but shrinks by
+    'decrease_factor' when requests time out, fail with a 5xx error or are throttled (HTTP 429).
+    """
+    def __init__(
+            self,
+            initial_limit: int = 4,
+            min_limit: int = 1,
+            max_limit: int = 32,
+            decrease_factor: float = 0.5,
+            latency_tolerance: float = 2.0,
+            window: int = 50
+    ):
+        """
+        :param initial_limit: int, initial number of requests allowed in flight
+        :param min_limit: int, lower bound of the number of requests allowed in flight
+        :param max_limit: int, upper bound of the number of requests allowed in flight
+        :param decrease_factor: float, multiplicative decrease of the window when the endpoint is overloaded
+        :param latency_tolerance: float, a request latency within this multiple of
+                                  the recent median latency, is deemed to be 'stable'
+        :param window: int, number of recent request latencies tracked
+        """
+        assert 0 < min_limit <= initial_limit <= max_limit
+        assert 0.0 < decrease_factor < 1.0
+        self.limit: float = float(initial_limit)
+        self.min_limit: int = min_limit
+        self.max_limit: int = max_limit
+        self.decrease_factor: float = decrease_factor
+        self.latency_tolerance: float = latency_tolerance
+        self.latency: LatencyStats = LatencyStats(window=window)
+        self.in_flight: int = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease: float = 0.0
+
+    def get_limit(self) -> int:
+        """
+        :return: int, current number of requests allowed in flight
+        """
+        return max(self.min_limit, int(self.limit))
+
+    def _wake_waiters(self):
+        while self._waiters and self.in_flight < self.get_limit():
+            waiter: asyncio.Future = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def acquire(self) -> float:
+        """
+        Waits until another request may be sent to the endpoint.
+
+        :return: float, (monotonic) start time of the request, to be given back to release()
+        """
+        if not self._waiters and self.in_flight < self.get_limit():
+            self.in_flight += 1
+        else:
+            waiter: asyncio.Future = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # a slot was already handed over: pass it on
+                    self.in_flight -= 1
+                    self._wake_waiters()
+                elif waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                raise
+        return time.monotonic()
+
+    def release(self, started: float, status_code: Optional[int] = None):
+        """
+        Signals completion of a request, adapting the window to the outcome.
+
+        :param started: float, request start time, as returned by acquire()
+        :param status_code: Optional[int], HTTP status code of the request;
+                            None if the request was abandoned (i.e. no signal)
+        """
+        self.in_flight -= 1
+        if status_code is not None:
+            if is_overloaded(status_code):
+                # Only decrease once per window of requests: requests sent
+                # before the last decrease can't tell us anything new.
+                if started >= self._last_decrease:
+                    self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                    self._last_decrease = time.monotonic()
+                    logger.debug(f"Endpoint overloaded (status {status_code}): window cut to {self.get_limit()}")
+            else:
+                latency: float = time.monotonic() - started
+                baseline: Optional[float] = self.latency.median()
+                self.latency.add(latency)
+                if baseline is None or latency <= self.latency_tolerance * baseline:
+                    self.limit = min(float(self.max_limit), self.limit + 1.0 / self.get_limit())
+        self._wake_waiters()
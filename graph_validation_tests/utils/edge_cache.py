@@ -0,0 +1,140 @@
+"""
+Incremental, edge-level validation of TRAPI Response knowledge graphs. The validation messages
+of each knowledge graph edge are cached (see ValidationCache) under a hash of the edge content,
+its subject and object node categories and the versions and settings of the validation, such that
+only new or changed edges of a TRAPI Response are validated again, run after run. The cached messages
+of all the edges of a knowledge graph are looked up at once, and those of its newly validated edges
+cached at once, rather than edge by edge.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from reasoner_validator.message import MESSAGES_BY_TARGET, MESSAGE_CATALOG
+from reasoner_validator.report import TRAPIGraphType
+
+from graph_validation_tests.utils.validation_cache import ValidationCache, digest, validation_key
+from graph_validation_tests.utils.validation_memo import MemoizingValidator
+from graph_validation_tests.utils.validation_pool import VALIDATOR_SETTINGS
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class EdgeCachingValidator(MemoizingValidator):
+    """
+    MemoizingValidator reusing the cached validation messages of
+    knowledge graph edges already validated (given an 'edge_cache').
+    """
+    # Cache of the validation messages of knowledge graph edges (default: None, validate all edges)
+    edge_cache: Optional[ValidationCache] = None
+
+    # While validating a knowledge graph: its edges, their validation keys (indexed by edge object
+    # identity), the validation messages of the edges already validated (indexed by validation key),
+    # and the validation messages of the newly validated edges, to be cached once the graph is validated
+    _graph_edges: Optional[Dict[str, Dict]] = None
+    _edge_keys: Optional[Dict[int, str]] = None
+    _edge_messages: Optional[Dict[str, MESSAGE_CATALOG]] = None
+    _new_edge_messages: Optional[List[Tuple[str, MESSAGE_CATALOG]]] = None
+
+    def get_edge_validation_key(self, edge: Dict) -> str:
+        """
+        :param edge: Dict, knowledge graph edge
+        :return: str, key of the validation messages of the edge in the edge cache
+        """
+        # The validation of an edge also depends on whether - and with which
+        # categories - its subject and object nodes are in the knowledge graph
+        nodes: List = [
+            [node_id in self.nodes, self.get_node_categories(node_id=node_id)]
+            for node_id in (edge.get('subject'), edge.get('object'))
+        ]
+        return validation_key(
+            fingerprint=digest([edge, nodes]),
+            validation="knowledge_graph.edge",
+            trapi_version=self.trapi_version,
+            biolink_version=self.biolink_version,
+            settings={name: getattr(self, name) for name in VALIDATOR_SETTINGS}
+        )
+
+    def check_biolink_model_compliance(self, graph: Dict, graph_type: TRAPIGraphType):
+        """
+        Validate a TRAPI-schema compliant Message graph-like data structure, looking up (then caching)
+        the validation messages of all the edges of a knowledge graph in a single batch.
+
+        :param graph: Dict, knowledge graph to be validated
+        :param graph_type: TRAPIGraphType, component type of TRAPI graph to be validated
+        """
+        if self.edge_cache is None or graph_type is not TRAPIGraphType.Knowledge_Graph:
+            super().check_biolink_model_compliance(graph, graph_type)
+            return
+        # the edges are looked up once the nodes of the graph are known (see set_nodes())
+        self._graph_edges = (graph.get('edges') or dict()) if graph else dict()
+        self._edge_keys = None
+        self._edge_messages = dict()
+        self._new_edge_messages = list()
+        try:
+            super().check_biolink_model_compliance(graph, graph_type)
+            self.edge_cache.put_many(self._new_edge_messages)
+        finally:
+            self._graph_edges = None
+            self._edge_keys = None
+            self._edge_messages = None
+            self._new_edge_messages = None
+
+    def set_nodes(self, nodes: Dict):
+        """
+        Records the nodes of a graph, then (while validating a knowledge graph
+        with an edge cache) looks up the cached validations of all its edges.
+
+        :param nodes: Dict, node_id indexed node categories
+        """
+        super().set_nodes(nodes)
+        if self._graph_edges is not None and self._edge_keys is None:
+            self._edge_keys = {id(edge): self.get_edge_validation_key(edge) for edge in self._graph_edges.values()}
+            self._edge_messages = self.edge_cache.get_many(self._edge_keys.values())
+
+    def validate_graph_edge(self, edge: Dict, graph_type: TRAPIGraphType):
+        """
+        Validate slot properties of a relationship ('biolink:Association') edge,
+        unless the (knowledge graph) edge was already validated, in which
+        case its cached validation messages are reported instead.
+
+        :param edge: Dict[str, str], dictionary of slot properties of the edge.
+        :param graph_type: TRAPIGraphType, type of TRAPI component being validated
+        """
+        if self.edge_cache is None or graph_type is not TRAPIGraphType.Knowledge_Graph:
+            super().validate_graph_edge(edge, graph_type)
+            return
+
+        key: Optional[str] = self._edge_keys.get(id(edge)) if self._edge_keys is not None else None
+        edge_messages: Optional[MESSAGE_CATALOG]
+        if key is not None:
+            edge_messages = self._edge_messages.get(key)
+        else:
+            # an edge validated by itself, outside of a knowledge graph
+            key = self.get_edge_validation_key(edge)
+            edge_messages = self.edge_cache.get(key)
+        if edge_messages is not None:
+            # replays the node usage counts of the edge, needed to detect dangling nodes
+            for node_id in (edge.get('subject'), edge.get('object')):
+                if node_id in self.nodes:
+                    self.count_node(node_id=node_id)
+        else:
+            # the messages of the edge are captured apart, to be cached by themselves
+            messages: MESSAGES_BY_TARGET = self.messages
+            self.messages = dict()
+            try:
+                super().validate_graph_edge(edge, graph_type)
+                edge_messages = {
+                    message_type: coded_messages
+                    for message_type, coded_messages in self.get_messages_by_test().items() if coded_messages
+                }
+                if self._new_edge_messages is not None:
+                    # duplicate edges of the knowledge graph are only validated once
+                    self._edge_messages[key] = edge_messages
+                    self._new_edge_messages.append((key, edge_messages))
+                else:
+                    self.edge_cache.put(key, edge_messages)
+            finally:
+                self.messages = messages
+
+        if edge_messages:
+            self.add_messages({self.default_target: {self.default_test: edge_messages}})
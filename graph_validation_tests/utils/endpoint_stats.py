@@ -0,0 +1,160 @@
+"""
+Rolling latency and health statistics of (functionally identical) TRAPI
+server urls, used to select the server(s) to which queries are sent.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import threading
+
+from graph_validation_tests.utils.concurrency import LatencyStats
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Strategies for selecting which of a component's servers is queried first:
+#   'registry' - first healthy server, in order of Registry listing
+#   'fastest'  - healthy server with the lowest median latency
+#   'weighted' - healthy servers in (smooth) weighted round-robin, weighted by inverse median latency
+ENDPOINT_SELECTION_STRATEGIES = ("registry", "fastest", "weighted")
+DEFAULT_ENDPOINT_SELECTION: str = "weighted"
+
+# Number of consecutive failures after which a server is deemed unhealthy
+# (unhealthy servers remain available, last in order, for failover)
+UNHEALTHY_FAILURES: int = 3
+
+
+class EndpointStats:
+    """
+    Latency and health statistics of one server url, from probes and queries.
+    """
+    def __init__(self, window: int = 50):
+        """
+        :param window: int, number of recent latencies tracked
+        """
+        self.latency: LatencyStats = LatencyStats(window=window)
+        self.consecutive_failures: int = 0
+        self.selected: int = 0
+        # state of smooth weighted round-robin selection
+        self.current_weight: float = 0.0
+
+    def is_healthy(self) -> bool:
+        return self.consecutive_failures < UNHEALTHY_FAILURES
+
+
+_endpoint_stats: Dict[str, EndpointStats] = dict()
+
+# Statistics are recorded both on the event loop and from worker threads (e.g. the
+# liveness probes of the pre-flight stage), hence are only accessed under this lock
+_endpoint_stats_lock = threading.RLock()
+
+
+def get_endpoint_stats(url: str) -> EndpointStats:
+    """
+    :param url: str, server url
+    :return: EndpointStats, of the server url (created on first access)
+    """
+    with _endpoint_stats_lock:
+        if url not in _endpoint_stats:
+            _endpoint_stats[url] = EndpointStats()
+        return _endpoint_stats[url]
+
+
+def record_success(url: str, latency: float):
+    """
+    :param url: str, server url successfully probed or queried
+    :param latency: float, latency (seconds) of the probe or query
+    """
+    with _endpoint_stats_lock:
+        stats: EndpointStats = get_endpoint_stats(url)
+        stats.latency.add(latency)
+        stats.consecutive_failures = 0
+
+
+def record_failure(url: str):
+    """
+    :param url: str, server url failing a probe or query (i.e. timed out, unreachable or overloaded)
+    """
+    with _endpoint_stats_lock:
+        stats: EndpointStats = get_endpoint_stats(url)
+        stats.consecutive_failures += 1
+        consecutive_failures: int = stats.consecutive_failures
+    if consecutive_failures == UNHEALTHY_FAILURES:
+        logger.warning(f"Server '{url}' deemed unhealthy after {UNHEALTHY_FAILURES} consecutive failures")
+
+
+def _by_latency(urls: Iterable[str]) -> List[str]:
+    # servers of unknown latency are sorted last, otherwise preserving their given order
+    def latency_key(url: str) -> Tuple[bool, float]:
+        median: Optional[float] = get_endpoint_stats(url).latency.median()
+        return median is None, median if median is not None else 0.0
+    return sorted(urls, key=latency_key)
+
+
+def _weighted_round_robin(urls: List[str]) -> str:
+    # Smooth weighted round-robin: each server accumulates its
+    # weight per selection, and the selected server gives back the
+    # total weight, spreading selections in proportion to the weights.
+    medians: Dict[str, Optional[float]] = {url: get_endpoint_stats(url).latency.median() for url in urls}
+    known: List[float] = [1.0 / max(median, 1e-3) for median in medians.values() if median is not None]
+    default_weight: float = sum(known) / len(known) if known else 1.0
+    weights: Dict[str, float] = {
+        url: 1.0 / max(median, 1e-3) if median is not None else default_weight
+        for url, median in medians.items()
+    }
+    total: float = sum(weights.values())
+    for url in urls:
+        get_endpoint_stats(url).current_weight += weights[url]
+    selected: str = max(urls, key=lambda url: get_endpoint_stats(url).current_weight)
+    get_endpoint_stats(selected).current_weight -= total
+    return selected
+
+
+def order_endpoints(endpoints: Tuple[str, ...], strategy: str = DEFAULT_ENDPOINT_SELECTION) -> Tuple[str, ...]:
+    """
+    Orders the functionally identical servers of a component for querying: the
+    server selected by the given strategy first, then the remaining healthy servers,
+    fastest first, as failover, with any unhealthy servers last (as a last resort).
+
+    :param endpoints: Tuple[str, ...], server urls of a component, in order of Registry listing
+    :param strategy: str, one of ENDPOINT_SELECTION_STRATEGIES
+    :return: Tuple[str, ...], server urls in order of querying
+    """
+    assert strategy in ENDPOINT_SELECTION_STRATEGIES, f"Unknown endpoint selection strategy '{strategy}'"
+    if not endpoints:
+        return endpoints
+    with _endpoint_stats_lock:
+        healthy: List[str] = [url for url in endpoints if get_endpoint_stats(url).is_healthy()]
+        unhealthy: List[str] = [url for url in endpoints if url not in healthy]
+        if not healthy:
+            # nothing better to do than try them all
+            healthy, unhealthy = unhealthy, []
+
+        if strategy == "registry":
+            ordered: List[str] = healthy
+        else:
+            ordered = _by_latency(healthy)
+            if strategy == "weighted" and len(ordered) > 1:
+                selected: str = _weighted_round_robin(ordered)
+                ordered.remove(selected)
+                ordered.insert(0, selected)
+
+        get_endpoint_stats(ordered[0]).selected += 1
+    return tuple(ordered + unhealthy)
+
+
+def get_endpoint_distribution(endpoints: Optional[Iterable[str]] = None) -> Dict[str, Dict]:
+    """
+    :param endpoints: Optional[Iterable[str]], server urls reported (default: all servers seen)
+    :return: Dict[str, Dict], number of times each server was 'selected' (i.e. queried first),
+                              its 'median_latency' (seconds) and whether it is 'healthy', indexed by url
+    """
+    with _endpoint_stats_lock:
+        if endpoints is None:
+            endpoints = list(_endpoint_stats.keys())
+        return {
+            url: {
+                "selected": get_endpoint_stats(url).selected,
+                "median_latency": get_endpoint_stats(url).latency.median(),
+                "healthy": get_endpoint_stats(url).is_healthy()
+            }
+            for url in endpoints
+        }
@@ -0,0 +1,116 @@
+"""
+Staged asyncio processing pipeline, with stages connected by bounded queues
+"""
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+import asyncio
+
+import logging
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE: int = 16
+
+
+class PipelineStage(NamedTuple):
+    """
+    A named processing stage of a Pipeline, run by 'workers' concurrent
+    coroutines. The 'process' coroutine function returns the item handed
+    on to the next stage; a returned value of 'None' drops the item.
+    """
+    name: str
+    process: Callable[[Any], Awaitable[Optional[Any]]]
+    workers: int = 1
+
+
+# Marker queued after the last item to each worker of a stage
+_END_OF_STREAM = object()
+
+
+class Pipeline:
+    """
+    Pipeline of PipelineStages, each stage reading its items from a bounded
+    queue, such that a slow stage throttles (i.e. applies backpressure to)
+    the stages upstream of it, rather than letting processed items pile up.
+    """
+    def __init__(self, stages: Sequence[PipelineStage], queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        :param stages: Sequence[PipelineStage], processing stages, in order of processing
+        :param queue_size: int, maximum number of items waiting in the input queue of any stage
+        """
+        assert stages, "Pipeline needs at least one stage!"
+        assert all([stage.workers > 0 for stage in stages]), "Pipeline stages need at least one worker!"
+        assert queue_size > 0, "Pipeline queue size must be positive!"
+        self.stages: Sequence[PipelineStage] = stages
+        self.queue_size: int = queue_size
+        self._queues: Dict[str, asyncio.Queue] = dict()
+        self._max_queue_depths: Dict[str, int] = {stage.name: 0 for stage in stages}
+
+    def get_queue_depths(self) -> Dict[str, int]:
+        """
+        :return: Dict[str, int], current number of items waiting at each stage, indexed by stage name.
+        """
+        return {name: queue.qsize() for name, queue in self._queues.items()}
+
+    def get_max_queue_depths(self) -> Dict[str, int]:
+        """
+        :return: Dict[str, int], largest number of items seen waiting at each stage, indexed by stage name.
+        """
+        return self._max_queue_depths.copy()
+
+    async def _put(self, stage: PipelineStage, item: Any):
+        queue: asyncio.Queue = self._queues[stage.name]
+        await queue.put(item)
+        if queue.qsize() > self._max_queue_depths[stage.name]:
+            self._max_queue_depths[stage.name] = queue.qsize()
+
+    async def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        Runs all the items through the pipeline.
+
+        :param items: Iterable[Any], items fed (in order) to the first stage
+        :return: List[Any], items output by the last stage (in order of completion)
+        """
+        self._queues = {stage.name: asyncio.Queue(maxsize=self.queue_size) for stage in self.stages}
+        outputs: List[Any] = list()
+
+        async def feed():
+            for item in items:
+                await self._put(self.stages[0], item)
+            for _ in range(self.stages[0].workers):
+                await self._queues[self.stages[0].name].put(_END_OF_STREAM)
+
+        async def work(index: int):
+            stage: PipelineStage = self.stages[index]
+            queue: asyncio.Queue = self._queues[stage.name]
+            while True:
+                item = await queue.get()
+                if item is _END_OF_STREAM:
+                    return
+                result = await stage.process(item)
+                if result is None:
+                    continue
+                if index + 1 < len(self.stages):
+                    await self._put(self.stages[index + 1], result)
+                else:
+                    outputs.append(result)
+
+        async def run_stage(index: int):
+            await asyncio.gather(*[work(index) for _ in range(self.stages[index].workers)])
+            if index + 1 < len(self.stages):
+                next_stage: PipelineStage = self.stages[index + 1]
+                for _ in range(next_stage.workers):
+                    await self._queues[next_stage.name].put(_END_OF_STREAM)
+
+        tasks: List[asyncio.Task] = [asyncio.ensure_future(feed())] + \
+            [asyncio.ensure_future(run_stage(index)) for index in range(len(self.stages))]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            # one failed stage brings down the whole pipeline
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        logger.debug(f"Pipeline maximum queue depths: {str(self._max_queue_depths)}")
+
+        return outputs
@@ -0,0 +1,63 @@
+"""
+TRAPI schema validation of TestCase TRAPI requests, cached by query 'shape'. The TRAPI
+requests built by a given TestCase template, for distinct TestAssets, generally only differ
+by the CURIEs of their query node 'ids': the shape of a TRAPI request - with its query node
+'ids' abstracted out - is validated once (per TRAPI version), whereas the CURIEs themselves
+are only checked to be well-formed CURIEs.
+"""
+from typing import Any, Dict, List, Tuple
+from copy import deepcopy
+from functools import lru_cache
+import json
+
+from reasoner_validator.biolink import is_curie
+
+from graph_validation_tests.utils.response_store import canonical_json
+from graph_validation_tests.utils.trapi_schema import validate_trapi_schema
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+def get_query_shape(trapi_request: Dict[str, Any]) -> Tuple[bytes, List[Any]]:
+    """
+    :param trapi_request: Dict[str, Any], TRAPI request (Query)
+    :return: Tuple[bytes, List[Any]], canonical JSON of the TRAPI request with the query node 'ids'
+                                      abstracted out (i.e. replaced by placeholder CURIEs), with the 'ids'
+    """
+    shape: Dict[str, Any] = deepcopy(trapi_request)
+    curies: List[Any] = list()
+    query_graph: Any = (shape.get("message") or {}).get("query_graph") or {}
+    for node in (query_graph.get("nodes") or {}).values():
+        if isinstance(node, dict) and isinstance(node.get("ids"), list):
+            curies.extend(node["ids"])
+            node["ids"] = [f"CURIE:{i}" for i in range(len(node["ids"]))]
+    return canonical_json(shape), curies
+
+
+@lru_cache(maxsize=1024)
+def _validate_query_shape(trapi_version: str, shape: bytes):
+    # only successful validations are cached, since
+    # lru_cache does not cache raised ValidationErrors
+    validate_trapi_schema(json.loads(shape), trapi_version, "Query")
+
+
+def validate_trapi_request(trapi_request: Dict[str, Any], trapi_version: str):
+    """
+    Validates a TRAPI request (Query) against the TRAPI schema, reusing
+    the outcome of the validation of TRAPI requests of the same shape.
+
+    :param trapi_request: Dict[str, Any], TRAPI request (Query)
+    :param trapi_version: str, TRAPI version (or schema file) against which the TRAPI request is validated
+    :raises: jsonschema.ValidationError, if the TRAPI request is invalid
+    """
+    try:
+        shape, curies = get_query_shape(trapi_request)
+    except (AttributeError, TypeError):
+        # malformed TRAPI request, validated as is
+        shape, curies = None, None
+    if shape is not None and all(is_curie(curie) for curie in curies):
+        _validate_query_shape(trapi_version, shape)
+    else:
+        # the validation of the TRAPI request itself reports the malformed CURIEs
+        validate_trapi_schema(trapi_request, trapi_version, "Query")
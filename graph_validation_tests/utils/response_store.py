@@ -0,0 +1,224 @@
+"""
+Content-addressed store of TRAPI Responses. Each distinct TRAPI Response is held once,
+as a compressed 'blob' keyed by the SHA-256 hash of its canonical JSON, such that the
+store grows only with unique content. A small (sqlite) index links each test case
+response - by (run, test case, component) - to its blob.
+
+Blobs are compressed with zstandard, if installed (i.e. with the 'zstd' extra of the package),
+otherwise with zlib; blobs of either codec may be read back, as available.
+"""
+from typing import Dict, Optional, Tuple
+from datetime import datetime, timezone
+from hashlib import sha256
+from os import makedirs, replace
+from os.path import exists, join
+from uuid import uuid4
+import json
+import sqlite3
+import threading
+import zlib
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+import logging
+logger = logging.getLogger(__name__)
+
+ZSTD_CODEC = "zstd"
+ZLIB_CODEC = "zlib"
+
+INDEX_FILENAME = "index.sqlite"
+BLOBS_DIRECTORY = "blobs"
+
+
+def canonical_json(data: Dict) -> bytes:
+    """
+    :param data: Dict, JSON data structure
+    :return: bytes, canonical (sorted keys, compact) UTF-8 encoded JSON of the data
+    """
+    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def content_hash(content: bytes) -> str:
+    """
+    :param content: bytes, content to be hashed
+    :return: str, hexadecimal SHA-256 hash of the content
+    """
+    return sha256(content).hexdigest()
+
+
+def new_run_id() -> str:
+    """
+    :return: str, identifier of a new run of tests: a UTC timestamp of its start, suffixed by a random
+                  identifier, such that runs started at the same time do not share their responses index
+    """
+    return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid4().hex[:8]}"
+
+
+def get_default_codec() -> str:
+    """
+    :return: str, codec with which new blobs are compressed: 'zstd' if available, otherwise 'zlib'
+    """
+    return ZSTD_CODEC if zstandard is not None else ZLIB_CODEC
+
+
+def compress(content: bytes, codec: str) -> bytes:
+    if codec == ZSTD_CODEC:
+        return zstandard.ZstdCompressor(level=10).compress(content)
+    return zlib.compress(content, 6)
+
+
+def decompress(content: bytes, codec: str) -> bytes:
+    if codec == ZSTD_CODEC:
+        if zstandard is None:
+            raise RuntimeError("Response store blob is zstandard compressed, but 'zstandard' is not installed?")
+        return zstandard.ZstdDecompressor().decompress(content)
+    return zlib.decompress(content)
+
+
+class ResponseStore:
+    """
+    Content-addressed store of TRAPI Responses, within a given directory.
+    """
+    def __init__(self, path: str, codec: Optional[str] = None):
+        """
+        :param path: str, directory of the store (created if necessary)
+        :param codec: Optional[str], codec compressing new blobs, 'zstd' or 'zlib' (default: get_default_codec())
+        """
+        self.path: str = path
+        self.codec: str = codec if codec else get_default_codec()
+        assert self.codec in (ZSTD_CODEC, ZLIB_CODEC), f"Unknown response store codec '{self.codec}'"
+        if self.codec == ZSTD_CODEC and zstandard is None:
+            raise RuntimeError("Response store codec 'zstd' needs the 'zstandard' package to be installed!")
+        if codec is None and zstandard is None:
+            logger.warning(
+                f"Response store '{path}': 'zstandard' is not installed, hence TRAPI Responses " +
+                "are compressed with zlib (install the 'zstd' extra for zstandard compression)"
+            )
+        makedirs(join(path, BLOBS_DIRECTORY), exist_ok=True)
+        self._lock = threading.Lock()
+        self._index = sqlite3.connect(join(path, INDEX_FILENAME), check_same_thread=False)
+        with self._index:
+            self._index.execute(
+                "CREATE TABLE IF NOT EXISTS blobs (" +
+                "hash TEXT PRIMARY KEY, codec TEXT NOT NULL, size INTEGER NOT NULL, stored_size INTEGER NOT NULL)"
+            )
+            self._index.execute(
+                "CREATE TABLE IF NOT EXISTS responses (" +
+                "run_id TEXT NOT NULL, test_case_id TEXT NOT NULL, component TEXT NOT NULL, " +
+                "hash TEXT NOT NULL REFERENCES blobs(hash), PRIMARY KEY (run_id, test_case_id, component))"
+            )
+        if zstandard is None and \
+                self._index.execute("SELECT 1 FROM blobs WHERE codec = ?", (ZSTD_CODEC,)).fetchone():
+            self._index.close()
+            raise RuntimeError(
+                f"Response store '{path}' holds zstandard compressed TRAPI Responses, " +
+                "which cannot be read back unless the 'zstandard' package (i.e. the 'zstd' extra) is installed!"
+            )
+
+    def close(self):
+        with self._lock:
+            self._index.close()
+
+    def _blob_path(self, blob_hash: str) -> str:
+        return join(self.path, BLOBS_DIRECTORY, blob_hash[:2], blob_hash)
+
+    def put_blob(self, trapi_response: Dict) -> str:
+        """
+        Stores a TRAPI Response, unless identical content is already stored. The (costly) compression
+        and writing of the blob are done outside the lock of the store, so that concurrent threads
+        storing distinct TRAPI Responses do not wait for one another.
+
+        :param trapi_response: Dict, TRAPI Response JSON, as a Python data structure.
+        :return: str, hash of the (blob of the) TRAPI Response
+        """
+        content: bytes = canonical_json(trapi_response)
+        blob_hash: str = content_hash(content)
+        with self._lock:
+            if self._index.execute("SELECT 1 FROM blobs WHERE hash = ?", (blob_hash,)).fetchone():
+                return blob_hash
+        stored: bytes = compress(content, self.codec)
+        blob_path: str = self._blob_path(blob_hash)
+        makedirs(join(self.path, BLOBS_DIRECTORY, blob_hash[:2]), exist_ok=True)
+        # written atomically, such that readers never see a partial blob (threads
+        # concurrently storing identical content write identical blobs)
+        temporary_path: str = f"{blob_path}.{uuid4().hex}.tmp"
+        with open(temporary_path, "wb") as blob_file:
+            blob_file.write(stored)
+        replace(temporary_path, blob_path)
+        with self._lock, self._index:
+            self._index.execute(
+                "INSERT OR IGNORE INTO blobs (hash, codec, size, stored_size) VALUES (?, ?, ?, ?)",
+                (blob_hash, self.codec, len(content), len(stored))
+            )
+        return blob_hash
+
+    def get_blob(self, blob_hash: str) -> Optional[Dict]:
+        """
+        :param blob_hash: str, hash of a stored TRAPI Response
+        :return: Optional[Dict], the TRAPI Response; None if not stored
+        """
+        with self._lock:
+            row: Optional[Tuple] = \
+                self._index.execute("SELECT codec FROM blobs WHERE hash = ?", (blob_hash,)).fetchone()
+        blob_path: str = self._blob_path(blob_hash)
+        if row is None or not exists(blob_path):
+            return None
+        with open(blob_path, "rb") as blob_file:
+            return json.loads(decompress(blob_file.read(), row[0]))
+
+    def put(self, run_id: str, test_case_id: str, component: str, trapi_response: Dict) -> str:
+        """
+        Stores the TRAPI Response of a test case.
+
+        :param run_id: str, identifier of the run of tests
+        :param test_case_id: str, identifier of the test case
+        :param component: str, component returning the TRAPI Response
+        :param trapi_response: Dict, TRAPI Response JSON, as a Python data structure.
+        :return: str, hash of the (blob of the) TRAPI Response
+        """
+        blob_hash: str = self.put_blob(trapi_response)
+        with self._lock, self._index:
+            self._index.execute(
+                "INSERT OR REPLACE INTO responses (run_id, test_case_id, component, hash) VALUES (?, ?, ?, ?)",
+                (run_id, test_case_id, component, blob_hash)
+            )
+        return blob_hash
+
+    def get_hash(self, run_id: str, test_case_id: str, component: str) -> Optional[str]:
+        """
+        :param run_id: str, identifier of the run of tests
+        :param test_case_id: str, identifier of the test case
+        :param component: str, component returning the TRAPI Response
+        :return: Optional[str], hash of the TRAPI Response of the test case; None if not stored
+        """
+        with self._lock:
+            row: Optional[Tuple] = self._index.execute(
+                "SELECT hash FROM responses WHERE run_id = ? AND test_case_id = ? AND component = ?",
+                (run_id, test_case_id, component)
+            ).fetchone()
+        return row[0] if row else None
+
+    def get(self, run_id: str, test_case_id: str, component: str) -> Optional[Dict]:
+        """
+        :param run_id: str, identifier of the run of tests
+        :param test_case_id: str, identifier of the test case
+        :param component: str, component returning the TRAPI Response
+        :return: Optional[Dict], TRAPI Response of the test case; None if not stored
+        """
+        blob_hash: Optional[str] = self.get_hash(run_id, test_case_id, component)
+        return self.get_blob(blob_hash) if blob_hash else None
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        :return: Dict[str, int], number of stored 'responses' and distinct 'blobs', with the total
+                                 (uncompressed) 'size' and 'stored_size' of the blobs, in bytes
+        """
+        with self._lock:
+            responses: int = self._index.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            blobs, size, stored_size = self._index.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()
+        return {"responses": responses, "blobs": blobs, "size": size, "stored_size": stored_size}
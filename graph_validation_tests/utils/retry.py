@@ -0,0 +1,142 @@
+"""
+Retry policy, with exponential backoff and jitter, for transient failures of HTTP requests
+"""
+from typing import Awaitable, Callable, Collection, Dict, List, NamedTuple, Optional
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import asyncio
+import random
+import time
+
+import logging
+logger = logging.getLogger(__name__)
+
+# HTTP status codes of request failures deemed to be transient; note that TRAPI
+# query timeouts and connection failures are reported as status code 408
+# by graph_validation_tests.translator.trapi.post_trapi_query()
+RETRYABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+# HTTP status codes of responses whose 'Retry-After' header is honored
+RETRY_AFTER_STATUS_CODES = (429, 503)
+
+
+class QueryAttempt(NamedTuple):
+    """
+    Record of one attempt at an HTTP request.
+    """
+    attempt: int                # 1 for the first attempt
+    status_code: Optional[int]  # None if the attempt didn't complete
+    elapsed: float              # duration (seconds) of the attempt
+    delay: float = 0.0          # time (seconds) waited before the next attempt, if any
+    endpoint: Optional[str] = None  # url of the (last) endpoint queried, if known
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    :param value: Optional[str], value of an HTTP 'Retry-After' header, either
+                  a number of seconds or an HTTP date (RFC 9110, section 10.2.3)
+    :return: Optional[float], number of seconds to wait; None if not given or not parseable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_date: datetime = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring unparseable 'Retry-After' header value: '{value}'")
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """
+    Policy deciding whether - and after how long - a failed HTTP request is retried.
+    Delays grow exponentially with each attempt, using 'full jitter' (a delay drawn
+    uniformly between zero and the exponential backoff) such that requests failing
+    together are not retried together. A 'Retry-After' delay given by the server
+    (on 429 or 503 responses) takes precedence, if longer.
+    """
+    def __init__(
+            self,
+            max_attempts: int = 3,
+            base_delay: float = 1.0,
+            max_delay: float = 60.0,
+            retryable_status_codes: Collection[int] = RETRYABLE_STATUS_CODES
+    ):
+        """
+        :param max_attempts: int, maximum number of attempts of a request (1 == no retries)
+        :param base_delay: float, backoff (seconds) after the first failed attempt
+        :param max_delay: float, upper bound (seconds) of any delay between attempts
+        :param retryable_status_codes: Collection[int], HTTP status codes of failures to be retried
+        """
+        assert max_attempts > 0, "RetryPolicy needs at least one attempt!"
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.retryable_status_codes: Collection[int] = retryable_status_codes
+
+    def is_retryable(self, status_code: Optional[int]) -> bool:
+        """
+        :param status_code: Optional[int], HTTP status code of a failed attempt
+        :return: bool, True if the failure is deemed transient
+        """
+        return status_code in self.retryable_status_codes
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        :param attempt: int, number of the attempt which just failed (1 for the first attempt)
+        :param retry_after: Optional[float], delay (seconds) requested by the server, if any
+        :return: float, delay (seconds) before the next attempt
+        """
+        backoff: float = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        delay: float = random.uniform(0.0, backoff)
+        if retry_after is not None:
+            delay = max(delay, min(self.max_delay, retry_after))
+        return delay
+
+
+async def call_with_retries(
+        call: Callable[[], Awaitable[Dict]],
+        policy: RetryPolicy,
+        attempts: Optional[List[QueryAttempt]] = None
+) -> Dict:
+    """
+    Runs an HTTP request, retrying it according to a given RetryPolicy.
+
+    :param call: Callable[[], Awaitable[Dict]], coroutine function running one attempt of the request,
+                 returning a dictionary with (at least) the HTTP 'status_code', an optional
+                 'retry_after' header value and optional 'endpoint' url queried
+                 (see graph_validation_tests.translator.trapi)
+    :param policy: RetryPolicy, policy for retrying failed attempts
+    :param attempts: Optional[List[QueryAttempt]], if given, a record of each attempt is appended here
+    :return: Dict, result of the last attempt made
+    """
+    attempt: int = 0
+    while True:
+        attempt += 1
+        started: float = time.monotonic()
+        result: Dict = await call()
+        elapsed: float = time.monotonic() - started
+        status_code: Optional[int] = result.get('status_code')
+
+        delay: float = 0.0
+        retry: bool = status_code != 200 and \
+            attempt < policy.max_attempts and policy.is_retryable(status_code)
+        if retry:
+            retry_after: Optional[float] = None
+            if status_code in RETRY_AFTER_STATUS_CODES:
+                retry_after = parse_retry_after(result.get('retry_after'))
+            delay = policy.get_delay(attempt, retry_after)
+
+        if attempts is not None:
+            attempts.append(QueryAttempt(attempt, status_code, elapsed, delay, result.get('endpoint')))
+
+        if not retry:
+            return result
+
+        logger.info(f"Attempt {attempt} failed with HTTP status {status_code}; retrying in {delay:.2f} seconds")
+        await asyncio.sleep(delay)
@@ -0,0 +1,61 @@
+"""
+Process-wide cache of compiled TRAPI (JSON) schema validators, by TRAPI version
+and schema component, such that each TRAPI schema component is only checked
+and compiled once per process, rather than at each TRAPI schema validation.
+"""
+from typing import Any, Dict
+from functools import lru_cache
+
+from jsonschema import Validator
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from reasoner_validator.trapi import load_schema
+from reasoner_validator.validator import TRAPIResponseValidator
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_trapi_schema_validator(trapi_version: str, component: str) -> Validator:
+    """
+    :param trapi_version: str, TRAPI version (or schema file) of the schema
+    :param component: str, TRAPI schema component (e.g. 'Query', 'QueryGraph', 'KnowledgeGraph', 'Result')
+    :return: Validator, (compiled) JSON schema validator of the TRAPI schema component
+    """
+    schema: Dict = load_schema(trapi_version)[component]
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    logger.debug(f"Compiled TRAPI '{trapi_version}' schema validator of component '{component}'")
+    return validator_class(schema)
+
+
+def validate_trapi_schema(instance: Any, trapi_version: str, component: str):
+    """
+    Same as jsonschema.validate() of the instance against the TRAPI schema component,
+    but using the cached (compiled) validator of the TRAPI schema component.
+
+    :param instance: Any, instance to validate
+    :param trapi_version: str, TRAPI version (or schema file) of the schema
+    :param component: str, TRAPI schema component (e.g. 'Query', 'QueryGraph', 'KnowledgeGraph', 'Result')
+    :raises: jsonschema.ValidationError, if the instance is invalid
+    """
+    error = best_match(get_trapi_schema_validator(trapi_version, component).iter_errors(instance))
+    if error is not None:
+        raise error
+
+
+class CompiledSchemaValidator(TRAPIResponseValidator):
+    """
+    TRAPIResponseValidator validating against cached (compiled) TRAPI schema validators.
+    """
+    def validate(self, instance, component):
+        """
+        Validate instance against (compiled) TRAPI schema.
+
+        :param instance: Dict, instance to validate
+        :param component: str, TRAPI schema component (e.g. 'Query', 'QueryGraph', 'KnowledgeGraph', 'Result')
+        :raises: jsonschema.ValidationError, if the instance is invalid
+        """
+        validate_trapi_schema(instance, self.trapi_version, component)
@@ -0,0 +1,279 @@
+"""
+Persistent cache of the validation messages of TRAPI Responses, indexed by a canonical
+fingerprint of the TRAPI Response (with the versions and settings of the validation),
+such that TRAPI Responses returned unchanged, run after run, are validated only once.
+Within a single run of tests, identical TRAPI Responses - to different TestCase templates,
+or from different components proxying the same KP - are similarly validated only once.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import asyncio
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import sha256
+from importlib.metadata import PackageNotFoundError, version
+import json
+import sqlite3
+import threading
+import time
+
+from reasoner_validator.message import MESSAGE_CATALOG
+
+from graph_validation_tests.utils.response_store import canonical_json
+
+import logging
+logger = logging.getLogger(__name__)
+
+try:
+    VALIDATOR_VERSION: str = version("reasoner-validator")
+except PackageNotFoundError:
+    VALIDATOR_VERSION = "unknown"
+
+# Top level TRAPI Response properties excluded from the fingerprint: the 'logs'
+# differ from one run to the next (i.e. by their timestamps) for otherwise identical responses
+FINGERPRINT_EXCLUDED = ("logs",)
+
+# Maximum number of keys looked up by a single query of ValidationCache.get_many()
+# (within the default limit of sqlite to the number of parameters of a query)
+MAX_LOOKUP_BATCH: int = 500
+
+
+def digest(data: Any) -> str:
+    """
+    :param data: Any, JSON data structure
+    :return: str, hexadecimal SHA-256 hash of the canonical JSON of the data
+    """
+    return sha256(canonical_json(data)).hexdigest()
+
+
+def response_fingerprint(trapi_response: Dict) -> str:
+    """
+    Canonical fingerprint of a TRAPI Response, insensitive to the order of the knowledge graph
+    nodes and edges (JSON objects, of sorted keys) and of the results (sorted by their digests).
+
+    :param trapi_response: Dict, TRAPI Response JSON, as a Python data structure.
+    :return: str, hexadecimal fingerprint of the TRAPI Response
+    """
+    response: Dict = {key: value for key, value in trapi_response.items() if key not in FINGERPRINT_EXCLUDED}
+    message: Any = response.get("message")
+    if isinstance(message, dict) and isinstance(message.get("results"), list):
+        response["message"] = dict(
+            message,
+            results=sorted(digest(result) for result in message["results"])
+        )
+    return digest(response)
+
+
+def validation_key(
+        fingerprint: str,
+        validation: str,
+        trapi_version: Optional[str],
+        biolink_version: Optional[str],
+        settings: Optional[Dict[str, Any]] = None,
+        test_asset: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    :param fingerprint: str, fingerprint of the TRAPI Response validated
+    :param validation: str, name of the validation applied (e.g. the class of TestCaseRun)
+    :param trapi_version: Optional[str], TRAPI version against which the TRAPI Response is validated
+    :param biolink_version: Optional[str], Biolink Model version against which the TRAPI Response is validated
+    :param settings: Optional[Dict[str, Any]], validator settings affecting the validation
+    :param test_asset: Optional[Dict[str, Any]], TestAsset against which the TRAPI Response is validated
+    :return: str, key of the validation messages of the TRAPI Response in the ValidationCache
+    """
+    return digest([
+        fingerprint,
+        validation,
+        trapi_version,
+        biolink_version,
+        VALIDATOR_VERSION,
+        settings or {},
+        test_asset or {}
+    ])
+
+
+class ValidationCache:
+    """
+    Persistent (sqlite) cache of validation messages, indexed by validation key (see validation_key()).
+    """
+    def __init__(self, path: str):
+        """
+        :param path: str, path to the (sqlite) cache file (created if necessary)
+        """
+        self.path: str = path
+        self.hits: int = 0
+        self.misses: int = 0
+        self._lock = threading.Lock()
+        # the cache may be shared by several processes, e.g. of bulk validation
+        self._db = sqlite3.connect(path, timeout=60.0, check_same_thread=False)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            # entries are cheap to recompute, so commits need not be durable against power loss
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS validations (" +
+                "key TEXT PRIMARY KEY, messages TEXT NOT NULL, created REAL NOT NULL)"
+            )
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def get(self, key: str) -> Optional[MESSAGE_CATALOG]:
+        """
+        :param key: str, validation key
+        :return: Optional[MESSAGE_CATALOG], cached validation messages; None if not cached
+        """
+        with self._lock:
+            row: Optional[Tuple] = self._db.execute(
+                "SELECT messages FROM validations WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, messages: MESSAGE_CATALOG):
+        """
+        :param key: str, validation key
+        :param messages: MESSAGE_CATALOG, validation messages to be cached
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO validations (key, messages, created) VALUES (?, ?, ?)",
+                (key, json.dumps(messages), time.time())
+            )
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, MESSAGE_CATALOG]:
+        """
+        Looks up many validation keys at once, e.g. those of all the edges of a knowledge graph.
+
+        :param keys: Iterable[str], validation keys
+        :return: Dict[str, MESSAGE_CATALOG], cached validation messages, indexed by the (cached) keys
+        """
+        keys = list(dict.fromkeys(keys))
+        rows: List[Tuple] = list()
+        with self._lock:
+            for start in range(0, len(keys), MAX_LOOKUP_BATCH):
+                batch: List[str] = keys[start:start + MAX_LOOKUP_BATCH]
+                rows.extend(
+                    self._db.execute(
+                        f"SELECT key, messages FROM validations WHERE key IN ({','.join('?' * len(batch))})",
+                        batch
+                    ).fetchall()
+                )
+            self.hits += len(rows)
+            self.misses += len(keys) - len(rows)
+        return {key: json.loads(messages) for key, messages in rows}
+
+    def put_many(self, entries: Iterable[Tuple[str, MESSAGE_CATALOG]]):
+        """
+        Caches many validations at once, in a single transaction.
+
+        :param entries: Iterable[Tuple[str, MESSAGE_CATALOG]], validation keys with their validation messages
+        """
+        created: float = time.time()
+        rows: List[Tuple] = [(key, json.dumps(messages), created) for key, messages in entries]
+        if not rows:
+            return
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO validations (key, messages, created) VALUES (?, ?, ?)", rows
+            )
+
+    def count_lookups(self, hits: int, misses: int):
+        """
+        Counts lookups done elsewhere, e.g. by a worker process, against the same cache.
+
+        :param hits: int, number of lookups found in the cache
+        :param misses: int, number of lookups not found in the cache
+        """
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        :return: Dict[str, Any], number of cache 'hits' and 'misses', with the 'hit_rate'
+        """
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.get_hit_rate()}
+
+    def get_hit_rate(self) -> Optional[float]:
+        """
+        :return: Optional[float], fraction of lookups found in the cache; None if no lookups yet
+        """
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+
+class ResponseValidations:
+    """
+    In-memory map - scoped to a run of tests - of the validation messages of TRAPI Responses,
+    indexed by validation key (see validation_key()). Validations still in progress are
+    tracked, such that test cases receiving an identical TRAPI Response may await them.
+    """
+    def __init__(self, max_size: Optional[int] = None):
+        """
+        :param max_size: Optional[int], maximum number of validations kept, the least recently
+                         used being evicted first, e.g. for long-lived (bulk validation) runs of
+                         tests (default: None, all the validations of the run are kept)
+        """
+        self.max_size: Optional[int] = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._messages: OrderedDict[str, MESSAGE_CATALOG] = OrderedDict()
+        self._pending: Dict[str, asyncio.Future] = dict()
+
+    def get(self, key: str) -> Optional[MESSAGE_CATALOG]:
+        """
+        :param key: str, validation key
+        :return: Optional[MESSAGE_CATALOG], (copy of the) validation messages; None if not (yet) validated
+        """
+        messages: Optional[MESSAGE_CATALOG] = self._messages.get(key)
+        if messages is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._messages.move_to_end(key)
+        return deepcopy(messages)
+
+    def put(self, key: str, messages: MESSAGE_CATALOG):
+        """
+        :param key: str, validation key
+        :param messages: MESSAGE_CATALOG, validation messages to be reused within the run
+        """
+        self._messages[key] = deepcopy(messages)
+        self._messages.move_to_end(key)
+        if self.max_size is not None:
+            while len(self._messages) > self.max_size:
+                self._messages.popitem(last=False)
+        self.release(key)
+
+    def claim(self, key: str) -> Optional[asyncio.Future]:
+        """
+        Claims the validation of a TRAPI Response, unless its validation is already in progress.
+
+        :param key: str, validation key
+        :return: Optional[asyncio.Future], future to await, if the validation is already in progress;
+                                           None if the caller is to validate, then put() or release()
+        """
+        pending: Optional[asyncio.Future] = self._pending.get(key)
+        if pending is None:
+            self._pending[key] = asyncio.get_running_loop().create_future()
+        return pending
+
+    def release(self, key: str):
+        """
+        Releases the claim on the validation of a TRAPI Response, e.g. if its validation failed.
+
+        :param key: str, validation key
+        """
+        pending: Optional[asyncio.Future] = self._pending.pop(key, None)
+        if pending is not None and not pending.done():
+            pending.set_result(None)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        :return: Dict[str, Any], number of validations reused ('hits') or not ('misses')
+        """
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,205 @@
+"""
+Memoization of the element checks repeated during the validation of a TRAPI Response.
+Large TRAPI Responses repeat the same categories, predicates, infores, 'sources' and
+'attributes' across thousands of nodes and edges: the outcome of each check - its return
+value and the messages it reports - is recorded once per distinct 'shape' of its arguments
+then replayed, with the node or edge identifiers of each later occurrence substituted.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from reasoner_validator.report import TRAPIGraphType
+from reasoner_validator.validator import TRAPIResponseValidator
+
+from graph_validation_tests.utils.response_store import canonical_json
+from graph_validation_tests.utils.trapi_schema import CompiledSchemaValidator
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+class _Occurrence:
+    """
+    Placeholder, in a memoized outcome, of an argument identifying the occurrence of a check.
+    """
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name: str = name
+
+
+def _template(value: Any, occurrence: Dict[Any, _Occurrence]) -> Any:
+    return occurrence.get(value, value) if isinstance(value, str) else value
+
+
+def _instance(value: Any, occurrence: Dict[str, Any]) -> Any:
+    return occurrence[value.name] if isinstance(value, _Occurrence) else value
+
+
+class MemoizingValidator(CompiledSchemaValidator):
+    """
+    CompiledSchemaValidator memoizing the outcomes of its element checks, such that
+    the cost of validation grows with the number of distinct element shapes, rather
+    than with the number of nodes and edges of the TRAPI Response validated.
+    """
+    def __init__(self, **kwargs):
+        """
+        :param kwargs: Dict, named arguments of the TRAPIResponseValidator
+        """
+        TRAPIResponseValidator.__init__(self, **kwargs)
+        self.reset_validation_memo()
+
+    def reset_validation_memo(self):
+        """
+        Forgets all memoized outcomes, e.g. before validating another TRAPI Response.
+        """
+        self._validation_memo: Dict[Tuple, Tuple[Any, List[Tuple]]] = dict()
+        self._report_recorders: List[List[Tuple]] = list()
+
+    def report(
+            self,
+            code: str,
+            test: Optional[str] = None,
+            target: Optional[str] = None,
+            source_trail: Optional[str] = None,
+            **message
+    ):
+        for recorder in self._report_recorders:
+            recorder.append((code, test, target, source_trail, message))
+        TRAPIResponseValidator.report(self, code, test=test, target=target, source_trail=source_trail, **message)
+
+    def memoized(self, check: Callable, shape: Tuple, occurrence: Dict[str, Any], **arguments) -> Any:
+        """
+        Applies a validation check, unless a check of the same shape was already applied,
+        in which case its memoized outcome is replayed for the given occurrence.
+
+        :param check: Callable, (bound) validation check method
+        :param shape: Tuple, (hashable) values of the arguments of the check determining its outcome
+        :param occurrence: Dict[str, Any], named arguments of the check only identifying (in reported
+                                           messages) the occurrence checked, e.g. the 'edge_id'
+        :param arguments: Dict, other named arguments of the check
+        :return: Any, return value of the check
+        """
+        # the outcome of a check also depends on the versions and settings of the validation
+        key: Tuple = (
+            check.__name__,
+            self.trapi_version,
+            self.biolink_version,
+            self.strict_validation,
+            str(self.target_provenance)
+        ) + shape
+        try:
+            outcome: Optional[Tuple[Any, List[Tuple]]] = self._validation_memo.get(key)
+        except TypeError:
+            # unhashable (i.e. malformed) argument values are simply checked
+            return check(**occurrence, **arguments)
+
+        if outcome is None:
+            recorder: List[Tuple] = list()
+            self._report_recorders.append(recorder)
+            try:
+                result: Any = check(**occurrence, **arguments)
+            finally:
+                self._report_recorders.pop()
+            placeholders: Dict[Any, _Occurrence] = {
+                value: _Occurrence(name) for name, value in occurrence.items() if isinstance(value, str)
+            }
+            self._validation_memo[key] = (
+                _template(result, placeholders),
+                [
+                    (
+                        code, test, target,
+                        _template(source_trail, placeholders),
+                        {name: _template(value, placeholders) for name, value in message.items()}
+                    )
+                    for code, test, target, source_trail, message in recorder
+                ]
+            )
+            return result
+
+        result, reports = outcome
+        for code, test, target, source_trail, message in reports:
+            self.report(
+                code,
+                test=test,
+                target=target,
+                source_trail=_instance(source_trail, occurrence),
+                **{name: _instance(value, occurrence) for name, value in message.items()}
+            )
+        return _instance(result, occurrence)
+
+    def validate_category(self, context: str, node_id: Optional[str], category: Optional[str]):
+        return self.memoized(
+            super().validate_category,
+            (context, category),
+            {"node_id": node_id},
+            context=context,
+            category=category
+        )
+
+    def validate_element_status(
+            self,
+            graph_type: TRAPIGraphType,
+            context: str,
+            identifier: str,
+            edge_id: str,
+            source_trail: Optional[str] = None,
+            ignore_graph_type: bool = False
+    ):
+        return self.memoized(
+            super().validate_element_status,
+            (graph_type, context, identifier, ignore_graph_type),
+            {"edge_id": edge_id, "source_trail": source_trail},
+            graph_type=graph_type,
+            context=context,
+            identifier=identifier,
+            ignore_graph_type=ignore_graph_type
+        )
+
+    def validate_predicate(
+            self,
+            edge_id: str,
+            predicate: str,
+            graph_type: TRAPIGraphType,
+            source_trail: Optional[str] = None
+    ):
+        return self.memoized(
+            super().validate_predicate,
+            (predicate, graph_type),
+            {"edge_id": edge_id, "source_trail": source_trail},
+            predicate=predicate,
+            graph_type=graph_type
+        )
+
+    def validate_infores(self, context: str, edge_id: str, identifier: str) -> bool:
+        return self.memoized(
+            super().validate_infores,
+            (context, identifier),
+            {"edge_id": edge_id},
+            context=context,
+            identifier=identifier
+        )
+
+    def validate_sources(self, edge_id: str, edge: Dict) -> Optional[str]:
+        # only the 'sources' of the edge are checked
+        return self.memoized(
+            super().validate_sources,
+            ("sources" in edge, canonical_json(edge.get("sources"))),
+            {"edge_id": edge_id},
+            edge=edge
+        )
+
+    def validate_attributes(
+            self,
+            graph_type: TRAPIGraphType,
+            edge_id: str,
+            edge: Dict,
+            source_trail: Optional[str] = None
+    ) -> Optional[str]:
+        # only the 'attributes' of the edge are checked
+        return self.memoized(
+            super().validate_attributes,
+            (graph_type, "attributes" in edge, canonical_json(edge.get("attributes"))),
+            {"edge_id": edge_id, "source_trail": source_trail},
+            graph_type=graph_type,
+            edge=edge
+        )
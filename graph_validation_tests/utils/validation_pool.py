@@ -0,0 +1,109 @@
+"""
+Process pool execution of (CPU-bound) TRAPI Response validation,
+to keep the asyncio event loop of the TestRunners free for networking.
+"""
+from typing import Any, Dict, Optional, Tuple, Type
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+from reasoner_validator.validator import TRAPIResponseValidator
+from reasoner_validator.message import MESSAGES_BY_TARGET
+
+from graph_validation_tests.utils.validation_cache import ValidationCache
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Validator attributes which may vary between test cases
+# validated by a given (warm) validator in a worker process
+VALIDATOR_SETTINGS = ("strict_validation", "target_provenance", "suppress_empty_data_warnings")
+
+# Process pool shared by the test runs of a run of tests (see shutdown_validation_executor()),
+# with the number of worker processes with which it was started
+_validation_executor: Optional[ProcessPoolExecutor] = None
+_validation_executor_workers: Optional[int] = None
+
+# Edge validation caches of a worker process, indexed by path
+_edge_caches: Dict[str, ValidationCache] = dict()
+
+
+def get_validation_executor(max_workers: Optional[int] = None) -> Executor:
+    """
+    Returns the process pool used to offload TRAPI Response validation. The pool is created on
+    first access, then (re-)created whenever a different number of worker processes is requested.
+
+    :param max_workers: Optional[int], number of worker processes (default: number of processors on the machine)
+    :return: Executor, process pool executor for TRAPI Response validation
+    """
+    global _validation_executor, _validation_executor_workers
+    if _validation_executor is not None and _validation_executor_workers != max_workers:
+        shutdown_validation_executor()
+    if _validation_executor is None:
+        logger.debug(f"Starting TRAPI Response validation process pool with {str(max_workers)} workers")
+        _validation_executor = ProcessPoolExecutor(max_workers=max_workers)
+        _validation_executor_workers = max_workers
+    return _validation_executor
+
+
+def shutdown_validation_executor():
+    """
+    Shuts down the TRAPI Response validation process pool, if running
+    (e.g. at the end of a run of tests), with its worker processes.
+    """
+    global _validation_executor, _validation_executor_workers
+    if _validation_executor is not None:
+        _validation_executor.shutdown()
+        _validation_executor = None
+        _validation_executor_workers = None
+
+
+def validate_in_worker(
+        test_case_class: Type,
+        default_test: str,
+        default_target: str,
+        trapi_version: str,
+        biolink_version: str,
+        test_asset: Optional[Dict[str, Any]],
+        trapi_response: Optional[Dict[str, Any]],
+        settings: Dict[str, Any],
+        edge_cache: Optional[str] = None
+) -> Tuple[MESSAGES_BY_TARGET, Tuple[int, int]]:
+    """
+    Worker process entry point validating one TRAPI Response, using the
+    'validate_trapi_response' method of the given class of TestCaseRun.
+
+    :param test_case_class: Type, TestCaseRun subclass specifying the validation to be done
+    :param default_test: str, test name under which validation messages are reported
+    :param default_target: str, target component under which validation messages are reported
+    :param trapi_version: str, TRAPI version against which the response is validated
+    :param biolink_version: str, Biolink Model version against which the response is validated
+    :param test_asset: Optional[Dict[str, Any]], translated TestAsset of the test case
+    :param trapi_response: Optional[Dict[str, Any]], TRAPI Response to be validated
+    :param settings: Dict[str, Any], test case specific validator settings (see VALIDATOR_SETTINGS)
+    :param edge_cache: Optional[str], path to the edge validation cache used by the (EdgeCachingValidator) validator
+    :return: Tuple[MESSAGES_BY_TARGET, Tuple[int, int]], validation messages to be merged back into
+                                                         the TestCaseRun, with the number of edge cache hits
+                                                         and misses of the validation (if an 'edge_cache' is given)
+    """
+    # A fresh validator is constructed for each TRAPI Response: the resolution of the TRAPI and Biolink
+    # Model versions, and the Biolink Model Toolkit, are cached (once per worker process) by the reasoner-validator
+    validator: TRAPIResponseValidator = test_case_class.validator_class(
+        default_test=default_test,
+        default_target=default_target,
+        trapi_version=trapi_version,
+        biolink_version=biolink_version,
+        **settings
+    )
+
+    cache: Optional[ValidationCache] = None
+    if edge_cache:
+        if edge_cache not in _edge_caches:
+            _edge_caches[edge_cache] = ValidationCache(edge_cache)
+        cache = _edge_caches[edge_cache]
+    validator.edge_cache = cache
+    hits, misses = (cache.hits, cache.misses) if cache is not None else (0, 0)
+
+    test_case_class.validate_trapi_response(validator, test_asset, trapi_response)
+
+    if cache is not None:
+        hits, misses = cache.hits - hits, cache.misses - misses
+    return validator.messages, (hits, misses)
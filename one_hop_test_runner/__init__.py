@@ -7,6 +7,8 @@ from typing import Any, Optional, Dict
 from json import dump
 import asyncio
 
+from reasoner_validator.validator import TRAPIResponseValidator
+
 from graph_validation_tests import (
     GraphValidationTest,
     TestCaseRun,
@@ -41,15 +43,20 @@ class OneHopTestCaseRun(TestCaseRun):
     #         trapi_request=trapi_request, kp_source=test_asset['kp_source']
     #     )
 
-    def validate_test_case(self):
+    @staticmethod
+    def validate_trapi_response(
+            validator: TRAPIResponseValidator,
+            test_asset: Optional[Dict[str, Any]],
+            trapi_response: Optional[Dict[str, Any]]
+    ):
         """
         Validates a previously run TRAPI response JSON result
         resulting from a provided TestAsset, against the output
-        validation criteria of the given StandardsValidationTest.
-        The 'test_asset' and 'trapi_response' values are expected
-        to be recorded in the TestCaseRun instance attributes.
+        validation criteria of the given OneHopTest.
 
-        :return: Dict, a dictionary containing the Translator Test results
+        :param validator: TRAPIResponseValidator, validator into which validation messages are reported.
+        :param test_asset: Optional[Dict[str, Any]], translated TestAsset of the test case
+        :param trapi_response: Optional[Dict[str, Any]], TRAPI Response to be validated
         """
         # We assume that nothing is badly wrong with the TRAPI Response to this point, then we
         # check whether the test input edge was returned in the Response Message knowledge graph.
@@ -65,12 +72,12 @@ class OneHopTestCaseRun(TestCaseRun):
         #
         # the contents for which ought to be returned in
         # the TRAPI Knowledge Graph, as a Result mapping?
-        if not self.trapi_response:
+        if not trapi_response:
             # nothing to validate here? Report this and exit...
-            self.report(code="error.trapi.response.empty")
+            validator.report(code="error.trapi.response.empty")
             return
 
-        self.testcase_input_found_in_response(self.test_asset, self.trapi_response)
+        validator.testcase_input_found_in_response(test_asset, trapi_response)
 
 
 class OneHopTest(GraphValidationTest):
@@ -2,37 +2,60 @@
 TRAPI and Biolink Model Standards Validation
 test (using reasoner-validator)
 """
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Type
 import asyncio
 
+from reasoner_validator.validator import TRAPIResponseValidator
+
 from graph_validation_tests import (
     GraphValidationTest,
     TestCaseRun,
     get_parameters
 )
+from graph_validation_tests.utils.edge_cache import EdgeCachingValidator
 
 # For the initial implementation of the StandardsValidation,
 # we just do a simply 'by_subject' TRAPI query
 from graph_validation_tests.utils.unit_test_templates import by_subject, by_object
 
 
-class StandardsValidationTestCaseRun(TestCaseRun):
+class StandardsValidationTestCaseRun(TestCaseRun, EdgeCachingValidator):
+
+    # knowledge graph edges are validated incrementally, given an 'edge_validation_cache'
+    validator_class: Type[TRAPIResponseValidator] = EdgeCachingValidator
+
+    # TRAPI Responses are validated without reference to the TestAsset, hence identical
+    # TRAPI Responses - whatever the TestCase template or component - are validated once
+    validation_uses_test_asset: bool = False
+
+    def __init__(self, test_run, **kwargs):
+        """
+        :param test_run: StandardsValidationTest, owner of test case
+        :param kwargs: Dict, named arguments of the TestCaseRun
+        """
+        super().__init__(test_run=test_run, **kwargs)
+        self.edge_cache = test_run.edge_validation_cache
 
-    def validate_test_case(self):
+    @staticmethod
+    def validate_trapi_response(
+            validator: TRAPIResponseValidator,
+            test_asset: Optional[Dict[str, Any]],
+            trapi_response: Optional[Dict[str, Any]]
+    ):
         """
         Validates a previously run TRAPI response JSON result
         resulting from a provided TestAsset, against the output
         validation criteria of the given StandardsValidationTest.
-        The test_asset and trapi_response values are expected
-        to be recorded in the TestCaseRun instance attributes.
 
-        :return: Dict, a dictionary containing the Translator Test results
+        :param validator: TRAPIResponseValidator, validator into which validation messages are reported.
+        :param test_asset: Optional[Dict[str, Any]], translated TestAsset of the test case (ignored here)
+        :param trapi_response: Optional[Dict[str, Any]], TRAPI Response to be validated
         """
         # We assume that there is some kind of TRAPI Response to this point,
         # then we check whether the TRAPI Response JSON is compliant with
         # current TRAPI and Biolink Model version expectations,
         # assessed without any reference back to the input TestAsset.
-        self.check_compliance_of_trapi_response(response=self.trapi_response)
+        validator.check_compliance_of_trapi_response(response=trapi_response)
 
 
 class StandardsValidationTest(GraphValidationTest):
@@ -0,0 +1,77 @@
+"""
+Unit tests of access to stored TRAPI Responses
+"""
+from typing import Dict, List, Tuple
+from pathlib import Path
+import gzip
+import json
+import tarfile
+import zipfile
+import pytest
+
+from graph_validation_tests.utils.archive import iter_archived_files, load_archived_response
+
+SAMPLE_TRAPI_RESPONSE: Dict = {
+    "message": {
+        "query_graph": {"nodes": {}, "edges": {}},
+        "knowledge_graph": {"nodes": {}, "edges": {}},
+        "results": []
+    }
+}
+
+SAMPLE_FILES: Dict[str, bytes] = {
+    "night-1/response-1.json": json.dumps(SAMPLE_TRAPI_RESPONSE).encode("utf-8"),
+    "night-1/ars-message.json.gz": gzip.compress(
+        json.dumps({"pk": "some-pk", "fields": {"data": SAMPLE_TRAPI_RESPONSE}}).encode("utf-8")
+    ),
+    "night-2/response-2.json": json.dumps(SAMPLE_TRAPI_RESPONSE).encode("utf-8"),
+    "night-2/README.txt": b"not a TRAPI Response"
+}
+
+
+def _write_directory(path: Path) -> str:
+    for name, content in SAMPLE_FILES.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_bytes(content)
+    return str(path)
+
+
+def _write_tar(path: Path) -> str:
+    archive_path: Path = path / "responses.tar.gz"
+    with tarfile.open(archive_path, mode="w:gz") as archive:
+        archive.add(_write_directory(path / "responses"), arcname=".")
+    return str(archive_path)
+
+
+def _write_zip(path: Path) -> str:
+    archive_path: Path = path / "responses.zip"
+    with zipfile.ZipFile(archive_path, mode="w") as archive:
+        for name, content in SAMPLE_FILES.items():
+            archive.writestr(name, content)
+    return str(archive_path)
+
+
+@pytest.mark.parametrize("writer", [_write_directory, _write_tar, _write_zip])
+def test_iter_archived_files(tmp_path: Path, writer):
+    source: str = writer(tmp_path)
+    files: List[Tuple[str, bytes]] = list(iter_archived_files(source))
+    assert sorted(Path(name).as_posix() for name, _ in files) == [
+        "night-1/ars-message.json.gz",
+        "night-1/response-1.json",
+        "night-2/response-2.json"
+    ]
+    for name, content in files:
+        assert load_archived_response(name, content) == SAMPLE_TRAPI_RESPONSE
+
+
+def test_iter_archived_files_of_unknown_source(tmp_path: Path):
+    not_an_archive: Path = tmp_path / "responses.txt"
+    not_an_archive.write_text("not an archive")
+    with pytest.raises(ValueError):
+        list(iter_archived_files(str(not_an_archive)))
+
+
+def test_load_archived_response_of_non_trapi_file():
+    assert load_archived_response("some.json", b'{"some": "thing"}') is None
+    with pytest.raises(ValueError):
+        load_archived_response("broken.json", b'{"message":')
@@ -0,0 +1,31 @@
+"""
+Unit tests for the wall-clock time budget of test runs
+"""
+import time
+
+from graph_validation_tests.utils.budget import RunBudget
+
+
+def test_unlimited_budget():
+    budget = RunBudget()
+    assert budget.remaining() is None
+    assert not budget.is_exhausted()
+    assert budget.get_timeout() is None
+    assert budget.get_timeout(10.0) == 10.0
+
+
+def test_limited_budget():
+    budget = RunBudget(seconds=60.0)
+    assert 0.0 < budget.remaining() <= 60.0
+    assert not budget.is_exhausted()
+    assert budget.get_timeout() <= 60.0
+    assert budget.get_timeout(10.0) == 10.0
+    assert budget.get_timeout(600.0) <= 60.0
+
+
+def test_exhausted_budget():
+    budget = RunBudget(seconds=0.01)
+    time.sleep(0.02)
+    assert budget.remaining() == 0.0
+    assert budget.is_exhausted()
+    assert budget.get_timeout(10.0) == 0.0
@@ -0,0 +1,130 @@
+"""
+Unit tests of the TTL-bounded, single-flight, memoization of functions
+"""
+from typing import List, Optional, Tuple
+import asyncio
+import threading
+import time
+import pytest
+
+from graph_validation_tests.utils.cache import TTLCache, ttl_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache():
+    clock = FakeClock()
+    cache: TTLCache = TTLCache(maxsize=2, ttl=60.0, negative_ttl=5.0, clock=clock)
+    cache.put("endpoints", ("https://molepro",))
+    cache.put("unresolved", ())
+    assert cache.get("endpoints") == (True, ("https://molepro",))
+    assert cache.get("unresolved") == (True, ())
+
+    # negative results expire sooner
+    clock.now = 10.0
+    assert cache.get("unresolved") == (False, None)
+    assert cache.get("endpoints") == (True, ("https://molepro",))
+    clock.now = 70.0
+    assert cache.get("endpoints") == (False, None)
+
+    # the least recently used value is evicted when full
+    for key in ("a", "b", "a", "c"):
+        cache.put(key, key)
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, "a")
+    assert cache.info()["size"] == 2
+
+
+def test_ttl_cache_single_flight_of_functions():
+    calls: List[str] = list()
+
+    @ttl_cache(negative_ttl=0.0)
+    def resolve(component: str) -> Tuple[str, ...]:
+        calls.append(component)
+        time.sleep(0.1)
+        return () if component == "unknown" else (f"https://{component}",)
+
+    threads: List[threading.Thread] = [threading.Thread(target=resolve, args=("molepro",)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert resolve("molepro") == ("https://molepro",)
+    assert calls == ["molepro"]
+
+    # negative results are not cached here (zero negative TTL), hence retried
+    assert resolve("unknown") == ()
+    assert resolve("unknown") == ()
+    assert calls == ["molepro", "unknown", "unknown"]
+
+    resolve.cache_clear()
+    assert resolve(component="molepro") == ("https://molepro",)
+    assert calls[-1] == "molepro"
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_single_flight_of_coroutines():
+    calls: List[str] = list()
+
+    @ttl_cache()
+    async def resolve(component: str) -> Optional[str]:
+        calls.append(component)
+        await asyncio.sleep(0.05)
+        if component == "failing":
+            raise RuntimeError("Registry unavailable")
+        return f"https://{component}"
+
+    assert await asyncio.gather(*[resolve("molepro") for _ in range(5)]) == ["https://molepro"] * 5
+    assert calls == ["molepro"]
+
+    # a failed evaluation is not cached: each of the concurrent calls evaluates in turn
+    outcomes = await asyncio.gather(*[resolve("failing") for _ in range(2)], return_exceptions=True)
+    assert all(isinstance(outcome, RuntimeError) for outcome in outcomes)
+    assert calls == ["molepro", "failing", "failing"]
+    assert resolve.cache_info()["size"] == 1
+
+
+def test_ttl_cache_clear_discards_loads_in_flight():
+    cache: TTLCache = TTLCache()
+    assert cache.get("endpoints") == (False, None)
+    generation: int = cache.generation
+    cache.clear()
+    # a value loaded before the clear() is stale, hence not stored...
+    cache.put("endpoints", ("https://stale",), generation=generation)
+    assert cache.get("endpoints") == (False, None)
+    # ... but a value loaded after the clear() is stored
+    cache.put("endpoints", ("https://fresh",), generation=cache.generation)
+    assert cache.get("endpoints") == (True, ("https://fresh",))
+    # statistics are cumulative across clear()
+    assert cache.info()["hits"] == 1
+    assert cache.info()["misses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_clear_during_evaluation_of_coroutine():
+    started = asyncio.Event()
+    release = asyncio.Event()
+    registry: List[str] = ["https://stale"]
+
+    @ttl_cache()
+    async def resolve(component: str) -> str:
+        started.set()
+        value: str = registry[0]
+        await release.wait()
+        return value
+
+    evaluation = asyncio.create_task(resolve("molepro"))
+    await started.wait()
+    # the Registry data is replaced while the (stale) evaluation is in flight
+    registry[0] = "https://fresh"
+    resolve.cache_clear()
+    release.set()
+    assert await evaluation == "https://stale"
+    assert resolve.cache_info()["size"] == 0
+    assert await resolve("molepro") == "https://fresh"
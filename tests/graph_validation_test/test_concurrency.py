@@ -0,0 +1,84 @@
+"""
+Unit tests for adaptive (AIMD) concurrency control
+"""
+import asyncio
+import pytest
+
+from graph_validation_tests.utils.concurrency import (
+    LatencyStats,
+    AdaptiveConcurrencyLimiter,
+    is_overloaded
+)
+
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+@pytest.mark.parametrize(
+    "status_code,result",
+    [
+        (None, False),
+        (200, False),
+        (404, False),
+        (408, True),
+        (429, True),
+        (500, True),
+        (503, True)
+    ]
+)
+def test_is_overloaded(status_code, result: bool):
+    assert is_overloaded(status_code) is result
+
+
+def test_latency_stats():
+    stats = LatencyStats(window=5)
+    assert stats.median() is None
+    for latency in [5.0, 1.0, 2.0, 3.0, 4.0, 10.0]:
+        stats.add(latency)
+    # oldest sample (5.0) has rolled out of the window
+    assert stats.count() == 5
+    assert stats.median() == 3.0
+    assert stats.percentile(100) == 10.0
+    assert stats.percentile(0) == 1.0
+
+
+@pytest.mark.asyncio
+async def test_limiter_additive_increase():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+    for _ in range(50):
+        started = await limiter.acquire()
+        limiter.release(started, 200)
+    assert limiter.get_limit() == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_multiplicative_decrease():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=16)
+    started = [await limiter.acquire() for _ in range(8)]
+    # all in-flight queries failing together only count as one decrease
+    for start in started:
+        limiter.release(start, 503)
+    assert limiter.get_limit() == 4
+
+    start = await limiter.acquire()
+    limiter.release(start, 429)
+    assert limiter.get_limit() == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_bounds_requests_in_flight():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+    in_flight = {"now": 0, "max": 0}
+
+    async def query():
+        started = await limiter.acquire()
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["now"], in_flight["max"])
+        await asyncio.sleep(0.001)
+        in_flight["now"] -= 1
+        limiter.release(started, 200)
+
+    await asyncio.gather(*[query() for _ in range(20)])
+    assert in_flight["max"] == 3
+    assert limiter.in_flight == 0
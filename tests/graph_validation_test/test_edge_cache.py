@@ -0,0 +1,87 @@
+"""
+Unit tests of the incremental, edge-level validation of TRAPI Response knowledge graphs
+"""
+from typing import Dict
+from copy import deepcopy
+from pathlib import Path
+
+from reasoner_validator.report import TRAPIGraphType
+
+from graph_validation_tests.utils.edge_cache import EdgeCachingValidator
+from graph_validation_tests.utils.validation_cache import ValidationCache
+
+SAMPLE_KNOWLEDGE_GRAPH: Dict = {
+    "nodes": {
+        "CHEBI:3002": {"categories": ["biolink:SmallMolecule"]},
+        "MONDO:0005148": {"categories": ["biolink:Disease"]},
+        "NCBIGene:1017": {"categories": ["biolink:Gene"]}
+    },
+    "edges": {
+        "edge_1": {
+            "subject": "CHEBI:3002",
+            "predicate": "biolink:treats",
+            "object": "MONDO:0005148",
+            "sources": [{"resource_id": "infores:molepro", "resource_role": "primary_knowledge_source"}]
+        },
+        "edge_2": {
+            "subject": "NCBIGene:1017",
+            "predicate": "biolink:gene_associated_with_condition",
+            "object": "MONDO:0005148",
+            "sources": []
+        }
+    }
+}
+
+
+def _validate(knowledge_graph: Dict, edge_cache: ValidationCache) -> Dict:
+    # Biolink Model validation is suppressed here, so as not to need the Biolink Model Toolkit
+    validator = EdgeCachingValidator(trapi_version="1.5.0", biolink_version="suppress")
+    validator.edge_cache = edge_cache
+    validator.check_biolink_model_compliance(graph=knowledge_graph, graph_type=TRAPIGraphType.Knowledge_Graph)
+    return validator.get_all_messages()
+
+
+def test_edge_caching_validator(tmp_path: Path):
+    edge_cache = ValidationCache(str(tmp_path / "edge_validation_cache.sqlite"))
+    uncached_messages: Dict = _validate(SAMPLE_KNOWLEDGE_GRAPH, edge_cache=None)
+    assert _validate(SAMPLE_KNOWLEDGE_GRAPH, edge_cache) == uncached_messages
+    assert (edge_cache.hits, edge_cache.misses) == (0, 2)
+
+    # all the edges were already validated: the (same) messages of the edges are all cached
+    assert _validate(SAMPLE_KNOWLEDGE_GRAPH, edge_cache) == uncached_messages
+    assert (edge_cache.hits, edge_cache.misses) == (2, 2)
+
+    # only the changed edge is validated again
+    changed: Dict = deepcopy(SAMPLE_KNOWLEDGE_GRAPH)
+    changed["edges"]["edge_2"]["sources"] = deepcopy(changed["edges"]["edge_1"]["sources"])
+    assert _validate(changed, edge_cache) == _validate(changed, edge_cache=None)
+    assert (edge_cache.hits, edge_cache.misses) == (3, 3)
+    edge_cache.close()
+
+
+def test_edge_caching_validator_reports_dangling_nodes(tmp_path: Path):
+    edge_cache = ValidationCache(str(tmp_path / "edge_validation_cache.sqlite"))
+    knowledge_graph: Dict = deepcopy(SAMPLE_KNOWLEDGE_GRAPH)
+    knowledge_graph["nodes"]["HP:0000001"] = {"categories": ["biolink:PhenotypicFeature"]}
+    _validate(knowledge_graph, edge_cache)
+    messages: Dict = _validate(knowledge_graph, edge_cache)
+    assert edge_cache.hits == 2
+    warnings: Dict = messages["Validate TRAPI Response"]["Standards Test"]["warning"]
+    assert "HP:0000001" in str(warnings["warning.knowledge_graph.nodes.dangling"])
+    assert "CHEBI:3002" not in str(warnings["warning.knowledge_graph.nodes.dangling"])
+    edge_cache.close()
+
+
+def test_edge_caching_validator_batches_cache_accesses(tmp_path: Path, monkeypatch):
+    edge_cache = ValidationCache(str(tmp_path / "edge_validation_cache.sqlite"))
+
+    def unbatched(*args, **kwargs):
+        raise AssertionError("edge cache accessed edge by edge")
+
+    monkeypatch.setattr(edge_cache, "get", unbatched)
+    monkeypatch.setattr(edge_cache, "put", unbatched)
+    uncached_messages: Dict = _validate(SAMPLE_KNOWLEDGE_GRAPH, edge_cache=None)
+    assert _validate(SAMPLE_KNOWLEDGE_GRAPH, edge_cache) == uncached_messages
+    assert _validate(SAMPLE_KNOWLEDGE_GRAPH, edge_cache) == uncached_messages
+    assert (edge_cache.hits, edge_cache.misses) == (2, 2)
+    edge_cache.close()
@@ -0,0 +1,84 @@
+"""
+Unit tests for latency-aware selection amongst redundant TRAPI servers
+"""
+from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+from graph_validation_tests.utils.endpoint_stats import (
+    UNHEALTHY_FAILURES,
+    get_endpoint_distribution,
+    order_endpoints,
+    record_failure,
+    record_success
+)
+
+
+def record_latency(url: str, latency: float, samples: int = 5):
+    for _ in range(samples):
+        record_success(url, latency)
+
+
+def test_registry_order():
+    endpoints = ("https://registry-1", "https://registry-2")
+    record_latency("https://registry-1", 1.0)
+    record_latency("https://registry-2", 0.1)
+    assert order_endpoints(endpoints, "registry") == endpoints
+
+
+def test_fastest_healthy_endpoint_first():
+    endpoints = ("https://slow", "https://fast", "https://unknown")
+    record_latency("https://slow", 1.0)
+    record_latency("https://fast", 0.1)
+    assert order_endpoints(endpoints, "fastest") == ("https://fast", "https://slow", "https://unknown")
+
+
+def test_unhealthy_endpoint_last():
+    endpoints = ("https://failing", "https://healthy")
+    record_latency("https://failing", 0.1)
+    record_latency("https://healthy", 1.0)
+    for _ in range(UNHEALTHY_FAILURES):
+        record_failure("https://failing")
+    assert order_endpoints(endpoints, "fastest") == ("https://healthy", "https://failing")
+    assert not get_endpoint_distribution(["https://failing"])["https://failing"]["healthy"]
+
+    # a success restores the server's health
+    record_success("https://failing", 0.1)
+    assert order_endpoints(endpoints, "fastest")[0] == "https://failing"
+
+
+def test_weighted_round_robin():
+    endpoints = ("https://weight-1", "https://weight-3")
+    record_latency("https://weight-1", 0.3)
+    record_latency("https://weight-3", 0.1)
+    selected: List[str] = [order_endpoints(endpoints, "weighted")[0] for _ in range(400)]
+    # selections are spread in proportion to the inverse latency of the servers
+    assert selected.count("https://weight-3") == 300
+    assert selected.count("https://weight-1") == 100
+
+    distribution: Dict[str, Dict] = get_endpoint_distribution(endpoints)
+    assert distribution["https://weight-3"]["selected"] == 300
+    assert distribution["https://weight-3"]["median_latency"] == 0.1
+
+
+def test_unknown_strategy():
+    with pytest.raises(AssertionError):
+        order_endpoints(("https://registry-1",), "random")
+
+
+def test_endpoint_stats_recorded_from_worker_threads():
+    endpoints = ("https://probed-1", "https://probed-2")
+
+    def probe(url: str):
+        for latency in range(2000):
+            record_success(url, latency / 1000.0)
+
+    # e.g. liveness probes recorded by pre-flight worker threads, while servers are selected
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        probes = [executor.submit(probe, url) for url in endpoints]
+        while not all(future.done() for future in probes):
+            assert set(order_endpoints(endpoints, "fastest")) == set(endpoints)
+            get_endpoint_distribution(endpoints)
+        for future in probes:
+            future.result()
+    assert all(get_endpoint_distribution(endpoints)[url]["healthy"] for url in endpoints)
@@ -1,9 +1,15 @@
 """
 Unit tests for pieces of the GraphValidationTests code
 """
-from typing import List, Dict
+from typing import Any, List, Dict, Optional
+from copy import deepcopy
+import pytest
 from translator_testing_model.datamodel.pydanticmodel import TestAsset
-from graph_validation_tests import TestCaseRun, GraphValidationTest
+from graph_validation_tests import TestCasePlan, TestCaseRun, GraphValidationTest
+from graph_validation_tests.translator.trapi.preflight import ComponentResolution
+from graph_validation_tests.utils.budget import RunBudget
+from graph_validation_tests.utils.response_store import ResponseStore
+from graph_validation_tests.utils.validation_cache import ResponseValidations, ValidationCache, response_fingerprint
 from graph_validation_tests.utils.unit_test_templates import by_subject, by_object, raise_object_entity
 from tests import DEFAULT_TRAPI_VERSION, DEFAULT_BMT
 
@@ -102,6 +108,40 @@ def test_test_case_run_report_messages():
     assert "skipped.test" in skipped
 
 
+SAMPLE_TEST_ASSET_WITHOUT_PREDICATE: TestAsset = GraphValidationTest.build_test_asset(
+    test_asset_id="TestAsset_2",
+    subject_id=TEST_SUBJECT_ID,
+    subject_category=TEST_SUBJECT_CATEGORY,
+    predicate_id="",
+    object_id=TEST_OBJECT_ID,
+    object_category=TEST_OBJECT_CATEGORY
+)
+
+
+def test_test_case_runs_share_test_case_context():
+    gvt: GraphValidationTest = GraphValidationTest(test_asset=SAMPLE_TEST_ASSET_WITHOUT_PREDICATE)
+    first: TestCaseRun = TestCaseRun(test_run=gvt, test=by_subject)
+    second: TestCaseRun = TestCaseRun(test_run=gvt, test=by_object)
+    assert second.context is first.context
+
+    # ... every TestCaseRun reports the messages of the translation of the TestAsset
+    assert "error.input_edge.predicate.missing" in first.get_errors()
+    assert "error.input_edge.predicate.missing" in second.get_errors()
+
+    # ... and a TestCaseRun sharing the context has the same validator
+    # state as the TestCaseRun which translated the TestAsset
+    constructed: TestCaseRun = TestCaseRun(
+        test_run=GraphValidationTest(test_asset=SAMPLE_TEST_ASSET_WITHOUT_PREDICATE),
+        test=by_object
+    )
+    assert constructed.context is not second.context
+    assert vars(second).keys() == vars(constructed).keys()
+    for name, value in vars(constructed).items():
+        if name in ("test_run", "context"):
+            continue
+        assert vars(second)[name] == value, name
+
+
 def test_format_results():
     # create dummy test asset and test case runs
     # with artificially generated validation messages
@@ -185,3 +225,334 @@ def test_format_results():
     assert "status" in formatted_output_1[by_object_test_case_id]["ars"]
     assert formatted_output_1[by_object_test_case_id]["ars"]["status"] == "FAILED"
     assert formatted_output_1[by_object_test_case_id]["ars"]["messages"]
+
+
+@pytest.mark.asyncio
+async def test_test_case_timeouts():
+    gvt: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="ars",
+        test_case_timeouts={"by_subject": 5.0, "ARS": 10.0}
+    )
+    # test specific timeouts take precedence over component type timeouts
+    assert await gvt.get_test_case_timeout("by_subject") == 5.0
+    assert await gvt.get_test_case_timeout("by_object") == 10.0
+
+    # ... but are capped by the run time budget
+    gvt.run_budget = RunBudget(seconds=1.0)
+    assert await gvt.get_test_case_timeout("by_subject") <= 1.0
+
+    # test cases of components of unresolved type are still given a deadline
+    unknown: GraphValidationTest = GraphValidationTest(test_asset=SAMPLE_TEST_ASSET, component="unknown")
+    assert await unknown.get_test_case_timeout("by_subject") == GraphValidationTest.DEFAULT_TEST_CASE_TIMEOUT
+
+
+def test_timed_out_test_case_skipped():
+    gvt: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET
+    )
+    tcr: TestCaseRun = TestCaseRun(
+        test_run=gvt,
+        test=by_subject
+    )
+    tcr.report_timeout("query")
+    assert tcr.timed_out
+    formatted_output: Dict = gvt.format_results([tcr])
+    by_subject_test_case_id: str = f"{SAMPLE_TEST_ASSET_ID}-by_subject"
+    assert formatted_output[by_subject_test_case_id]["ars"]["status"] == "SKIPPED"
+    assert "skipped.test" in formatted_output[by_subject_test_case_id]["ars"]["messages"]["skipped"]
+
+
+def test_skipped_test_case_template_passed():
+    gvt: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET
+    )
+    tcr: TestCaseRun = TestCaseRun(
+        test_run=gvt,
+        test=by_subject
+    )
+    # e.g. a TestCase template not applicable to the TestAsset
+    tcr.report(code="skipped.test", identifier="by_subject", context="ars", reason="not applicable")
+    formatted_output: Dict = gvt.format_results([tcr])
+    by_subject_test_case_id: str = f"{SAMPLE_TEST_ASSET_ID}-by_subject"
+    # ... only timed out test cases are reported as SKIPPED
+    assert formatted_output[by_subject_test_case_id]["ars"]["status"] == "PASSED"
+    assert "skipped.test" in formatted_output[by_subject_test_case_id]["ars"]["messages"]["skipped"]
+
+
+def test_timed_out_ars_test_case_reports_pending_aras():
+    gvt: GraphValidationTest = SampleGraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="ars"
+    )
+    tcr: TestCaseRun = TestCaseRun(
+        test_run=gvt,
+        test=by_subject
+    )
+    tcr.ars_children["aragorn-pk"] = {
+        "message": "aragorn-pk",
+        "actor": {"agent": "ara-aragorn", "inforesid": "infores:aragorn"}
+    }
+    tcr.report_timeout("query")
+    assert not tcr.ars_children
+    formatted_output: Dict = gvt.format_results([tcr])
+    by_subject_test_case_id: str = f"{SAMPLE_TEST_ASSET_ID}-by_subject"
+    assert formatted_output[by_subject_test_case_id]["ars"]["status"] == "SKIPPED"
+    assert formatted_output[by_subject_test_case_id]["aragorn"]["status"] == "SKIPPED"
+    assert "skipped.test" in formatted_output[by_subject_test_case_id]["aragorn"]["messages"]["skipped"]
+
+
+def test_ars_child_test_case_runs_reported():
+    gvt: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="ars"
+    )
+    tcr: TestCaseRun = TestCaseRun(
+        test_run=gvt,
+        test=by_subject
+    )
+    child: TestCaseRun = TestCaseRun(
+        test_run=gvt,
+        test=by_subject,
+        component="aragorn"
+    )
+    assert child.get_component() == "aragorn"
+    child.report("critical.trapi.response.unexpected_http_code", identifier=503)
+    tcr.child_runs.append(child)
+    formatted_output: Dict = gvt.format_results([tcr])
+    by_subject_test_case_id: str = f"{SAMPLE_TEST_ASSET_ID}-by_subject"
+    assert "ars" in formatted_output[by_subject_test_case_id]
+    assert formatted_output[by_subject_test_case_id]["aragorn"]["status"] == "FAILED"
+
+
+def test_trapi_response_moved_into_response_store(tmp_path):
+    gvt: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="molepro",
+        response_store=ResponseStore(str(tmp_path)),
+        run_id="run-1"
+    )
+    trapi_response: Dict = {"message": {"query_graph": {"nodes": {}, "edges": {}}}}
+    tcr: TestCaseRun = TestCaseRun(
+        test_run=gvt,
+        trapi_response=trapi_response
+    )
+    tcr.store_trapi_response()
+    assert tcr.response_hash
+    assert tcr._trapi_response is None
+    assert tcr.trapi_response == trapi_response
+    assert gvt.response_store.get("run-1", tcr.get_test_case_id(), "molepro") == trapi_response
+
+
+def test_cached_validation_of_identical_trapi_response(tmp_path):
+    gvt: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="molepro",
+        validation_cache=ValidationCache(str(tmp_path / "validation_cache.sqlite"))
+    )
+    trapi_response: Dict = {"message": {"query_graph": {"nodes": {}, "edges": {}}}}
+    tcr: TestCaseRun = TestCaseRun(test_run=gvt, trapi_response=trapi_response)
+    assert not tcr.load_cached_validation()
+    tcr.report(code="warning.trapi.response.message.knowledge_graph.empty")
+    tcr.save_cached_validation(tcr.get_all_messages())
+
+    # the same TRAPI Response, with (timestamped) logs, in a later test case run
+    cached_tcr: TestCaseRun = TestCaseRun(
+        test_run=gvt,
+        trapi_response=dict(trapi_response, logs=[{"timestamp": "2024-05-01T00:00:00"}])
+    )
+    assert cached_tcr.load_cached_validation()
+    assert cached_tcr.has_warnings()
+    assert gvt.validation_cache.get_hit_rate() == 0.5
+
+
+def test_test_case_runs_share_validator_context():
+    gvt: GraphValidationTest = GraphValidationTest(test_asset=SAMPLE_TEST_ASSET, component="molepro")
+    first: TestCaseRun = TestCaseRun(test_run=gvt, test=by_subject)
+    second: TestCaseRun = TestCaseRun(test_run=gvt, test=by_object, strict_validation=True)
+    assert gvt.test_case_context is first.context is second.context
+    assert second.test_asset is first.test_asset
+    assert second.test_asset["subject_id"] == TEST_SUBJECT_ID
+    assert second.bmt is first.bmt
+    assert second.trapi_version == first.trapi_version
+    assert second.biolink_version == first.biolink_version
+    assert second.default_test == "by_object"
+    assert second.strict_validation
+    assert not first.strict_validation
+
+    # validation messages remain specific to each TestCaseRun
+    second.report(code="info.compliant")
+    assert second.has_information()
+    assert not first.has_information()
+
+
+class CountingTestCaseRun(TestCaseRun):
+
+    validation_uses_test_asset: bool = False
+    validations: int = 0
+
+    @staticmethod
+    def validate_trapi_response(validator, test_asset: Optional[Dict[str, Any]], trapi_response: Optional[Dict[str, Any]]):
+        CountingTestCaseRun.validations += 1
+        validator.report(code="warning.trapi.response.message.knowledge_graph.empty")
+
+
+def test_validation_reused_for_identical_trapi_responses():
+    # two components (e.g. proxying the same KP) within the same run of tests
+    response_validations: ResponseValidations = ResponseValidations()
+    molepro: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="molepro",
+        response_validations=response_validations
+    )
+    arax: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="arax",
+        response_validations=response_validations
+    )
+    trapi_response: Dict = {"message": {"query_graph": {"nodes": {}, "edges": {}}}}
+    CountingTestCaseRun.validations = 0
+    test_case_runs: List[TestCaseRun] = list()
+    for test_run, test in ((molepro, by_subject), (molepro, by_object), (arax, by_subject)):
+        tcr: TestCaseRun = CountingTestCaseRun(test_run=test_run, test=test)
+        tcr.trapi_response = dict(trapi_response, logs=[{"message": f"{test_run.default_target} {test.__name__}"}])
+        tcr.validate_test_case()
+        test_case_runs.append(tcr)
+
+    assert CountingTestCaseRun.validations == 1
+    assert response_validations.get_statistics() == {"hits": 2, "misses": 1}
+
+    # the reused messages are reported under the test name and target of each test case
+    for tcr in test_case_runs:
+        assert list(tcr.get_all_messages()) == [tcr.default_target]
+        assert list(tcr.get_all_messages()[tcr.default_target]) == [tcr.default_test]
+        assert tcr.has_warnings()
+
+
+@pytest.mark.asyncio
+async def test_trapi_response_fingerprinted_off_the_event_loop(monkeypatch):
+    import threading
+    import graph_validation_tests
+    gvt: GraphValidationTest = GraphValidationTest(test_asset=SAMPLE_TEST_ASSET)
+    trapi_response: Dict = {"message": {"query_graph": {"nodes": {}, "edges": {}}}}
+    validated: TestCaseRun = CountingTestCaseRun(test_run=gvt, test=by_subject)
+    validated.trapi_response = trapi_response
+    validated.validate_test_case()
+
+    fingerprinting_threads: List[threading.Thread] = list()
+
+    def recording_response_fingerprint(response: Dict) -> str:
+        fingerprinting_threads.append(threading.current_thread())
+        return response_fingerprint(response)
+
+    monkeypatch.setattr(graph_validation_tests, "response_fingerprint", recording_response_fingerprint)
+    tcr: TestCaseRun = CountingTestCaseRun(test_run=gvt, test=by_object)
+    tcr.trapi_response = deepcopy(trapi_response)
+
+    # the validation of the identical TRAPI Response is reused (so the executor is not used)
+    await tcr.validate_test_case_in_executor(executor=None)
+    assert tcr.has_warnings()
+    assert fingerprinting_threads and threading.current_thread() not in fingerprinting_threads
+
+
+def test_test_case_plan_shared_by_components():
+    generated: List[str] = list()
+
+    def counting_by_subject(test_asset: Dict):
+        generated.append(test_asset["subject_id"])
+        return by_subject(test_asset)
+
+    test_case_plan: TestCasePlan = TestCasePlan()
+    molepro: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="molepro",
+        test_case_plan=test_case_plan
+    )
+    arax: GraphValidationTest = GraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="arax",
+        test_case_plan=test_case_plan
+    )
+    molepro_tcr: TestCaseRun = TestCaseRun(test_run=molepro, test=counting_by_subject)
+    arax_tcr: TestCaseRun = TestCaseRun(test_run=arax, test=counting_by_subject)
+
+    # the TestAsset is translated once, for all the components
+    assert molepro_tcr.context is arax_tcr.context
+    assert arax_tcr.default_target == "arax"
+
+    # ... and the TRAPI request generated once, but each TestCaseRun gets its own copy
+    molepro_request, _, _ = test_case_plan.generate_trapi_request(counting_by_subject, molepro_tcr.test_asset)
+    arax_request, _, _ = test_case_plan.generate_trapi_request(counting_by_subject, arax_tcr.test_asset)
+    assert generated == [TEST_SUBJECT_ID]
+    assert arax_request == molepro_request
+    assert arax_request is not molepro_request
+
+
+def test_malformed_trapi_request_reported():
+
+    def malformed_by_subject(test_asset: Dict):
+        trapi_request, output_element, output_node_binding = by_subject(test_asset)
+        trapi_request["message"]["query_graph"]["nodes"] = "not a dictionary of query nodes"
+        return trapi_request, output_element, output_node_binding
+
+    gvt: GraphValidationTest = GraphValidationTest(test_asset=SAMPLE_TEST_ASSET)
+    tcr: TestCaseRun = TestCaseRun(test_run=gvt, test=malformed_by_subject)
+
+    # the malformed TRAPI request is reported, rather than raised
+    assert not tcr.prepare_test_case_query()
+    assert "critical.trapi.validation" in tcr.get_critical()
+    assert tcr.trapi_request is None
+
+
+@pytest.mark.asyncio
+async def test_components_resolving_to_the_same_endpoints(monkeypatch):
+    import graph_validation_tests
+
+    async def mock_resolve_component_endpoints(component: str, **kwargs) -> tuple:
+        return endpoints[component]
+
+    endpoints: Dict[str, tuple] = {
+        "molepro": ("https://molepro.ci.transltr.io", "https://molepro-backup.ci.transltr.io"),
+        "molepro-alias": ("https://molepro-backup.ci.transltr.io", "https://molepro.ci.transltr.io"),
+        "arax": ("https://arax.ci.transltr.io",),
+        "unknown": ()
+    }
+    monkeypatch.setattr(
+        graph_validation_tests,
+        "resolve_component_endpoints",
+        mock_resolve_component_endpoints
+    )
+    keys: Dict[str, Optional[tuple]] = {
+        component: await GraphValidationTest(test_asset=SAMPLE_TEST_ASSET, component=component).get_endpoint_key()
+        for component in endpoints
+    }
+    assert keys["molepro"] == keys["molepro-alias"]
+    assert keys["arax"] != keys["molepro"]
+    assert keys["unknown"] is None
+
+    # results of a test run are also attributed to its component aliases
+    gvt: GraphValidationTest = GraphValidationTest(test_asset=SAMPLE_TEST_ASSET, component="molepro")
+    gvt.component_aliases.append("molepro-alias")
+    tcr: TestCaseRun = TestCaseRun(test_run=gvt, test=by_subject)
+    tcr.report(code="warning.trapi.response.message.knowledge_graph.empty")
+    results: Dict = gvt.format_results([tcr])[f"{SAMPLE_TEST_ASSET_ID}-by_subject"]
+    assert list(results) == ["molepro", "molepro-alias"]
+    assert results["molepro-alias"] == results["molepro"]
+
+
+class SampleGraphValidationTest(GraphValidationTest):
+    def test_case_wrapper(self, test=None, **kwargs) -> TestCaseRun:
+        return TestCaseRun(test_run=self, test=test, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_unresolvable_component_fails_fast():
+    gvt: GraphValidationTest = SampleGraphValidationTest(
+        test_asset=SAMPLE_TEST_ASSET,
+        component="unknown",
+        trapi_generators=[by_subject, by_object]
+    )
+    gvt.component_resolution = ComponentResolution("unknown", (), 0.0)
+    results: Dict = await gvt.process_test_run()
+    for test_name in ("by_subject", "by_object"):
+        assert results[f"{SAMPLE_TEST_ASSET_ID}-{test_name}"]["unknown"]["status"] == "FAILED"
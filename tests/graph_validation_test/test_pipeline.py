@@ -0,0 +1,71 @@
+"""
+Unit tests for the staged asyncio processing pipeline
+"""
+from typing import Dict, List
+import asyncio
+import pytest
+
+from graph_validation_tests.utils.pipeline import Pipeline, PipelineStage
+
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+@pytest.mark.asyncio
+async def test_pipeline_processes_all_items():
+    async def double(item: int) -> int:
+        await asyncio.sleep(0)
+        return 2*item
+
+    async def only_even(item: int):
+        return item if item % 2 == 0 else None
+
+    pipeline = Pipeline(
+        stages=[
+            PipelineStage("generate", only_even),
+            PipelineStage("fetch", double, workers=4),
+            PipelineStage("sink", double)
+        ],
+        queue_size=2
+    )
+    outputs: List[int] = await pipeline.run(range(20))
+    assert sorted(outputs) == [4*item for item in range(0, 20, 2)]
+    assert all([depth == 0 for depth in pipeline.get_queue_depths().values()])
+
+
+@pytest.mark.asyncio
+async def test_pipeline_backpressure():
+    in_flight: Dict[str, int] = {"now": 0, "max": 0}
+
+    async def fetch(item: int) -> int:
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["now"], in_flight["max"])
+        return item
+
+    async def slow_validation(item: int) -> int:
+        await asyncio.sleep(0.001)
+        in_flight["now"] -= 1
+        return item
+
+    pipeline = Pipeline(
+        stages=[
+            PipelineStage("fetch", fetch, workers=8),
+            PipelineStage("validate", slow_validation)
+        ],
+        queue_size=4
+    )
+    await pipeline.run(range(100))
+
+    # fetched items awaiting validation are bounded by the
+    # validate queue size, plus one item per fetch and validate worker
+    assert in_flight["max"] <= 4 + 8 + 1
+    assert pipeline.get_max_queue_depths()["validate"] == 4
+
+
+@pytest.mark.asyncio
+async def test_pipeline_stage_failure():
+    async def fail(item: int):
+        raise ValueError(f"Bad item {item}")
+
+    with pytest.raises(ValueError):
+        await Pipeline(stages=[PipelineStage("fail", fail, workers=2)]).run(range(5))
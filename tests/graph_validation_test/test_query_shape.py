@@ -0,0 +1,65 @@
+"""
+Unit tests of the TRAPI schema validation of TRAPI requests, cached by query shape
+"""
+from typing import Dict
+from pathlib import Path
+import pytest
+import jsonschema
+
+from graph_validation_tests.utils.query_shape import (
+    _validate_query_shape,
+    get_query_shape,
+    validate_trapi_request
+)
+
+# A minimal (local) TRAPI-like OpenAPI schema, so as not to need to access GitHub
+SAMPLE_SCHEMA = """
+openapi: 3.0.1
+components:
+  schemas:
+    Query:
+      type: object
+      properties:
+        message:
+          type: object
+      required:
+        - message
+"""
+
+
+def _trapi_request(subject_id: str, subject_category: str = "biolink:Disease") -> Dict:
+    return {
+        "message": {
+            "query_graph": {
+                "nodes": {
+                    "a": {"categories": [subject_category], "ids": [subject_id]},
+                    "b": {"categories": ["biolink:SmallMolecule"]}
+                },
+                "edges": {"ab": {"subject": "a", "object": "b", "predicates": ["biolink:treated_by"]}}
+            }
+        }
+    }
+
+
+def test_get_query_shape():
+    shape, curies = get_query_shape(_trapi_request("MONDO:0005301"))
+    assert curies == ["MONDO:0005301"]
+    assert get_query_shape(_trapi_request("MONDO:0005148"))[0] == shape
+    assert get_query_shape(_trapi_request("MONDO:0005148", "biolink:PhenotypicFeature"))[0] != shape
+
+
+def test_validate_trapi_request(tmp_path: Path):
+    schema_file: Path = tmp_path / "SampleTRAPI.yaml"
+    schema_file.write_text(SAMPLE_SCHEMA)
+    _validate_query_shape.cache_clear()
+
+    validate_trapi_request(_trapi_request("MONDO:0005301"), str(schema_file))
+    validate_trapi_request(_trapi_request("MONDO:0005148"), str(schema_file))
+    assert _validate_query_shape.cache_info().hits == 1
+
+    # TRAPI requests with malformed CURIEs are validated as is
+    validate_trapi_request(_trapi_request("not-a-curie"), str(schema_file))
+    assert _validate_query_shape.cache_info().hits == 1
+
+    with pytest.raises(jsonschema.ValidationError):
+        validate_trapi_request({"not_a_message": {}}, str(schema_file))
@@ -0,0 +1,112 @@
+"""
+Unit tests of the content-addressed TRAPI Response store
+"""
+from typing import Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+import sqlite3
+import pytest
+
+from graph_validation_tests.utils.response_store import (
+    ZLIB_CODEC,
+    ResponseStore,
+    canonical_json,
+    new_run_id,
+    zstandard
+)
+
+SAMPLE_TRAPI_RESPONSE: Dict = {
+    "message": {
+        "query_graph": {"nodes": {"n0": {"ids": ["MONDO:0005301"]}}, "edges": {}},
+        "knowledge_graph": {"nodes": {}, "edges": {}},
+        "results": []
+    }
+}
+
+
+def test_canonical_json():
+    reordered: Dict = {
+        "message": {
+            "results": [],
+            "knowledge_graph": {"edges": {}, "nodes": {}},
+            "query_graph": {"edges": {}, "nodes": {"n0": {"ids": ["MONDO:0005301"]}}}
+        }
+    }
+    assert canonical_json(reordered) == canonical_json(SAMPLE_TRAPI_RESPONSE)
+
+
+@pytest.mark.parametrize("codec", [None, ZLIB_CODEC])
+def test_response_store(tmp_path, codec):
+    store = ResponseStore(str(tmp_path), codec=codec)
+    blob_hash: str = store.put("run-1", "TestAsset_1-by_subject", "molepro", SAMPLE_TRAPI_RESPONSE)
+
+    # identical responses - of other test cases or runs - share their blob
+    assert store.put("run-1", "TestAsset_1-by_object", "molepro", deepcopy(SAMPLE_TRAPI_RESPONSE)) == blob_hash
+    assert store.put("run-2", "TestAsset_1-by_subject", "molepro", deepcopy(SAMPLE_TRAPI_RESPONSE)) == blob_hash
+    other_response: Dict = deepcopy(SAMPLE_TRAPI_RESPONSE)
+    other_response["message"]["results"].append({"node_bindings": {}, "analyses": []})
+    assert store.put("run-2", "TestAsset_1-by_object", "molepro", other_response) != blob_hash
+
+    statistics: Dict[str, int] = store.get_statistics()
+    assert statistics["responses"] == 4
+    assert statistics["blobs"] == 2
+
+    assert store.get("run-1", "TestAsset_1-by_object", "molepro") == SAMPLE_TRAPI_RESPONSE
+    assert store.get("run-2", "TestAsset_1-by_object", "molepro") == other_response
+    assert store.get("run-3", "TestAsset_1-by_object", "molepro") is None
+    assert store.get_blob(blob_hash) == SAMPLE_TRAPI_RESPONSE
+    store.close()
+
+    # the store persists
+    store = ResponseStore(str(tmp_path), codec=codec)
+    assert store.get_hash("run-1", "TestAsset_1-by_subject", "molepro") == blob_hash
+    assert store.get("run-1", "TestAsset_1-by_subject", "molepro") == SAMPLE_TRAPI_RESPONSE
+    store.close()
+
+
+def test_concurrent_response_store_puts(tmp_path):
+    store = ResponseStore(str(tmp_path))
+    responses: List[Dict] = list()
+    for i in range(8):
+        response: Dict = deepcopy(SAMPLE_TRAPI_RESPONSE)
+        response["message"]["results"] = [{"node_bindings": {}, "analyses": [], "score": i % 4}]
+        responses.append(response)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        hashes: List[str] = list(
+            executor.map(
+                lambda indexed: store.put("run-1", f"TestAsset_1-test_{indexed[0]}", "molepro", indexed[1]),
+                enumerate(responses)
+            )
+        )
+    # identical responses, stored concurrently, still share their blob
+    assert len(set(hashes)) == 4
+    statistics: Dict[str, int] = store.get_statistics()
+    assert statistics["responses"] == 8
+    assert statistics["blobs"] == 4
+    for i, response in enumerate(responses):
+        assert store.get("run-1", f"TestAsset_1-test_{i}", "molepro") == response
+    store.close()
+
+
+def test_new_run_ids_are_distinct():
+    assert new_run_id() != new_run_id()
+
+
+@pytest.mark.skipif(zstandard is not None, reason="Only relevant if zstandard is not installed")
+def test_response_store_without_zstandard(tmp_path, caplog):
+    with pytest.raises(RuntimeError):
+        ResponseStore(str(tmp_path), codec="zstd")
+
+    # zlib is used instead, with a warning, by default...
+    with caplog.at_level("WARNING"):
+        store = ResponseStore(str(tmp_path))
+    assert store.codec == ZLIB_CODEC
+    assert "'zstandard' is not installed" in caplog.text
+    store.close()
+
+    # ... but stores holding zstandard compressed blobs cannot be opened at all
+    with sqlite3.connect(str(tmp_path / "index.sqlite")) as index:
+        index.execute("INSERT INTO blobs (hash, codec, size, stored_size) VALUES ('some-hash', 'zstd', 1, 1)")
+    index.close()
+    with pytest.raises(RuntimeError, match="holds zstandard compressed TRAPI Responses"):
+        ResponseStore(str(tmp_path))
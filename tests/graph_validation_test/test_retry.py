@@ -0,0 +1,77 @@
+"""
+Unit tests for the retrying of transiently failing HTTP requests
+"""
+from typing import Dict, List, Optional
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+import pytest
+
+from graph_validation_tests.utils.retry import (
+    QueryAttempt,
+    RetryPolicy,
+    call_with_retries,
+    parse_retry_after
+)
+
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("not a date") is None
+    retry_date = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25.0 < parse_retry_after(format_datetime(retry_date, usegmt=True)) <= 30.0
+
+
+def test_retry_policy_delay():
+    policy = RetryPolicy(base_delay=1.0, max_delay=10.0)
+    for attempt in range(1, 10):
+        # full jitter: delay bounded by the exponential backoff
+        assert 0.0 <= policy.get_delay(attempt) <= min(10.0, 2 ** (attempt - 1))
+    # server requested delays take precedence...
+    assert policy.get_delay(1, retry_after=5.0) >= 5.0
+    # ... within the maximum delay
+    assert policy.get_delay(1, retry_after=3600.0) == 10.0
+
+
+def mock_call(status_codes: List[int], retry_after: Optional[str] = None):
+    calls: List[int] = list(status_codes)
+
+    async def call() -> Dict:
+        return {'status_code': calls.pop(0), 'response_json': None, 'retry_after': retry_after}
+
+    return call
+
+
+@pytest.mark.parametrize(
+    "status_codes,max_attempts,outcome,number_of_attempts",
+    [
+        ([200], 3, 200, 1),
+        ([503, 408, 200], 3, 200, 3),        # transient failures are retried
+        ([503, 503, 503, 200], 3, 503, 3),   # ... up to the maximum number of attempts
+        ([404, 200], 3, 404, 1),             # other failures are not retried
+        ([503, 200], 1, 503, 1)              # retries may be disabled
+    ]
+)
+@pytest.mark.asyncio
+async def test_call_with_retries(status_codes: List[int], max_attempts: int, outcome: int, number_of_attempts: int):
+    policy = RetryPolicy(max_attempts=max_attempts, base_delay=0.001)
+    attempts: List[QueryAttempt] = list()
+    result: Dict = await call_with_retries(mock_call(status_codes), policy, attempts)
+    assert result['status_code'] == outcome
+    assert len(attempts) == number_of_attempts
+    assert [attempt.attempt for attempt in attempts] == list(range(1, number_of_attempts + 1))
+    assert [attempt.status_code for attempt in attempts] == status_codes[:number_of_attempts]
+    assert attempts[-1].delay == 0.0
+
+
+@pytest.mark.asyncio
+async def test_call_with_retries_honors_retry_after():
+    policy = RetryPolicy(base_delay=0.001, max_delay=0.05)
+    attempts: List[QueryAttempt] = list()
+    await call_with_retries(mock_call([429, 200], retry_after="1"), policy, attempts)
+    # Retry-After of 1 second, capped by the policy's maximum delay
+    assert attempts[0].delay == 0.05
@@ -0,0 +1,61 @@
+"""
+Unit tests of the cache of compiled TRAPI schema validators
+"""
+from pathlib import Path
+import pytest
+import jsonschema
+
+from graph_validation_tests.utils.trapi_schema import (
+    CompiledSchemaValidator,
+    get_trapi_schema_validator,
+    validate_trapi_schema
+)
+
+# A minimal (local) TRAPI-like OpenAPI schema, so as not to need to access GitHub
+SAMPLE_SCHEMA = """
+openapi: 3.0.1
+components:
+  schemas:
+    Query:
+      type: object
+      properties:
+        message:
+          $ref: '#/components/schemas/Message'
+      required:
+        - message
+    Message:
+      type: object
+      properties:
+        query_graph:
+          type: object
+          nullable: true
+"""
+
+
+@pytest.fixture
+def schema_file(tmp_path: Path) -> str:
+    path: Path = tmp_path / "SampleTRAPI.yaml"
+    path.write_text(SAMPLE_SCHEMA)
+    return str(path)
+
+
+def test_get_trapi_schema_validator(schema_file: str):
+    validator = get_trapi_schema_validator(schema_file, "Query")
+    assert get_trapi_schema_validator(schema_file, "Query") is validator
+    assert get_trapi_schema_validator(schema_file, "Message") is not validator
+
+
+def test_validate_trapi_schema(schema_file: str):
+    validate_trapi_schema({"message": {"query_graph": None}}, schema_file, "Query")
+    with pytest.raises(jsonschema.ValidationError):
+        validate_trapi_schema({"message": {"query_graph": "not an object"}}, schema_file, "Query")
+    with pytest.raises(jsonschema.ValidationError):
+        validate_trapi_schema({}, schema_file, "Query")
+
+
+def test_compiled_schema_validator(schema_file: str):
+    validator = CompiledSchemaValidator(trapi_version=schema_file, biolink_version="suppress")
+    validator.is_valid_trapi_query({"message": {}}, component="Query")
+    assert not validator.has_critical()
+    validator.is_valid_trapi_query({"not_a_message": {}}, component="Query")
+    assert validator.has_critical()
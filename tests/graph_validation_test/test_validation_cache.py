@@ -0,0 +1,132 @@
+"""
+Unit tests of the cache of validation messages of TRAPI Responses
+"""
+from typing import Dict
+from copy import deepcopy
+from pathlib import Path
+import asyncio
+import pytest
+
+from graph_validation_tests.utils.validation_cache import (
+    ResponseValidations,
+    ValidationCache,
+    response_fingerprint,
+    validation_key
+)
+
+SAMPLE_TRAPI_RESPONSE: Dict = {
+    "message": {
+        "query_graph": {"nodes": {}, "edges": {}},
+        "knowledge_graph": {
+            "nodes": {
+                "CHEBI:3002": {"categories": ["biolink:SmallMolecule"]},
+                "MONDO:0005148": {"categories": ["biolink:Disease"]}
+            },
+            "edges": {}
+        },
+        "results": [
+            {"node_bindings": {"a": [{"id": "CHEBI:3002"}]}, "analyses": []},
+            {"node_bindings": {"a": [{"id": "MONDO:0005148"}]}, "analyses": []}
+        ]
+    },
+    "logs": [{"timestamp": "2024-05-01T00:00:00", "message": "first run"}]
+}
+
+
+def test_response_fingerprint_is_canonical():
+    fingerprint: str = response_fingerprint(SAMPLE_TRAPI_RESPONSE)
+
+    reordered: Dict = deepcopy(SAMPLE_TRAPI_RESPONSE)
+    reordered["message"]["results"].reverse()
+    reordered["message"]["knowledge_graph"]["nodes"] = dict(
+        reversed(list(reordered["message"]["knowledge_graph"]["nodes"].items()))
+    )
+    reordered["logs"] = [{"timestamp": "2024-05-02T00:00:00", "message": "second run"}]
+    assert response_fingerprint(reordered) == fingerprint
+
+    changed: Dict = deepcopy(SAMPLE_TRAPI_RESPONSE)
+    changed["message"]["results"].pop()
+    assert response_fingerprint(changed) != fingerprint
+
+
+def test_validation_key():
+    fingerprint: str = response_fingerprint(SAMPLE_TRAPI_RESPONSE)
+    key: str = validation_key(fingerprint, "StandardsValidationTest", "1.5.0", "4.2.0")
+    assert key == validation_key(fingerprint, "StandardsValidationTest", "1.5.0", "4.2.0")
+    assert key != validation_key(fingerprint, "StandardsValidationTest", "1.5.0", "4.2.1")
+    assert key != validation_key(fingerprint, "OneHopTest", "1.5.0", "4.2.0")
+    assert key != validation_key(fingerprint, "StandardsValidationTest", "1.5.0", "4.2.0", {"strict_validation": True})
+
+
+def test_validation_cache(tmp_path: Path):
+    path: str = str(tmp_path / "validation_cache.sqlite")
+    messages: Dict = {"warning": {"warning.knowledge_graph.empty": {}}}
+
+    cache = ValidationCache(path)
+    assert cache.get_hit_rate() is None
+    assert cache.get("some-key") is None
+    cache.put("some-key", messages)
+    assert cache.get("some-key") == messages
+    assert cache.hits == 1 and cache.misses == 1
+    assert cache.get_hit_rate() == 0.5
+    cache.close()
+
+    # the cache persists from one run to the next
+    cache = ValidationCache(path)
+    assert cache.get("some-key") == messages
+    cache.close()
+
+
+
+def test_validation_cache_batches(tmp_path: Path):
+    cache = ValidationCache(str(tmp_path / "validation_cache.sqlite"))
+    messages: Dict = {"warning": {"warning.knowledge_graph.empty": {}}}
+    cache.put_many([(f"key-{i}", messages) for i in range(0, 1200, 2)])
+    # lookups span several queries (see MAX_LOOKUP_BATCH)
+    cached: Dict = cache.get_many(f"key-{i}" for i in range(1200))
+    assert set(cached) == {f"key-{i}" for i in range(0, 1200, 2)}
+    assert cached["key-0"] == messages
+    assert cache.hits == 600 and cache.misses == 600
+    cache.put_many([])
+    cache.close()
+
+@pytest.mark.asyncio
+async def test_response_validations():
+    validations: ResponseValidations = ResponseValidations()
+    assert validations.get("some-key") is None
+
+    # the first claimant validates, the others await its validation
+    assert validations.claim("some-key") is None
+    pending = validations.claim("some-key")
+    assert isinstance(pending, asyncio.Future) and not pending.done()
+    messages: Dict = {"warning": {"warning.trapi.response.message.knowledge_graph.empty": None}}
+    validations.put("some-key", messages)
+    await pending
+
+    # reused messages are copies
+    reused: Dict = validations.get("some-key")
+    assert reused == messages
+    reused["warning"].clear()
+    assert validations.get("some-key") == messages
+    assert validations.get_statistics() == {"hits": 2, "misses": 1}
+
+    # a released claim lets the next claimant validate
+    assert validations.claim("other-key") is None
+    pending = validations.claim("other-key")
+    validations.release("other-key")
+    await pending
+    assert validations.claim("other-key") is None
+
+
+def test_bounded_response_validations():
+    validations: ResponseValidations = ResponseValidations(max_size=2)
+    messages: Dict = {"warning": {"warning.trapi.response.message.knowledge_graph.empty": None}}
+    validations.put("first-key", messages)
+    validations.put("second-key", messages)
+    assert validations.get("first-key") == messages
+
+    # the least recently used validation is evicted
+    validations.put("third-key", messages)
+    assert validations.get("second-key") is None
+    assert validations.get("first-key") == messages
+    assert validations.get("third-key") == messages
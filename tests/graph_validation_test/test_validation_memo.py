@@ -0,0 +1,58 @@
+"""
+Unit tests of the memoization of element checks repeated during the validation of a TRAPI Response
+"""
+from typing import Dict
+
+from reasoner_validator.report import TRAPIGraphType
+from reasoner_validator.validator import TRAPIResponseValidator
+
+from graph_validation_tests.utils.validation_memo import MemoizingValidator
+
+SOURCES = [
+    {"resource_id": "infores:molepro", "resource_role": "primary_knowledge_source"},
+    {"resource_id": "molepro", "resource_role": "aggregator_knowledge_source"}
+]
+
+ATTRIBUTES = [
+    {"attribute_type_id": "biolink:knowledge_level", "value": "knowledge_assertion"},
+    {"attribute_type_id": "not_a_curie", "value": "something"},
+    {"attribute_type_id": "biolink:agent_type", "value": "N/A"}
+]
+
+# many edges, with the same few 'sources' and 'attributes'
+SAMPLE_KNOWLEDGE_GRAPH: Dict = {
+    "nodes": {f"CHEBI:{i}": {"categories": ["biolink:SmallMolecule"]} for i in range(10)},
+    "edges": {
+        f"edge_{i}": {
+            "subject": f"CHEBI:{i}",
+            "predicate": "biolink:related_to",
+            "object": f"CHEBI:{(i + 1) % 10}",
+            "sources": SOURCES if i % 2 else SOURCES[:1],
+            "attributes": ATTRIBUTES
+        }
+        for i in range(10)
+    }
+}
+
+
+def _validate(validator: TRAPIResponseValidator) -> Dict:
+    validator.check_biolink_model_compliance(
+        graph=SAMPLE_KNOWLEDGE_GRAPH,
+        graph_type=TRAPIGraphType.Knowledge_Graph
+    )
+    return validator.get_all_messages()
+
+
+def test_memoizing_validator():
+    # Biolink Model validation is suppressed here, so as not to need the Biolink Model Toolkit
+    validator = MemoizingValidator(trapi_version="1.5.0", biolink_version="suppress")
+    messages: Dict = _validate(validator)
+    assert messages == _validate(TRAPIResponseValidator(trapi_version="1.5.0", biolink_version="suppress"))
+
+    # messages are reported for each edge, although only distinct shapes of elements were checked
+    for i in range(10):
+        assert f"CHEBI:{i}[biolink:SmallMolecule]--biolink:related_to->" in str(messages)
+    assert len(validator._validation_memo) <= 6
+
+    validator.reset_validation_memo()
+    assert not validator._validation_memo
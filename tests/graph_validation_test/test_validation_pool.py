@@ -0,0 +1,65 @@
+"""
+Unit tests of the process pool offloading TRAPI Response validation
+"""
+from typing import Any, Dict, List, Optional
+from concurrent.futures import Executor
+
+from reasoner_validator.validator import TRAPIResponseValidator
+
+import graph_validation_tests.utils.validation_pool as validation_pool
+from graph_validation_tests.utils.validation_memo import MemoizingValidator
+from graph_validation_tests.utils.validation_pool import (
+    get_validation_executor,
+    shutdown_validation_executor,
+    validate_in_worker
+)
+
+
+def test_validation_executor_follows_the_number_of_workers():
+    executor: Executor = get_validation_executor(max_workers=1)
+    assert get_validation_executor(max_workers=1) is executor
+
+    # a different number of worker processes is not silently ignored
+    resized: Executor = get_validation_executor(max_workers=2)
+    assert resized is not executor
+    assert validation_pool._validation_executor_workers == 2
+
+    shutdown_validation_executor()
+    assert validation_pool._validation_executor is None
+    assert get_validation_executor(max_workers=2) is not resized
+    shutdown_validation_executor()
+
+
+class ReportingTestCase:
+    validator_class = MemoizingValidator
+    validators: List[TRAPIResponseValidator] = list()
+
+    @staticmethod
+    def validate_trapi_response(
+            validator: TRAPIResponseValidator,
+            test_asset: Optional[Dict[str, Any]],
+            trapi_response: Optional[Dict[str, Any]]
+    ):
+        ReportingTestCase.validators.append(validator)
+        validator.report(code="warning.trapi.response.message.knowledge_graph.empty")
+
+
+def test_validate_in_worker_with_a_fresh_validator():
+    settings: Dict[str, Any] = {
+        "strict_validation": True,
+        "target_provenance": None,
+        "suppress_empty_data_warnings": False
+    }
+    for test in ("by_subject", "by_object"):
+        messages, lookups = validate_in_worker(
+            ReportingTestCase, test, "molepro", "1.5.0", None, None, {"message": {}}, settings
+        )
+        # no messages are left over from the previous TRAPI Response validated
+        assert list(messages["molepro"]) == [test]
+        assert "warning.trapi.response.message.knowledge_graph.empty" in messages["molepro"][test]["warning"]
+        assert lookups == (0, 0)
+
+    first, second = ReportingTestCase.validators
+    assert second is not first
+    assert second.strict_validation
+    assert second.bmt is first.bmt
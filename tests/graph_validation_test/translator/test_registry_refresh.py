@@ -0,0 +1,174 @@
+"""
+Unit tests of the (stale-while-revalidate) refresh of the Translator SmartAPI Registry Data
+"""
+from typing import Dict, List, Optional
+import threading
+import pytest
+
+import graph_validation_tests.translator.registry as registry
+from graph_validation_tests.translator.registry import (
+    get_the_registry_data,
+    refresh_the_registry_data,
+    set_registry_refresh_interval
+)
+from graph_validation_tests.translator.trapi import resolve_component_type
+
+
+class MockRegistryResponse:
+    def __init__(self, status_code: int, data: Optional[Dict] = None, etag: Optional[str] = None):
+        self.status_code: int = status_code
+        self.data: Optional[Dict] = data
+        self.headers: Dict[str, str] = {"ETag": etag} if etag else dict()
+
+    def json(self) -> Optional[Dict]:
+        return self.data
+
+
+class MockRegistry:
+    def __init__(self):
+        self.etag: str = '"v1"'
+        self.data: Dict = {"total": 1, "hits": [{"info": {"title": "v1"}}]}
+        self.requests: List[Dict[str, str]] = list()
+        # the Registry answers once 'available'
+        self.available = threading.Event()
+        self.available.set()
+        # HTTP status code of the Registry, when failing
+        self.failure: Optional[int] = None
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> MockRegistryResponse:
+        self.available.wait()
+        self.requests.append(headers or {})
+        if self.failure:
+            return MockRegistryResponse(self.failure)
+        if headers and headers.get("If-None-Match") == self.etag:
+            return MockRegistryResponse(304)
+        return MockRegistryResponse(200, self.data, self.etag)
+
+
+def test_registry_refresh(monkeypatch):
+    mock_registry = MockRegistry()
+    monkeypatch.setattr(registry.requests, "get", mock_registry.get)
+    monkeypatch.setattr(registry, "_the_registry", None)
+    monkeypatch.setattr(registry, "_registry_refresh_interval", None)
+
+    registry_data: Dict = get_the_registry_data()
+    assert registry_data["hits"][0]["info"]["title"] == "v1"
+    assert mock_registry.requests == [{}]
+
+    # an unmodified Registry costs a (cheap) conditional GET, keeping the Registry Data as is
+    refresh_the_registry_data()
+    assert mock_registry.requests[-1] == {"If-None-Match": '"v1"'}
+    assert get_the_registry_data() is registry_data
+
+    # a modified Registry is swapped in as a whole
+    mock_registry.etag = '"v2"'
+    mock_registry.data = {"total": 1, "hits": [{"info": {"title": "v2"}}]}
+    refresh_the_registry_data()
+    assert get_the_registry_data()["hits"][0]["info"]["title"] == "v2"
+
+
+def test_stale_registry_data_served_while_refreshed(monkeypatch):
+    mock_registry = MockRegistry()
+    monkeypatch.setattr(registry.requests, "get", mock_registry.get)
+    monkeypatch.setattr(registry, "_the_registry", None)
+    monkeypatch.setattr(registry, "_registry_refresh_interval", None)
+
+    registry_data: Dict = get_the_registry_data()
+    mock_registry.etag = '"v2"'
+    mock_registry.data = {"total": 1, "hits": [{"info": {"title": "v2"}}]}
+    mock_registry.available.clear()
+    set_registry_refresh_interval(0.0)
+
+    # the stale Registry Data is served, while refreshed in the background
+    assert get_the_registry_data() is registry_data
+    refresh_thread: threading.Thread = registry._registry_refresh_thread
+    assert get_the_registry_data() is registry_data
+    mock_registry.available.set()
+    refresh_thread.join()
+    assert get_the_registry_data()["hits"][0]["info"]["title"] == "v2"
+
+
+def sample_registry_data(component_type: str) -> Dict:
+    return {
+        "total": 1,
+        "hits": [{"info": {"x-translator": {"infores": "infores:molepro", "component": component_type}}}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_component_resolutions_cleared_on_registry_refresh(monkeypatch):
+    mock_registry = MockRegistry()
+    mock_registry.data = sample_registry_data("KP")
+    monkeypatch.setattr(registry.requests, "get", mock_registry.get)
+    monkeypatch.setattr(registry, "_the_registry", None)
+    monkeypatch.setattr(registry, "_registry_refresh_interval", None)
+    resolve_component_type.cache_clear()
+
+    assert await resolve_component_type("molepro") == "KP"
+
+    # the cached resolution is kept while the Registry is unmodified...
+    mock_registry.data = sample_registry_data("ARA")
+    refresh_the_registry_data()
+    assert await resolve_component_type("molepro") == "KP"
+
+    # ... but resolved again from the modified Registry
+    mock_registry.etag = '"v2"'
+    refresh_the_registry_data()
+    assert await resolve_component_type("molepro") == "ARA"
+
+
+def test_failed_registry_readings_keep_the_last_registry_data(monkeypatch):
+    mock_registry = MockRegistry()
+    mock_registry.failure = 503
+    monkeypatch.setattr(registry.requests, "get", mock_registry.get)
+    monkeypatch.setattr(registry, "_the_registry", None)
+    monkeypatch.setattr(registry, "_registry_refresh_interval", None)
+    notifications: List[bool] = list()
+    monkeypatch.setattr(registry, "_registry_data_listeners", [lambda: notifications.append(True)])
+
+    # a failed cold start stores nothing, hence is retried by the next caller
+    assert "Error" in get_the_registry_data()
+    assert registry._the_registry is None
+    assert not notifications
+    mock_registry.failure = None
+    registry_data: Dict = get_the_registry_data()
+    assert registry_data["hits"][0]["info"]["title"] == "v1"
+    assert len(mock_registry.requests) == 2
+    assert notifications == [True]
+
+    # failed readings never replace the last (valid) Registry Data
+    mock_registry.failure = 500
+    assert get_the_registry_data(refresh=True) is registry_data
+    refresh_the_registry_data()
+    assert get_the_registry_data() is registry_data
+    assert notifications == [True]
+
+
+def test_registry_data_listeners_only_notified_of_changed_content(monkeypatch):
+    mock_registry = MockRegistry()
+    mock_registry.data = sample_registry_data("KP")
+    monkeypatch.setattr(registry.requests, "get", mock_registry.get)
+    monkeypatch.setattr(registry, "_the_registry", None)
+    monkeypatch.setattr(registry, "_registry_refresh_interval", None)
+    notifications: List[bool] = list()
+    monkeypatch.setattr(registry, "_registry_data_listeners", [lambda: notifications.append(True)])
+
+    registry_data: Dict = get_the_registry_data()
+    assert notifications == [True]
+    # the service entries are indexed by InfoRes
+    assert registry.get_registry_services(registry_data, "molepro") == registry_data["hits"]
+    assert registry.get_component_type_from_registry(registry_data, "molepro") == "KP"
+
+    # a modified (ETag) Registry with the same content is swapped in, silently...
+    mock_registry.etag = '"v2"'
+    mock_registry.data = sample_registry_data("KP")
+    refresh_the_registry_data()
+    assert registry._the_registry.validators == {"ETag": '"v2"'}
+    assert notifications == [True]
+
+    # ... unlike a Registry with a different content
+    mock_registry.etag = '"v3"'
+    mock_registry.data = sample_registry_data("ARA")
+    refresh_the_registry_data()
+    assert notifications == [True, True]
+    assert registry.get_component_type_from_registry(get_the_registry_data(), "molepro") == "ARA"
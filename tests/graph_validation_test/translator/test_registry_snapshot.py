@@ -0,0 +1,124 @@
+"""
+Unit tests of the compact on-disk snapshot of the Translator SmartAPI Registry Data
+"""
+from typing import Dict, List, Optional
+from pathlib import Path
+import json
+import threading
+import time
+
+import graph_validation_tests.translator.registry as registry
+from graph_validation_tests.translator.registry import get_the_registry_data, set_registry_snapshot
+from graph_validation_tests.translator.registry.snapshot import (
+    load_registry_snapshot,
+    save_registry_snapshot
+)
+
+SAMPLE_REGISTRY_DATA: Dict = {
+    "total": 1,
+    "hits": [
+        {
+            "info": {
+                "title": "Sample KP",
+                "version": "1.2.3",
+                "description": "Not read when resolving endpoints",
+                "x-translator": {
+                    "infores": "infores:sample-kp",
+                    "component": "KP",
+                    "biolink-version": "4.1.6",
+                    "team": ["Sample Team"]
+                },
+                "x-trapi": {"version": "1.5.0", "test_data_location": "https://example.org/tests.json"}
+            },
+            "servers": [
+                {"url": "https://sample-kp.ci.example.org", "x-maturity": "staging", "description": "CI"},
+                {"url": "https://sample-kp.example.org", "x-maturity": "production"}
+            ],
+            "paths": {"/query": {"post": {}}},
+            "_meta": {"last_updated": "2024-05-01"}
+        }
+    ]
+}
+
+
+def test_registry_snapshot_round_trip(tmp_path: Path):
+    path: str = str(tmp_path / "registry_snapshot.json")
+    save_registry_snapshot(path, SAMPLE_REGISTRY_DATA, {"ETag": '"v1"'})
+    snapshot = load_registry_snapshot(path)
+    assert snapshot is not None
+    registry_data, validators, age = snapshot
+    assert validators == {"ETag": '"v1"'}
+    assert 0.0 <= age < 60.0
+    assert registry_data == {
+        "total": 1,
+        "hits": [
+            {
+                "info": {
+                    "title": "Sample KP",
+                    "version": "1.2.3",
+                    "x-translator": {
+                        "infores": "infores:sample-kp",
+                        "component": "KP",
+                        "biolink-version": "4.1.6"
+                    },
+                    "x-trapi": {"version": "1.5.0"}
+                },
+                "servers": [
+                    {"url": "https://sample-kp.ci.example.org", "x-maturity": "staging"},
+                    {"url": "https://sample-kp.example.org", "x-maturity": "production"}
+                ]
+            }
+        ]
+    }
+
+
+def test_unusable_registry_snapshot_ignored(tmp_path: Path):
+    path: Path = tmp_path / "registry_snapshot.json"
+    assert load_registry_snapshot(str(path)) is None
+    path.write_text("{not json")
+    assert load_registry_snapshot(str(path)) is None
+    save_registry_snapshot(str(path), SAMPLE_REGISTRY_DATA, dict())
+    snapshot: Dict = json.loads(path.read_text())
+    snapshot["created"] = time.time() - 7200.0
+    path.write_text(json.dumps(snapshot))
+    assert load_registry_snapshot(str(path), max_age=3600.0) is None
+    assert load_registry_snapshot(str(path), max_age=None) is not None
+
+
+class NotModifiedResponse:
+    status_code: int = 304
+    headers: Dict[str, str] = dict()
+
+
+def test_registry_data_read_from_snapshot(monkeypatch, tmp_path: Path):
+    path: str = str(tmp_path / "registry_snapshot.json")
+    save_registry_snapshot(path, SAMPLE_REGISTRY_DATA, {"ETag": '"v1"'})
+
+    registry_requests: List[Dict[str, str]] = list()
+    # the Registry answers once the snapshot is served
+    available = threading.Event()
+
+    def unmodified_registry(url: str, headers: Optional[Dict[str, str]] = None) -> NotModifiedResponse:
+        available.wait()
+        registry_requests.append(headers or {})
+        return NotModifiedResponse()
+
+    monkeypatch.setattr(registry.requests, "get", unmodified_registry)
+    monkeypatch.setattr(registry, "_the_registry", None)
+    monkeypatch.setattr(registry, "_registry_refresh_interval", None)
+    monkeypatch.setattr(registry, "_registry_snapshot_path", None)
+    set_registry_snapshot(path)
+
+    registry_data: Dict = get_the_registry_data()
+    assert registry_data["hits"][0]["info"]["x-translator"]["infores"] == "infores:sample-kp"
+    assert registry._the_registry.validators == {"ETag": '"v1"'}
+    assert registry.get_component_type_from_registry(registry_data, "sample-kp") == "KP"
+
+    # ... then revalidated once, in the background, by a conditional GET of the Registry
+    refresh_thread: threading.Thread = registry._registry_refresh_thread
+    assert refresh_thread is not None
+    available.set()
+    refresh_thread.join()
+    assert registry_requests == [{"If-None-Match": '"v1"'}]
+    assert get_the_registry_data() is registry_data
+    assert registry._registry_refresh_thread is None
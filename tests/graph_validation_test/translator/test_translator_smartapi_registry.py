@@ -17,6 +17,7 @@ from graph_validation_tests.translator.registry import (
     validate_testable_resource,
     live_trapi_endpoint,
     select_endpoint, get_component_endpoint_from_registry,
+    resolve_endpoints,
     # assess_trapi_version
 )
 
@@ -278,6 +279,23 @@ def test_select_endpoint(server_urls: Dict[str, List[str]], endpoint: Optional[T
     assert select_endpoint(server_urls) == endpoint
 
 
+@pytest.mark.parametrize(
+    "x_maturity,endpoints",
+    [
+        ("production", ["https://prod-1", "https://prod-2"]),
+        ("staging", ["https://staging"]),
+        ("development", [])
+    ]
+)
+def test_resolve_endpoints(x_maturity: str, endpoints: List[str]):
+    server_urls: List[Dict] = [
+        {"url": "https://prod-1", "x-maturity": "production"},
+        {"url": "https://staging", "x-maturity": "staging"},
+        {"url": "https://prod-2", "x-maturity": "production"}
+    ]
+    assert resolve_endpoints(server_urls, x_maturity=x_maturity, check_access=False) == endpoints
+
+
 # Current default major.minor TRAPI SemVer version"
 DEF_M_M_TRAPI = "1.5"
 
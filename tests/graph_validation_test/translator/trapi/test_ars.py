@@ -0,0 +1,219 @@
+"""
+Unit tests of ARS query processing, against a (mock transport) ARS stand-in
+"""
+from typing import Dict, List
+import asyncio
+import time
+import pytest
+import httpx
+
+from graph_validation_tests.translator.trapi.ars import (
+    ARSChildResult,
+    async_retrieve_ars_results,
+    lookup_ars_message,
+    poll_ars_children,
+    submit_ars_query
+)
+
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+ARS_URL = "https://ars.ci.transltr.io/ars/api/"
+
+SAMPLE_TRAPI_RESPONSE: Dict = {
+    "message": {
+        "query_graph": {"nodes": {}, "edges": {}},
+        "knowledge_graph": {"nodes": {}, "edges": {}},
+        "results": []
+    }
+}
+
+
+class ARSStandIn:
+    """
+    Stand-in of the ARS API, whose ARA actors complete their (child) queries after given delays.
+    """
+    def __init__(self, delays: Dict[str, float], errors: Dict[str, int]):
+        """
+        :param delays: Dict[str, float], time (seconds) taken by each ARA actor, indexed by agent name
+        :param errors: Dict[str, int], status code of any ARA actors failing, indexed by agent name
+        """
+        self.delays: Dict[str, float] = delays
+        self.errors: Dict[str, int] = errors
+        self.submitted: float = 0.0
+
+    def is_done(self, agent: str) -> bool:
+        return asyncio.get_running_loop().time() - self.submitted >= self.delays[agent]
+
+    def status(self, agent: str) -> str:
+        if not self.is_done(agent):
+            return "Running"
+        return "Error" if agent in self.errors else "Done"
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        path: str = request.url.path
+        if request.method == "POST" and path == "/ars/api/submit":
+            self.submitted = asyncio.get_running_loop().time()
+            return httpx.Response(201, json={"pk": "parent-pk"})
+        elif request.method == "GET" and path == "/ars/api/messages/parent-pk":
+            assert request.url.params.get("trace") == "y"
+            return httpx.Response(200, json={
+                "message": "parent-pk",
+                "status": "Done" if all(self.is_done(agent) for agent in self.delays) else "Running",
+                "children": [
+                    {
+                        "message": f"{agent}-pk",
+                        "status": self.status(agent),
+                        "actor": {"agent": agent, "inforesid": f"infores:{agent.replace('ara-', '')}"}
+                    }
+                    for agent in self.delays
+                ]
+            })
+        elif request.method == "GET" and path.startswith("/ars/api/messages/"):
+            agent: str = path[len("/ars/api/messages/"):-len("-pk")]
+            status: str = self.status(agent)
+            fields: Dict = {"status": status}
+            if status == "Done":
+                fields.update({"code": 200, "data": SAMPLE_TRAPI_RESPONSE})
+            elif status == "Error":
+                fields["code"] = self.errors[agent]
+            return httpx.Response(200, json={"pk": f"{agent}-pk", "fields": fields})
+        return httpx.Response(404)
+
+
+@pytest.mark.asyncio
+async def test_poll_ars_children():
+    ars = ARSStandIn(
+        delays={"ara-slow": 0.4, "ara-aragorn": 0.05, "ara-failing": 0.1},
+        errors={"ara-failing": 503}
+    )
+    async with httpx.AsyncClient(transport=httpx.MockTransport(ars.handle)) as client:
+        submission: Dict = await submit_ars_query(client, ARS_URL, {"message": {}})
+        assert submission == {'status_code': 200, 'pk': "parent-pk"}
+        results: List[ARSChildResult] = [
+            child async for child in poll_ars_children(
+                ARS_URL, submission['pk'], timeout=5.0, poll_interval=0.02, client=client
+            )
+        ]
+    # child results are yielded in order of completion
+    assert [child.agent for child in results] == ["ara-aragorn", "ara-failing", "ara-slow"]
+    assert results[0].infores == "infores:aragorn"
+    assert results[0].status_code == 200
+    assert results[0].trapi_response == SAMPLE_TRAPI_RESPONSE
+    assert results[1].status_code == 503
+    assert results[1].trapi_response is None
+
+
+@pytest.mark.asyncio
+async def test_poll_ars_children_timeout():
+    ars = ARSStandIn(delays={"ara-aragorn": 0.05, "ara-stuck": 10.0}, errors={})
+    async with httpx.AsyncClient(transport=httpx.MockTransport(ars.handle)) as client:
+        submission: Dict = await submit_ars_query(client, ARS_URL, {"message": {}})
+        results: Dict[str, int] = {
+            child.agent: child.status_code
+            async for child in poll_ars_children(
+                ARS_URL, submission['pk'], timeout=0.3, poll_interval=0.02, client=client
+            )
+        }
+    assert results == {"ara-aragorn": 200, "ara-stuck": 408}
+
+
+@pytest.mark.asyncio
+async def test_poll_ars_children_pending_when_cancelled():
+    ars = ARSStandIn(delays={"ara-aragorn": 0.05, "ara-stuck": 10.0}, errors={})
+    pending_children: Dict[str, Dict] = dict()
+    agents: List[str] = list()
+
+    async def poll(client: httpx.AsyncClient):
+        submission: Dict = await submit_ars_query(client, ARS_URL, {"message": {}})
+        children = poll_ars_children(
+            ARS_URL, submission['pk'], timeout=5.0, poll_interval=0.02,
+            client=client, pending_children=pending_children
+        )
+        try:
+            async for child in children:
+                agents.append(child.agent)
+        finally:
+            await children.aclose()
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(ars.handle)) as client:
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(poll(client), timeout=0.3)
+    # the children not yet done, when cancelled, are known to the caller
+    assert agents == ["ara-aragorn"]
+    assert list(pending_children) == ["ara-stuck-pk"]
+    assert pending_children["ara-stuck-pk"]["actor"]["agent"] == "ara-stuck"
+
+
+@pytest.mark.asyncio
+async def test_submit_ars_query_failure():
+    async with httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(503))) as client:
+        submission: Dict = await submit_ars_query(client, ARS_URL, {"message": {}})
+    assert submission == {'status_code': 503, 'pk': None}
+
+
+class ARSHostsStandIn:
+    """
+    Stand-in of a set of ARS hosts, each holding given ARS messages and responding after a given delay.
+    """
+    def __init__(self, hosts: Dict[str, float], messages: Dict[str, List[str]]):
+        """
+        :param hosts: Dict[str, float], response delay (seconds) of each ARS host, indexed by host name
+                      (other hosts respond immediately)
+        :param messages: Dict[str, List[str]], PKs of the ARS messages held by each ARS host, indexed by host name
+        """
+        self.hosts: Dict[str, float] = hosts
+        self.messages: Dict[str, List[str]] = messages
+        self.cancelled: List[str] = list()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        host: str = request.url.host
+        pk: str = request.url.path.split("/")[-1]
+        try:
+            await asyncio.sleep(self.hosts.get(host, 0.0))
+        except asyncio.CancelledError:
+            self.cancelled.append(host)
+            raise
+        if pk in self.messages.get(host, []):
+            return httpx.Response(200, json={"pk": pk, "fields": {"data": SAMPLE_TRAPI_RESPONSE}})
+        return httpx.Response(404)
+
+
+@pytest.mark.asyncio
+async def test_lookup_ars_message():
+    hosts = ARSHostsStandIn(
+        hosts={"ars-prod": 0.05, "ars.test": 0.1, "ars.ci": 5.0},
+        messages={"ars.test": ["some-pk"], "ars.ci": ["some-pk"]}
+    )
+    async with httpx.AsyncClient(transport=httpx.MockTransport(hosts.handle)) as client:
+        start: float = time.monotonic()
+        message: Dict = await lookup_ars_message("some-pk", hosts=list(hosts.hosts), client=client)
+        assert time.monotonic() - start < 1.0
+        await asyncio.sleep(0.05)
+    # the first host returning the message is accepted, in spite of any earlier 'not found'...
+    assert message["pk"] == "some-pk"
+    # ... and the lookups of slower hosts are cancelled
+    assert hosts.cancelled == ["ars.ci"]
+
+    # lookup of unknown messages fails, within the per-host timeout
+    async with httpx.AsyncClient(transport=httpx.MockTransport(hosts.handle)) as client:
+        start = time.monotonic()
+        assert await lookup_ars_message("unknown-pk", hosts=list(hosts.hosts), timeout=0.3, client=client) is None
+        assert time.monotonic() - start < 1.0
+
+
+@pytest.mark.asyncio
+async def test_async_retrieve_ars_results():
+    hosts = ARSHostsStandIn(
+        hosts={"ars-prod.transltr.io": 0.2, "ars.ci.transltr.io": 0.2},
+        messages={"ars-prod.transltr.io": ["pk-1", "pk-2"], "ars.ci.transltr.io": ["pk-3"]}
+    )
+    async with httpx.AsyncClient(transport=httpx.MockTransport(hosts.handle)) as client:
+        start: float = time.monotonic()
+        results: Dict = await async_retrieve_ars_results(["pk-1", "pk-2", "pk-3", "pk-4"], client=client)
+        # all lookups of the batch are concurrent, taking about one round-trip
+        assert time.monotonic() - start < 0.6
+    assert results["pk-1"] == SAMPLE_TRAPI_RESPONSE
+    assert results["pk-3"] == SAMPLE_TRAPI_RESPONSE
+    assert results["pk-4"] is None
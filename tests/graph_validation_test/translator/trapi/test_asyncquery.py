@@ -0,0 +1,166 @@
+"""
+Unit tests of asynchronous TRAPI queries, against a local TRAPI stand-in service
+"""
+from typing import Dict, Optional
+import asyncio
+import json
+import pytest
+import httpx
+
+from graph_validation_tests.translator.trapi.asyncquery import (
+    CallbackReceiver,
+    post_trapi_async_query,
+    read_http_request,
+    write_http_response
+)
+
+
+pytest_plugins = ('pytest_asyncio',)
+
+
+SAMPLE_TRAPI_RESPONSE: Dict = {
+    "message": {
+        "query_graph": {"nodes": {}, "edges": {}},
+        "knowledge_graph": {"nodes": {}, "edges": {}},
+        "results": []
+    }
+}
+
+
+class TRAPIStandIn:
+    """
+    Local stand-in of a TRAPI service implementing the /asyncquery endpoints,
+    which either POSTs its TRAPI Response back to the query callback url or
+    (if 'callback' is False) only reports it through /asyncquery_status.
+    """
+    def __init__(self, callback: bool, delay: float = 0.05):
+        self.callback: bool = callback
+        self.delay: float = delay
+        self.completed: bool = False
+        self.url: Optional[str] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks = set()
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, host="127.0.0.1", port=0)
+        self.url = f"http://127.0.0.1:{self._server.sockets[0].getsockname()[1]}"
+
+    async def stop(self):
+        for task in list(self._tasks):
+            task.cancel()
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _run_query(self, callback_url: str):
+        await asyncio.sleep(self.delay)
+        self.completed = True
+        if self.callback:
+            async with httpx.AsyncClient() as client:
+                await client.post(callback_url, json=SAMPLE_TRAPI_RESPONSE)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        method, path, headers, body = await read_http_request(reader)
+        if method == "POST" and path == "/asyncquery":
+            task = asyncio.ensure_future(self._run_query(json.loads(body)["callback"]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            await write_http_response(writer, 200, {"job_id": "job-1", "status": "Queued"})
+        elif method == "GET" and path == "/asyncquery_status/job-1":
+            await write_http_response(
+                writer,
+                200,
+                {"status": "Completed", "response_url": f"{self.url}/response/job-1"}
+                if self.completed else {"status": "Running"}
+            )
+        elif method == "GET" and path == "/response/job-1":
+            await write_http_response(writer, 200, SAMPLE_TRAPI_RESPONSE)
+        else:
+            await write_http_response(writer, 404)
+
+
+@pytest.mark.parametrize("callback", [True, False])
+@pytest.mark.asyncio
+async def test_post_trapi_async_query(callback: bool):
+    service = TRAPIStandIn(callback=callback)
+    await service.start()
+    receiver = CallbackReceiver(host="127.0.0.1")
+    await receiver.start()
+    try:
+        async with httpx.AsyncClient() as client:
+            result: Dict = await post_trapi_async_query(
+                client,
+                service.url,
+                trapi_request={"message": {"query_graph": {"nodes": {}, "edges": {}}}},
+                receiver=receiver,
+                timeout=5.0,
+                poll_interval=0.1
+            )
+        assert result['status_code'] == 200
+        assert result['response_json'] == SAMPLE_TRAPI_RESPONSE
+    finally:
+        await receiver.stop()
+        await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_callback_receiver_rejects_unknown_job():
+    receiver = CallbackReceiver(host="127.0.0.1")
+    await receiver.start()
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.post(receiver.get_callback_url("unknown-job"), json=SAMPLE_TRAPI_RESPONSE)
+            assert response.status_code == 404
+            response = await client.get(receiver.get_callback_url("unknown-job"))
+            assert response.status_code == 405
+    finally:
+        await receiver.stop()
+
+
+@pytest.mark.asyncio
+async def test_async_query_timeout():
+    service = TRAPIStandIn(callback=False, delay=10.0)
+    await service.start()
+    receiver = CallbackReceiver(host="127.0.0.1")
+    await receiver.start()
+    try:
+        async with httpx.AsyncClient() as client:
+            result: Dict = await post_trapi_async_query(
+                client,
+                service.url,
+                trapi_request={"message": {}},
+                receiver=receiver,
+                timeout=0.3,
+                poll_interval=0.1
+            )
+        assert result['status_code'] == 408
+        assert result['response_json'] is None
+    finally:
+        await receiver.stop()
+        await service.stop()
+
+
+def test_callback_receiver_listens_on_loopback_by_default():
+    assert CallbackReceiver().host == "127.0.0.1"
+    assert CallbackReceiver(callback_url="http://my-test-host.ncats.io:8765").host == "0.0.0.0"
+
+
+@pytest.mark.asyncio
+async def test_callback_receiver_rejects_large_or_slow_requests():
+    receiver = CallbackReceiver(max_size=16, read_timeout=0.2)
+    await receiver.start()
+    future: asyncio.Future = receiver.register("job-1")
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.post(receiver.get_callback_url("job-1"), json=SAMPLE_TRAPI_RESPONSE)
+            assert response.status_code == 413
+        assert not future.done()
+
+        # a request whose announced body never arrives is given up on
+        reader, writer = await asyncio.open_connection("127.0.0.1", receiver.port)
+        writer.write(b"POST /callback/job-1 HTTP/1.1\r\nContent-Length: 10\r\n\r\n")
+        await writer.drain()
+        assert b" 408 " in await asyncio.wait_for(reader.readline(), 5.0)
+        writer.close()
+        assert not future.done()
+    finally:
+        await receiver.stop()
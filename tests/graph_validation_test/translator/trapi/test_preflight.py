@@ -0,0 +1,53 @@
+"""
+Unit tests of the pre-flight stage of a run of tests
+"""
+from typing import Dict, List, Tuple
+import pytest
+
+import graph_validation_tests.translator.trapi.preflight as preflight
+from graph_validation_tests.translator.trapi.preflight import ComponentResolution, preflight_components
+
+
+pytest_plugins = ('pytest_asyncio',)
+
+SAMPLE_ENDPOINTS: Dict[str, Tuple[str, ...]] = {
+    "molepro": ("https://molepro.ci.transltr.io", "https://molepro-backup.ci.transltr.io"),
+    "arax": ("https://arax.ci.transltr.io", "https://molepro.ci.transltr.io"),
+    "unknown": ()
+}
+
+
+@pytest.mark.asyncio
+async def test_preflight_components(monkeypatch):
+    registry_reads: List[bool] = list()
+    warmed_up: List[str] = list()
+
+    async def mock_warm_up_endpoint(endpoint: str) -> bool:
+        warmed_up.append(endpoint)
+        return True
+
+    async def mock_resolve_component_endpoints(component: str, **kwargs) -> Tuple[str, ...]:
+        return SAMPLE_ENDPOINTS[component]
+
+    monkeypatch.setattr(preflight, "get_the_registry_data", lambda: registry_reads.append(True))
+    monkeypatch.setattr(
+        preflight,
+        "resolve_component_endpoints",
+        mock_resolve_component_endpoints
+    )
+    monkeypatch.setattr(preflight, "warm_up_endpoint", mock_warm_up_endpoint)
+
+    resolutions: Dict[str, ComponentResolution] = await preflight_components(
+        components=["molepro", "arax", "molepro", "unknown"],
+        environment="ci",
+        target_trapi_version="1.5.0",
+        target_biolink_version="4.2.0"
+    )
+    assert registry_reads == [True]
+    assert list(resolutions) == ["molepro", "arax", "unknown"]
+    assert resolutions["molepro"].endpoints == SAMPLE_ENDPOINTS["molepro"]
+    assert not resolutions["unknown"].endpoints
+    assert all(resolution.elapsed >= 0.0 for resolution in resolutions.values())
+
+    # each distinct endpoint is warmed up once
+    assert sorted(warmed_up) == sorted(set(SAMPLE_ENDPOINTS["molepro"] + SAMPLE_ENDPOINTS["arax"]))
@@ -1,12 +1,18 @@
 """
 Unit tests of the low level TRAPI (ARS, KP & ARA) calling subsystem.
 """
-from typing import Optional
+from typing import Optional, Dict, List, Tuple
+import asyncio
+import time
 import pytest
 
+import graph_validation_tests.translator.trapi as trapi
 from graph_validation_tests.translator.trapi import (
     get_component_infores_object_id,
-    resolve_component_endpoint
+    resolve_component_endpoint,
+    resolve_component_endpoints,
+    get_endpoint_limiter,
+    post_trapi_query_with_failover
 )
 from tests import FULL_TEST
 
@@ -52,13 +58,14 @@ def test_get_get_component_infores_object_id(component: str, infores: str):
         ("arax", "non-environment", None),
     ]
 )
-def test_resolve_component_endpoint(
+@pytest.mark.asyncio
+async def test_resolve_component_endpoint(
         component: Optional[str],
         environment: Optional[str],
         result: Optional[str]
 ):
     endpoint: Optional[str] = \
-        resolve_component_endpoint(
+        await resolve_component_endpoint(
             component=component,
             environment=environment,
             target_trapi_version=None,
@@ -67,6 +74,138 @@ def test_resolve_component_endpoint(
     assert endpoint == result
 
 
+@pytest.mark.asyncio
+async def test_resolve_component_endpoints_does_not_block_the_event_loop(monkeypatch):
+    resolutions: List[str] = list()
+
+    def mock_get_component_endpoints_from_registry(component: str, *args) -> List[str]:
+        # blocking Registry read and liveness probes
+        resolutions.append(component)
+        time.sleep(0.2)
+        return [f"https://{component}.ci.transltr.io"]
+
+    monkeypatch.setattr(trapi, "_get_component_endpoints_from_registry", mock_get_component_endpoints_from_registry)
+    resolve_component_endpoints.cache_clear()
+
+    ticks: List[float] = list()
+
+    async def heartbeat():
+        for _ in range(10):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    endpoints = await asyncio.gather(
+        *[resolve_component_endpoints("molepro", "ci", None, None) for _ in range(3)],
+        heartbeat()
+    )
+    assert endpoints[:3] == [("https://molepro.ci.transltr.io",)] * 3
+    # concurrent resolutions of a component share a single resolution...
+    assert resolutions == ["molepro"]
+    # ... during which the event loop kept running
+    assert len(ticks) == 10 and ticks[-1] - ticks[0] < 0.2
+    resolve_component_endpoints.cache_clear()
+
+
+def mock_post_trapi_query(servers: Dict[str, Tuple[int, float]], queried: List[str]):
+    """
+    :param servers: Dict[str, Tuple[int, float]], HTTP status code and latency (seconds) of each mock server
+    :param queried: List[str], urls of mock servers queried, in order of querying
+    """
+    async def post_trapi_query(url: str, trapi_request: Dict) -> Dict:
+        queried.append(url)
+        status_code, latency = servers[url]
+        await asyncio.sleep(latency)
+        return {
+            'status_code': status_code,
+            'response_json': {"message": {}, "server": url} if status_code == 200 else None,
+            'retry_after': None
+        }
+    return post_trapi_query
+
+
+@pytest.mark.parametrize(
+    "servers,endpoint,queried",
+    [
+        (   # primary server answers
+            {"https://primary": (200, 0.0), "https://backup": (200, 0.0)},
+            "https://primary",
+            ["https://primary"]
+        ),
+        (   # overloaded primary server fails over to the backup
+            {"https://primary": (503, 0.0), "https://backup": (200, 0.0)},
+            "https://backup",
+            ["https://primary", "https://backup"]
+        ),
+        (   # ... as does a query timing out
+            {"https://primary": (408, 0.0), "https://backup": (200, 0.0)},
+            "https://backup",
+            ["https://primary", "https://backup"]
+        ),
+        (   # but a bad query isn't failed over (to a functionally identical server)
+            {"https://primary": (400, 0.0), "https://backup": (200, 0.0)},
+            "https://primary",
+            ["https://primary"]
+        )
+    ]
+)
+@pytest.mark.asyncio
+async def test_post_trapi_query_with_failover(
+        monkeypatch,
+        servers: Dict[str, Tuple[int, float]],
+        endpoint: str,
+        queried: List[str]
+):
+    servers_queried: List[str] = list()
+    monkeypatch.setattr(trapi, "post_trapi_query", mock_post_trapi_query(servers, servers_queried))
+    response: Dict = await post_trapi_query_with_failover(
+        tuple(servers.keys()),
+        trapi_request={"message": {}},
+        endpoint_selection="registry"
+    )
+    assert response['endpoint'] == endpoint
+    assert servers_queried == queried
+
+
+@pytest.mark.asyncio
+async def test_hedged_post_trapi_query(monkeypatch):
+    servers: Dict[str, Tuple[int, float]] = {"https://slow-primary": (200, 1.0), "https://fast-backup": (200, 0.0)}
+    servers_queried: List[str] = list()
+    monkeypatch.setattr(trapi, "post_trapi_query", mock_post_trapi_query(servers, servers_queried))
+
+    # record a history of fast queries of the primary server
+    for _ in range(trapi.MINIMUM_HEDGING_SAMPLES):
+        get_endpoint_limiter("https://slow-primary").latency.add(0.01)
+
+    response: Dict = await post_trapi_query_with_failover(
+        tuple(servers.keys()),
+        trapi_request={"message": {}},
+        hedge_percentile=95,
+        endpoint_selection="registry"
+    )
+    assert response['endpoint'] == "https://fast-backup"
+    assert servers_queried == ["https://slow-primary", "https://fast-backup"]
+
+    # the slow query of the primary was cancelled
+    assert get_endpoint_limiter("https://slow-primary").in_flight == 0
+
+
+def test_endpoint_limiters_scoped_to_the_event_loop():
+
+    async def saturated_limiter():
+        limiter = get_endpoint_limiter("https://some-kp")
+        assert get_endpoint_limiter("https://some-kp") is limiter
+        for _ in range(limiter.get_limit()):
+            await asyncio.wait_for(limiter.acquire(), timeout=1.0)
+        # a query left waiting when the event loop is closed
+        asyncio.get_running_loop().create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        return limiter
+
+    first = asyncio.run(saturated_limiter())
+    second = asyncio.run(saturated_limiter())
+    assert second is not first
+
+
 # @pytest.mark.asyncio
 # async def test_execute_trapi_lookup():
 #     url: str = TRAPI_TEST_ENDPOINT
@@ -92,3 +231,15 @@ def test_resolve_component_endpoint(
 #         # biolink_version=None
 #     )
 #     assert report
+
+
+def test_retrieve_ars_result_reports_through_the_logger(monkeypatch, caplog, capsys):
+
+    def unavailable_ars(url: str, headers: Optional[Dict] = None):
+        raise ConnectionError("ARS unavailable")
+
+    monkeypatch.setattr(trapi.requests, "get", unavailable_ars)
+    with caplog.at_level("INFO"):
+        assert trapi.retrieve_ars_result("some-pk", verbose=True) is None
+    assert "Unsuccessful HTTP status code '404' reported for ARS PK 'some-pk'?" in caplog.text
+    assert not capsys.readouterr().out
@@ -2,7 +2,10 @@
 Unit tests for Standards Validation Test code validation
 """
 import os
+import io
 import json
+import shutil
+from copy import deepcopy
 from sys import stderr
 from typing import List, Dict
 from json import dump
@@ -10,6 +13,10 @@ import pytest
 
 from translator_testing_model.datamodel.pydanticmodel import TestAsset
 
+from graph_validation_tests import TestCaseRun
+import graph_validation_tests.bulk_validation as bulk_validation
+from graph_validation_tests.bulk_validation import run_bulk_validation
+from graph_validation_tests.utils.validation_pool import shutdown_validation_executor
 from graph_validation_tests.utils.unit_test_templates import (
     by_subject,
     by_object
@@ -75,8 +82,8 @@ async def test_standards_validation_test(
     dump(results, stderr, indent=4)
 
 
-# ARS tests not yet supported so yes... results will
-# always be empty, with a logger message to inform why
+# ARS test runs fan out into test results
+# for each ARA responding to the ARS query
 @pytest.mark.skipif(
     not FULL_TEST,
     reason="This test is a long running TRAPI query on active resources. Best not to run on CI!"
@@ -92,7 +99,8 @@ async def test_standards_validation_test_on_ars():
         trapi_generators=trapi_generators,
         environment="prod"
     )
-    assert not results
+    assert "ars" in results["pks"]
+    assert results["results"]
 
 
 @pytest.mark.parametrize(
@@ -173,3 +181,62 @@ def test_standards_validation_tests_validate_test_case(
         results: Dict = svt.test_case_processor(trapi_response=trapi_response)
         assert results
         dump(results, stderr, indent=4)
+
+
+@pytest.mark.asyncio
+async def test_standards_validation_test_case_validated_in_executor():
+    test_file = os.path.join(TEST_DATA_DIR, "standards_validation_test_response.json")
+    with open(test_file, mode="r") as trapi_json_file:
+        trapi_response: Dict = json.load(trapi_json_file)
+    svt = StandardsValidationTest(
+        test_asset=TestAsset(**SAMPLE_MOLEPRO_TEST_ASSET),
+        environment="ci",
+        component="molepro",
+        validation_workers=2
+    )
+    in_process: TestCaseRun = svt.test_case_wrapper(trapi_response=deepcopy(trapi_response))
+    in_process.validate_test_case()
+
+    # the offloaded test case is run apart, so as not to reuse the validation of the in process test case
+    offloaded_svt = StandardsValidationTest(
+        test_asset=TestAsset(**SAMPLE_MOLEPRO_TEST_ASSET),
+        environment="ci",
+        component="molepro",
+        validation_workers=2
+    )
+    offloaded: TestCaseRun = offloaded_svt.test_case_wrapper(trapi_response=deepcopy(trapi_response))
+    await offloaded.validate_test_case_in_executor(offloaded_svt.get_validation_executor())
+    shutdown_validation_executor()
+
+    # same messages, merged back into the TestCaseRun
+    assert offloaded.get_all_messages() == in_process.get_all_messages()
+
+
+def test_bulk_validation_of_stored_responses(tmp_path):
+    source_file = os.path.join(TEST_DATA_DIR, "standards_validation_test_response.json")
+    for night in range(3):
+        shutil.copy(source_file, tmp_path / f"response-{night}.json")
+    (tmp_path / "not-a-response.json").write_text('{"some": "thing"}')
+
+    sink = io.StringIO()
+    count: int = run_bulk_validation(
+        test_run_class=StandardsValidationTest,
+        source=str(tmp_path),
+        sink=sink,
+        component="molepro",
+        workers=2
+    )
+    assert count == 4
+    outcomes: Dict[str, Dict] = {
+        outcome["source"]: outcome for outcome in map(json.loads, sink.getvalue().splitlines())
+    }
+    assert len(outcomes) == 4
+    assert "error" in outcomes["not-a-response.json"]
+    assert outcomes["response-0.json"]["results"]
+    assert outcomes["response-0.json"]["results"] == outcomes["response-2.json"]["results"]
+
+
+def test_bulk_validation_worker_response_validations_bounded():
+    bulk_validation._init_worker(StandardsValidationTest, {"test_asset": TestAsset(**SAMPLE_MOLEPRO_TEST_ASSET)})
+    assert bulk_validation._worker_test_run.response_validations.max_size == \
+        bulk_validation.WORKER_RESPONSE_VALIDATIONS